@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Rebuild the compiled Qt resource bundle for NetViewer
+
+Rasterizes every SVG in src/netviewer/icons at the icon sizes used by the
+application (plus 2x variants for high-DPI screens), writes resources.qrc and
+compiles it with pyside6-rcc into src/netviewer/resources_rc.py.
+
+Run this after adding or changing an icon:
+
+    python build_resources.py
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QGuiApplication, QImage, QPainter
+from PySide6.QtSvg import QSvgRenderer
+
+PACKAGE_DIR = Path(__file__).parent / "src" / "netviewer"
+ICON_DIR = PACKAGE_DIR / "icons"
+RASTER_DIR = ICON_DIR / "png"
+QRC_FILE = PACKAGE_DIR / "resources.qrc"
+OUTPUT_FILE = PACKAGE_DIR / "resources_rc.py"
+
+# Keep in sync with ICON_SIZE and SMALL_ICON_SIZE in netviewer/icons.py
+SIZES = (16, 24)
+SCALES = (1, 2)
+
+
+def rasterize(svg_path, size):
+    """Render an SVG into a square, transparent PNG of the given size"""
+    renderer = QSvgRenderer(str(svg_path))
+    if not renderer.isValid():
+        raise ValueError(f"Invalid SVG: {svg_path}")
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    renderer.render(painter, QRectF(0, 0, size, size))
+    painter.end()
+    return image
+
+
+def main():
+    """Rasterize icons, write the .qrc file and compile it"""
+    app = QGuiApplication.instance() or QGuiApplication(
+        sys.argv + ["-platform", "offscreen"]
+    )
+    RASTER_DIR.mkdir(exist_ok=True)
+
+    entries = []
+    for svg_path in sorted(ICON_DIR.glob("*.svg")):
+        for size in SIZES:
+            for scale in SCALES:
+                suffix = "" if scale == 1 else f"@{scale}x"
+                png_path = RASTER_DIR / f"{svg_path.stem}-{size}{suffix}.png"
+                if not rasterize(svg_path, size * scale).save(str(png_path)):
+                    raise OSError(f"Could not write {png_path}")
+                entries.append(png_path.relative_to(PACKAGE_DIR).as_posix())
+
+    files = "\n".join(
+        f'        <file alias="{Path(entry).name}">{entry}</file>'
+        for entry in entries
+    )
+    QRC_FILE.write_text(
+        "<!DOCTYPE RCC>\n"
+        '<RCC version="1.0">\n'
+        '    <qresource prefix="/icons">\n'
+        f"{files}\n"
+        "    </qresource>\n"
+        "</RCC>\n"
+    )
+
+    subprocess.run(
+        ["pyside6-rcc", "--no-compress", str(QRC_FILE), "-o", str(OUTPUT_FILE)],
+        check=True,
+    )
+    print(f"Wrote {len(entries)} icons to {OUTPUT_FILE}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
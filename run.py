@@ -17,10 +17,12 @@ except ImportError:
     print("Starting NetViewer application...", flush=True)
 
 try:
-    from netviewer.app import main
-    main()
+    from netviewer.__main__ import cli
+    exit_code = cli()
 except Exception as e:
     print(f"ERROR: {e}", flush=True)
     import traceback
     traceback.print_exc()
-    sys.exit(1) 
\ No newline at end of file
+    sys.exit(1)
+
+sys.exit(exit_code) 
\ No newline at end of file
@@ -6,6 +6,7 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "PySide6>=6.0.0",
+        "numpy>=1.20.0",
     ],
     python_requires=">=3.8",
     use_scm_version=True,
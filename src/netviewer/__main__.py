@@ -1,7 +1,169 @@
 """
 Entry point for running NetViewer directly as a module
+
+With no command the GUI is started; ``--profile`` starts it with the
+profiler running (see netviewer.profiler). The ``export-ssl`` command runs
+certificate lookups headless and streams the results to a file:
+
+    python -m netviewer export-ssl example.com example.org -o certs.csv
+    python -m netviewer export-ssl -i domains.txt -o certs.ndjson
+
+The ``analyze-certs`` command checks local certificate datasets (PEM bundles,
+DER files or NDJSON such as CT log extracts) without any network access:
+
+    python -m netviewer analyze-certs bundle.pem ct.ndjson -o findings.csv
+
+The ``serve`` command exposes the lookups as a local HTTP/JSON API (see
+netviewer.server):
+
+    python -m netviewer serve --port 8765
 """
-from netviewer.app import main
+import argparse
+import sys
+
+
+def read_domains(args):
+    """Yield domains from the command line and any input file"""
+    yield from args.domains
+    if args.input:
+        with (sys.stdin if args.input == "-" else open(args.input)) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+
+
+def export_ssl(args):
+    """Look up SSL certificates and export the results"""
+    from netviewer.export import ExportError, export_rows
+    from netviewer.tools.ssl_lookup import iter_certificate_rows
+
+    try:
+        count = export_rows(
+            iter_certificate_rows(read_domains(args)),
+            args.output,
+            fmt=args.format,
+        )
+    except (ExportError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    print(f"Exported {count} results to {args.output}")
+    return 0
+
+
+def analyze_certs(args):
+    """Analyze local certificate datasets and export the results"""
+    from netviewer.export import ExportError, export_rows
+    from netviewer.tools.cert_dataset import analyze_files
+
+    try:
+        count = export_rows(
+            analyze_files(
+                args.files, expiry_days=args.days, only_issues=args.only_issues
+            ),
+            args.output,
+            fmt=args.format,
+        )
+    except (ExportError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    print(f"Exported {count} results to {args.output}")
+    return 0
+
+
+def serve(args):
+    """Run the local HTTP/JSON API server"""
+    from netviewer.server import serve
+
+    serve(
+        args.host, args.port,
+        cache_ttl=args.cache_ttl, workers=args.workers,
+    )
+    return 0
+
+
+def build_parser():
+    """Build the command line parser"""
+    from netviewer.export import FORMATS
+
+    parser = argparse.ArgumentParser(prog="netviewer")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Profile the GUI from startup (also available from the Tools menu)",
+    )
+    parser.add_argument(
+        "--profile-dir", metavar="DIR",
+        help="Directory for profiler output (default: netviewer-profile-<time>)",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    export = commands.add_parser(
+        "export-ssl", help="Look up SSL certificates and export the results"
+    )
+    export.add_argument("domains", nargs="*", help="Domains to look up")
+    export.add_argument(
+        "-i", "--input", help="File with one domain per line ('-' for stdin)"
+    )
+    export.add_argument("-o", "--output", required=True, help="Output file")
+    export.add_argument(
+        "-f", "--format", choices=sorted(FORMATS),
+        help="Output format (default: from the output file extension)",
+    )
+    export.set_defaults(func=export_ssl)
+
+    analyze = commands.add_parser(
+        "analyze-certs", help="Analyze local certificate datasets offline"
+    )
+    analyze.add_argument("files", nargs="+", help="PEM, DER or NDJSON files")
+    analyze.add_argument("-o", "--output", required=True, help="Output file")
+    analyze.add_argument(
+        "-f", "--format", choices=sorted(FORMATS),
+        help="Output format (default: from the output file extension)",
+    )
+    analyze.add_argument(
+        "--days", type=int, default=30,
+        help="Report certificates expiring within this many days (default: 30)",
+    )
+    analyze.add_argument(
+        "--only-issues", action="store_true",
+        help="Only export certificates with findings",
+    )
+    analyze.set_defaults(func=analyze_certs)
+
+    from netviewer.server import DEFAULT_CACHE_TTL, DEFAULT_HOST, DEFAULT_PORT
+    from netviewer.server import DEFAULT_WORKERS
+
+    server = commands.add_parser(
+        "serve", help="Serve certificate, DNS and IP lookups as a JSON API"
+    )
+    server.add_argument(
+        "--host", default=DEFAULT_HOST,
+        help=f"Address to listen on (default: {DEFAULT_HOST})",
+    )
+    server.add_argument(
+        "--port", type=int, default=DEFAULT_PORT,
+        help=f"Port to listen on (default: {DEFAULT_PORT})",
+    )
+    server.add_argument(
+        "--cache-ttl", type=float, default=DEFAULT_CACHE_TTL,
+        help=f"Seconds to cache results (default: {DEFAULT_CACHE_TTL:g})",
+    )
+    server.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"Threads for running lookups (default: {DEFAULT_WORKERS})",
+    )
+    server.set_defaults(func=serve)
+    return parser
+
+
+def cli(argv=None):
+    """Run a headless command, or the GUI if none is given"""
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        from netviewer.app import main
+        return main(profile=args.profile, profile_dir=args.profile_dir)
+    return args.func(args)
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(cli())
@@ -11,10 +11,18 @@ from PySide6.QtWidgets import (
     QLabel,
     QFrame,
 )
-from PySide6.QtGui import QFont, QIcon
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QFont, QIcon, QAction, QKeySequence
+from PySide6.QtCore import Qt
 
-from .icons import create_dns_icon, create_ssl_icon, create_ip_icon
+from .icons import (
+    ICON_SIZE,
+    create_dns_icon,
+    create_ssl_icon,
+    create_ip_icon,
+    create_graph_icon,
+)
+from .graph_view import GraphWidget
+from .profiler import Profiler, traced
 from .tools.ssl_cert import SSLCertWidget
 
 
@@ -26,7 +34,7 @@ class ToolButton(QPushButton):
         self.setFont(QFont("Segoe UI", 10))
         if icon:
             self.setIcon(icon)
-            self.setIconSize(QSize(24, 24))
+            self.setIconSize(ICON_SIZE)
         self.setStyleSheet("""
             QPushButton {
                 text-align: left;
@@ -48,11 +56,20 @@ class ToolButton(QPushButton):
 
 class MainWindow(QMainWindow):
     """Main window of the NetViewer application"""
-    def __init__(self):
+    def __init__(self, profile_dir=None):
         super().__init__()
         self.setWindowTitle("NetViewer")
         self.setMinimumSize(1024, 768)
         
+        # Profiler, toggled from the Tools menu or the --profile flag
+        self.profiler = Profiler(profile_dir, parent=self)
+        self.profile_action = QAction("Profiling", self)
+        self.profile_action.setCheckable(True)
+        self.profile_action.setShortcut(QKeySequence("Ctrl+Shift+P"))
+        self.profile_action.toggled.connect(self.toggle_profiling)
+        tools_menu = self.menuBar().addMenu("Tools")
+        tools_menu.addAction(self.profile_action)
+        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -83,11 +100,13 @@ class MainWindow(QMainWindow):
         self.dns_button = ToolButton("DNS Information", create_dns_icon())
         self.ssl_button = ToolButton("SSL Certificate", create_ssl_icon())
         self.ip_button = ToolButton("IP Address Info", create_ip_icon())
+        self.graph_button = ToolButton("Network Graph", create_graph_icon())
         
         # Add buttons to sidebar
         sidebar_layout.addWidget(self.dns_button)
         sidebar_layout.addWidget(self.ssl_button)
         sidebar_layout.addWidget(self.ip_button)
+        sidebar_layout.addWidget(self.graph_button)
         sidebar_layout.addStretch()
         
         # Create stacked widget for different tools
@@ -102,11 +121,16 @@ class MainWindow(QMainWindow):
         self.dns_page = QWidget()
         self.ssl_page = SSLCertWidget()
         self.ip_page = QWidget()
+        self.graph_page = GraphWidget()
+        
+        # Map lookup results onto the graph as they arrive
+        self.graph_page.watch_model(self.ssl_page.results_model)
         
         # Add pages to stack
         self.content_stack.addWidget(self.dns_page)
         self.content_stack.addWidget(self.ssl_page)
         self.content_stack.addWidget(self.ip_page)
+        self.content_stack.addWidget(self.graph_page)
         
         # Add widgets to main layout
         main_layout.addWidget(sidebar)
@@ -116,18 +140,42 @@ class MainWindow(QMainWindow):
         self.dns_button.clicked.connect(lambda: self.switch_tool(0))
         self.ssl_button.clicked.connect(lambda: self.switch_tool(1))
         self.ip_button.clicked.connect(lambda: self.switch_tool(2))
+        self.graph_button.clicked.connect(lambda: self.switch_tool(3))
         
         # Set initial tool
         self.current_tool = 0
         self.switch_tool(0)
         
+    def toggle_profiling(self, enabled):
+        """Start or stop the profiler"""
+        if enabled and not self.profiler.is_active:
+            self.profiler.start()
+            self.statusBar().showMessage("Profiling...")
+        elif not enabled and self.profiler.is_active:
+            try:
+                output_dir = self.profiler.stop()
+            except OSError as e:
+                self.statusBar().showMessage(f"Could not write profile: {e}")
+            else:
+                self.statusBar().showMessage(f"Profile written to {output_dir}")
+            
+    def closeEvent(self, event):
+        """Write any running profile and stop worker threads before closing"""
+        self.profile_action.setChecked(False)
+        self.ssl_page.shutdown()
+        self.graph_page.shutdown()
+        super().closeEvent(event)
+        
+    @traced("app.switch_tool")
     def switch_tool(self, index):
         """Switch to the selected tool"""
         self.current_tool = index
         self.content_stack.setCurrentIndex(index)
         
         # Update button styles to show current selection
-        buttons = [self.dns_button, self.ssl_button, self.ip_button]
+        buttons = [
+            self.dns_button, self.ssl_button, self.ip_button, self.graph_button
+        ]
         for i, button in enumerate(buttons):
             if i == index:
                 button.setStyleSheet("""
@@ -167,8 +215,13 @@ class MainWindow(QMainWindow):
                 """)
 
 
-def main():
-    """Main entry point for the application"""
+def main(profile=False, profile_dir=None):
+    """Main entry point for the application
+    
+    Args:
+        profile: Start the profiler immediately
+        profile_dir: Directory for profiler output
+    """
     from PySide6.QtWidgets import QApplication
     import sys
     
@@ -178,7 +231,9 @@ def main():
     app.setStyle("Fusion")
     
     # Create and show main window
-    window = MainWindow()
+    window = MainWindow(profile_dir)
     window.show()
+    if profile:
+        window.profile_action.setChecked(True)
     
     sys.exit(app.exec()) 
\ No newline at end of file
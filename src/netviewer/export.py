@@ -0,0 +1,256 @@
+"""
+Streaming export of tool results to CSV, NDJSON and Parquet
+
+Results are consumed from any iterable of row dictionaries and written in
+fixed-size chunks, so memory use stays constant regardless of how many rows
+are exported. Output goes to a temporary file that only replaces the target
+once the export has finished, so a failed export never leaves a truncated
+file behind. Nothing here depends on Qt, which keeps the exporters usable
+from the command line as well as from the GUI.
+"""
+from abc import ABC, abstractmethod
+import csv
+import json
+import os
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+# Number of rows buffered before each write
+DEFAULT_CHUNK_SIZE = 5000
+
+# Export formats keyed by name, with the file extensions that select them
+FORMATS = {
+    "csv": (".csv",),
+    "ndjson": (".ndjson", ".jsonl"),
+    "parquet": (".parquet", ".pq"),
+}
+
+# Parquet column types for the SSL certificate result columns; any other
+# columns have their type inferred from the first chunk
+PARQUET_TYPES = {
+    "domain": "string",
+    "addresses": "string",
+    "subject": "string",
+    "issuer": "string",
+    "not_before": "string",
+    "not_after": "string",
+    "days_until_expiry": "int64",
+    "version": "string",
+    # Serial numbers are up to 160 bits and don't fit any integer type
+    "serial_number": "string",
+    "issues": "string",
+    "error": "string",
+    "error_type": "string",
+}
+
+
+class ExportError(Exception):
+    """Raised when results cannot be exported"""
+
+
+def _json_default(value):
+    """Serialize values the json module doesn't handle natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_chunks(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Split an iterable of rows into lists of at most chunk_size rows"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def format_from_path(path):
+    """Guess the export format from a file extension"""
+    suffix = Path(path).suffix.lower()
+    for name, extensions in FORMATS.items():
+        if suffix in extensions:
+            return name
+    raise ExportError(f"Cannot determine export format for: {path}")
+
+
+class ResultWriter(ABC):
+    """Base class for chunked result writers
+
+    Writers write to temp_path; leaving the context moves it to path, or
+    removes it if the export failed.
+    """
+
+    def __init__(self, path, columns):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(self.path.name + ".part")
+        self.columns = list(columns)
+        self.rows_written = 0
+
+    @abstractmethod
+    def write_chunk(self, rows):
+        """Write a list of row dictionaries"""
+
+    def close(self):
+        """Flush and close the output"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.close()
+        except BaseException:
+            self.temp_path.unlink(missing_ok=True)
+            raise
+        if exc_type is None:
+            os.replace(self.temp_path, self.path)
+        else:
+            self.temp_path.unlink(missing_ok=True)
+
+
+class CSVResultWriter(ResultWriter):
+    """Write results as CSV with a header row"""
+
+    def __init__(self, path, columns):
+        super().__init__(path, columns)
+        self._file = open(self.temp_path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=self.columns, extrasaction="ignore"
+        )
+        self._writer.writeheader()
+
+    def write_chunk(self, rows):
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class NDJSONResultWriter(ResultWriter):
+    """Write results as newline-delimited JSON, one object per row"""
+
+    def __init__(self, path, columns):
+        super().__init__(path, columns)
+        self._file = open(self.temp_path, "w", encoding="utf-8")
+
+    def write_chunk(self, rows):
+        self._file.write("".join(
+            json.dumps(
+                {key: row.get(key) for key in self.columns},
+                default=_json_default,
+            ) + "\n"
+            for row in rows
+        ))
+        self.rows_written += len(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetResultWriter(ResultWriter):
+    """Write results as a Parquet file, one row group per chunk
+
+    Requires the optional pyarrow package. Columns listed in PARQUET_TYPES
+    use that type; the types of other columns are inferred from the first
+    chunk, and columns that are empty in that chunk are stored as strings.
+    """
+
+    def __init__(self, path, columns):
+        super().__init__(path, columns)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ExportError("Parquet export requires the pyarrow package")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._writer = None
+        self._schema = None
+
+    def _infer_schema(self, rows):
+        pa = self._pa
+        fields = []
+        for key in self.columns:
+            if key in PARQUET_TYPES:
+                fields.append(pa.field(key, pa.type_for_alias(PARQUET_TYPES[key])))
+                continue
+            try:
+                field_type = pa.array([row.get(key) for row in rows]).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                field_type = pa.string()
+            if pa.types.is_null(field_type):
+                field_type = pa.string()
+            fields.append(pa.field(key, field_type))
+        return pa.schema(fields)
+
+    def _to_array(self, values, field):
+        pa = self._pa
+        if pa.types.is_string(field.type):
+            values = [None if v is None else str(v) for v in values]
+        try:
+            return pa.array(values, type=field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError) as e:
+            raise ExportError(f"Column {field.name} changed type: {e}")
+
+    def write_chunk(self, rows):
+        pa = self._pa
+        if self._writer is None:
+            self._schema = self._infer_schema(rows)
+            self._writer = self._pq.ParquetWriter(self.temp_path, self._schema)
+        arrays = [
+            self._to_array([row.get(field.name) for row in rows], field)
+            for field in self._schema
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self.rows_written += len(rows)
+
+    def close(self):
+        if self._writer is None:
+            # No rows were written; still produce a valid, empty file
+            pa = self._pa
+            self._schema = pa.schema(
+                [pa.field(key, pa.string()) for key in self.columns]
+            )
+            self._writer = self._pq.ParquetWriter(self.temp_path, self._schema)
+        self._writer.close()
+
+
+WRITERS = {
+    "csv": CSVResultWriter,
+    "ndjson": NDJSONResultWriter,
+    "parquet": ParquetResultWriter,
+}
+
+
+def export_rows(rows, path, fmt=None, columns=None,
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """Export an iterable of row dictionaries to a file
+
+    Args:
+        rows: Iterable of row dictionaries, consumed lazily
+        path: Output file path
+        fmt: One of FORMATS; guessed from the path's extension if not given
+        columns: Column keys to write; taken from the first row if not given
+        chunk_size: Number of rows buffered per write
+
+    Returns:
+        The number of rows written
+    """
+    fmt = fmt or format_from_path(path)
+    if fmt not in WRITERS:
+        raise ExportError(f"Unsupported export format: {fmt}")
+
+    chunks = iter_chunks(rows, chunk_size)
+    first = next(chunks, [])
+    if columns is None:
+        columns = list(first[0].keys()) if first else []
+
+    with WRITERS[fmt](path, columns) as writer:
+        if first:
+            writer.write_chunk(first)
+        for chunk in chunks:
+            writer.write_chunk(chunk)
+        return writer.rows_written
@@ -0,0 +1,250 @@
+"""
+Network graph model and force-directed layout
+
+NetworkGraph collects the relationships found by lookups (host to IP address,
+host to certificate issuer, IP address to ASN). ForceLayout positions the
+nodes with a Fruchterman-Reingold style simulation computed in NumPy batches.
+Repulsion is approximated with a grid: each node is pushed away from the
+centroid of every occupied grid cell rather than from every other node, so a
+step costs O(nodes x cells) instead of O(nodes^2). Nodes and edges can be
+added at any time; new nodes start next to a node they are connected to and
+the layout is briefly reheated so they settle in.
+
+Nothing here depends on Qt, so the layout can run on a worker thread.
+"""
+import re
+
+import numpy as np
+
+# Node kinds, in drawing order
+HOST = "host"
+IP = "ip"
+ASN = "asn"
+ISSUER = "issuer"
+NODE_KINDS = (ISSUER, ASN, IP, HOST)
+
+# Ideal edge length in scene units
+IDEAL_LENGTH = 30.0
+
+_NAME_ATTRIBUTE_RE = re.compile(r"(?:^|,)\s*(O|CN)=((?:\\.|[^,])+)")
+
+
+def issuer_name(issuer):
+    """Short display name for an issuer DN: its organization, else its CN"""
+    attributes = dict(_NAME_ATTRIBUTE_RE.findall(issuer or ""))
+    return attributes.get("O") or attributes.get("CN") or issuer
+
+
+class NetworkGraph:
+    """Nodes and edges gathered from lookup results
+
+    Changes since the last call to take_changes() are queued so that a
+    layout can be updated incrementally.
+    """
+
+    def __init__(self):
+        self.kinds = []
+        self.labels = []
+        self.edges = []
+        self._index = {}
+        self._edge_set = set()
+        self._new_nodes = []
+        self._new_edges = []
+
+    def __len__(self):
+        return len(self.labels)
+
+    def node(self, kind, label, anchor=-1):
+        """Return the index of a node, adding it if needed
+
+        Args:
+            kind: One of NODE_KINDS
+            label: Display label, unique within the kind
+            anchor: Index of a related node a new node is placed next to
+        """
+        key = (kind, label)
+        index = self._index.get(key)
+        if index is None:
+            index = len(self.labels)
+            self._index[key] = index
+            self.kinds.append(kind)
+            self.labels.append(label)
+            self._new_nodes.append(anchor)
+        return index
+
+    def connect(self, a, b):
+        """Add an undirected edge between two nodes"""
+        if a == b:
+            return
+        key = (a, b) if a < b else (b, a)
+        if key not in self._edge_set:
+            self._edge_set.add(key)
+            self.edges.append(key)
+            self._new_edges.append(key)
+
+    def add_row(self, row):
+        """Add the relationships found in one lookup result row"""
+        domain = row.get("domain")
+        if not domain:
+            return
+        host = self.node(HOST, domain)
+        asn = row.get("asn")
+
+        for address in (row.get("addresses") or "").split(", "):
+            if address:
+                ip = self.node(IP, address, host)
+                self.connect(host, ip)
+                if asn:
+                    self.connect(ip, self.node(ASN, str(asn), ip))
+        if asn and not row.get("addresses"):
+            self.connect(host, self.node(ASN, str(asn), host))
+
+        issuer = row.get("issuer")
+        if issuer:
+            self.connect(host, self.node(ISSUER, issuer_name(issuer), host))
+
+    def add_rows(self, rows):
+        """Add several lookup result rows"""
+        for row in rows:
+            self.add_row(row)
+
+    def take_changes(self):
+        """Return and clear the nodes and edges added since the last call
+
+        Returns:
+            (anchors, edges): the anchor index (or -1) of each new node, in
+            index order, and the list of new (a, b) edges
+        """
+        anchors, edges = self._new_nodes, self._new_edges
+        self._new_nodes, self._new_edges = [], []
+        return anchors, edges
+
+
+class ForceLayout:
+    """Incremental, grid-approximated force-directed layout"""
+
+    def __init__(self, ideal_length=IDEAL_LENGTH, grid_size=32, batch_size=1024,
+                 gravity=0.02, cooling=0.95, seed=None):
+        self.ideal_length = ideal_length
+        self.grid_size = grid_size
+        self.batch_size = batch_size
+        self.gravity = gravity
+        self.cooling = cooling
+        self.min_temperature = ideal_length * 0.01
+        self.temperature = ideal_length
+        self.positions = np.zeros((0, 2))
+        self.edges = np.zeros((0, 2), dtype=np.intp)
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def node_count(self):
+        return len(self.positions)
+
+    @property
+    def settled(self):
+        """Whether the layout has cooled down and stopped moving"""
+        return self.temperature <= self.min_temperature
+
+    def add_nodes(self, anchors):
+        """Add nodes, placing each next to its anchor node if it has one"""
+        count = len(anchors)
+        if not count:
+            return
+        anchors = np.asarray(anchors, dtype=np.intp)
+        radius = self.ideal_length * max(1.0, np.sqrt(self.node_count + count))
+        new = self._rng.uniform(-radius, radius, (count, 2))
+
+        # Anchors may refer to nodes added in this same batch
+        positions = np.concatenate([self.positions, new])
+        first = self.node_count
+        for offset in np.flatnonzero(anchors >= 0):
+            angle = self._rng.uniform(0, 2 * np.pi)
+            positions[first + offset] = positions[anchors[offset]] + (
+                self.ideal_length * np.array([np.cos(angle), np.sin(angle)])
+            )
+        self.positions = positions
+        self.reheat()
+
+    def add_edges(self, edges):
+        """Add (a, b) edges between existing nodes"""
+        if len(edges):
+            self.edges = np.concatenate(
+                [self.edges, np.asarray(edges, dtype=np.intp).reshape(-1, 2)]
+            )
+            self.reheat()
+
+    def reheat(self, fraction=0.5):
+        """Raise the temperature so recent additions can settle"""
+        self.temperature = max(self.temperature, self.ideal_length * fraction)
+
+    def _repulsion(self, positions):
+        """Grid-approximated repulsive displacement for every node"""
+        k2 = self.ideal_length ** 2
+        low = positions.min(axis=0)
+        span = np.maximum(positions.max(axis=0) - low, 1e-9)
+        grid = max(1, min(self.grid_size, int(np.sqrt(len(positions)))))
+        cells = (positions - low) / span * grid
+        cells = np.minimum(cells, grid - 1).astype(np.intp)
+        cell_ids = cells[:, 0] * grid + cells[:, 1]
+
+        mass = np.bincount(cell_ids, minlength=grid * grid).astype(float)
+        occupied = mass > 0
+        mass = mass[occupied]
+        centroids = np.stack([
+            np.bincount(cell_ids, positions[:, axis], grid * grid)[occupied]
+            for axis in (0, 1)
+        ], axis=1) / mass[:, None]
+
+        # Softening keeps a node from being flung away by its own cell
+        softening = (span / grid).mean() ** 2 * 0.25 + 1e-6
+        centroid_norms = (centroids ** 2).sum(axis=1)
+        displacement = np.empty_like(positions)
+        for start in range(0, len(positions), self.batch_size):
+            batch = positions[start:start + self.batch_size]
+            # Squared distances and the weighted sum of (node - centroid)
+            # expanded into matrix products to avoid (batch x cells x 2) arrays
+            distance2 = (
+                (batch ** 2).sum(axis=1)[:, None]
+                + centroid_norms[None, :]
+                - 2 * batch @ centroids.T
+            )
+            weights = mass / (np.maximum(distance2, 0) + softening)
+            displacement[start:start + self.batch_size] = (
+                batch * weights.sum(axis=1)[:, None] - weights @ centroids
+            ) * k2
+        return displacement
+
+    def _attraction(self, positions):
+        """Spring displacement along every edge"""
+        displacement = np.zeros_like(positions)
+        if not len(self.edges):
+            return displacement
+        a, b = self.edges[:, 0], self.edges[:, 1]
+        delta = positions[b] - positions[a]
+        distance = np.sqrt((delta ** 2).sum(axis=1))[:, None]
+        force = delta * distance / self.ideal_length
+        count = len(positions)
+        for axis in (0, 1):
+            displacement[:, axis] += np.bincount(a, force[:, axis], count)
+            displacement[:, axis] -= np.bincount(b, force[:, axis], count)
+        return displacement
+
+    def step(self, iterations=1):
+        """Advance the simulation, returning True while nodes still move"""
+        if not self.node_count:
+            return False
+        for _ in range(iterations):
+            if self.settled:
+                return False
+            positions = self.positions
+            displacement = (
+                self._repulsion(positions)
+                + self._attraction(positions)
+                - positions * self.gravity
+            )
+            # Limit each node's movement to the current temperature
+            length = np.sqrt((displacement ** 2).sum(axis=1))[:, None]
+            scale = np.minimum(length, self.temperature) / np.maximum(length, 1e-9)
+            self.positions = positions + displacement * scale
+            self.temperature *= self.cooling
+        return True
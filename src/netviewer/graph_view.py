@@ -0,0 +1,431 @@
+"""
+Network graph view
+
+Shows the NetworkGraph built from lookup results in a QGraphicsView. The
+whole graph is drawn by a single QGraphicsItem rather than one item per node,
+rendered with level of detail: when zoomed out nodes are plain points, edges
+are hidden on very large graphs and labels only appear once zoomed in. Edge
+and point geometry is built from NumPy arrays once per layout update rather
+than once per paint. The force-directed layout runs on a worker thread and
+streams positions back to the view, which shows them at a limited rate.
+"""
+import numpy as np
+from PySide6.QtCore import (
+    Qt,
+    QByteArray,
+    QDataStream,
+    QIODevice,
+    QMetaObject,
+    QObject,
+    QPointF,
+    QRectF,
+    QThread,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QPolygonF
+from PySide6.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsScene,
+    QGraphicsView,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QStyleOptionGraphicsItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .graph import ASN, HOST, IP, ISSUER, NODE_KINDS, ForceLayout, NetworkGraph
+from .profiler import traced
+
+NODE_COLORS = {
+    HOST: QColor("#0078d4"),
+    IP: QColor("#28a745"),
+    ASN: QColor("#8764b8"),
+    ISSUER: QColor("#d13438"),
+}
+NODE_RADIUS = {HOST: 4.0, IP: 3.0, ASN: 6.0, ISSUER: 8.0}
+
+# Level-of-detail thresholds (scene-to-view scale)
+POINT_DETAIL = 0.4
+LABEL_DETAIL = 1.5
+
+# Edges are skipped below POINT_DETAIL when there are more than this many
+MAX_OVERVIEW_EDGES = 10000
+# At most this many labels are drawn at once
+MAX_LABELS = 400
+
+# Layout iterations per tick and milliseconds between ticks
+LAYOUT_ITERATIONS = 2
+LAYOUT_INTERVAL_MS = 50
+
+# Layout positions are shown at most this often
+REPAINT_INTERVAL_MS = 150
+
+# QDataStream element types for QPainterPath
+_MOVE_TO = 0
+_LINE_TO = 1
+
+
+def _read_stream(data, value):
+    """Deserialize value from bytes in QDataStream's big-endian format"""
+    buffer = QByteArray(data)  # The stream reads it in place; keep it alive
+    stream = QDataStream(buffer, QIODevice.ReadOnly)
+    stream >> value
+    return value
+
+
+def points_polygon(points):
+    """Build a QPolygonF from an (n, 2) array without per-point Python calls"""
+    points = np.ascontiguousarray(points, dtype=">f8")
+    return _read_stream(
+        len(points).to_bytes(4, "big") + points.tobytes(), QPolygonF()
+    )
+
+
+def lines_path(starts, ends):
+    """Build a QPainterPath of line segments from two (n, 2) arrays"""
+    count = len(starts)
+    elements = np.empty(
+        2 * count, dtype=[("type", ">i4"), ("x", ">f8"), ("y", ">f8")]
+    )
+    elements["type"][0::2] = _MOVE_TO
+    elements["type"][1::2] = _LINE_TO
+    elements["x"][0::2], elements["y"][0::2] = starts[:, 0], starts[:, 1]
+    elements["x"][1::2], elements["y"][1::2] = ends[:, 0], ends[:, 1]
+    fill_rule = int(Qt.OddEvenFill.value)
+    return _read_stream(
+        (2 * count).to_bytes(4, "big") + elements.tobytes()
+        + fill_rule.to_bytes(4, "big"),
+        QPainterPath(),
+    )
+
+
+class LayoutWorker(QObject):
+    """Runs a ForceLayout on a worker thread, emitting positions as it moves"""
+    positions_ready = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.layout = ForceLayout()
+        self.timer = None
+
+    @Slot()
+    def start(self):
+        """Start ticking; called once the worker is on its thread"""
+        self.timer = QTimer(self)
+        self.timer.setInterval(LAYOUT_INTERVAL_MS)
+        self.timer.timeout.connect(self.tick)
+
+    @Slot(object, object)
+    def add(self, anchors, edges):
+        """Add new nodes and edges to the layout"""
+        self.layout.add_nodes(anchors)
+        self.layout.add_edges(edges)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    @Slot()
+    def clear(self):
+        """Remove every node"""
+        self.timer.stop()
+        self.layout = ForceLayout()
+        self.positions_ready.emit(self.layout.positions.copy())
+
+    @Slot()
+    def stop(self):
+        """Stop ticking before the thread quits"""
+        if self.timer is not None:
+            self.timer.stop()
+
+    def tick(self):
+        moving = self.layout.step(LAYOUT_ITERATIONS)
+        self.positions_ready.emit(self.layout.positions.copy())
+        if not moving:
+            self.timer.stop()
+
+
+class GraphItem(QGraphicsItem):
+    """Draws every node and edge of a graph with level of detail"""
+
+    def __init__(self, graph):
+        super().__init__()
+        self.graph = graph
+        self.positions = np.zeros((0, 2))
+        self._edges = np.zeros((0, 2), dtype=np.intp)
+        self._kinds = np.zeros(0, dtype=np.int8)
+        self._edge_total = 0
+        self._bounds = QRectF()
+        # Geometry built on the first paint after each position update
+        self._edge_path = None
+        self._point_polygons = None
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def set_positions(self, positions):
+        """Update node positions from the layout"""
+        self.prepareGeometryChange()
+        self.positions = positions
+        count = len(positions)
+        # Node kinds and edges only change when the graph grows, so the
+        # arrays are rebuilt then rather than on every position update
+        grew = len(self._kinds) != count
+        if grew:
+            self._kinds = np.array(
+                [NODE_KINDS.index(kind) for kind in self.graph.kinds[:count]],
+                dtype=np.int8,
+            )
+        if grew or self._edge_total != len(self.graph.edges):
+            self._edge_total = len(self.graph.edges)
+            edges = np.asarray(self.graph.edges, dtype=np.intp).reshape(-1, 2)
+            # Only edges between nodes the layout knows about can be drawn
+            self._edges = edges[(edges < count).all(axis=1)]
+        if count:
+            low = positions.min(axis=0) - 20
+            high = positions.max(axis=0) + 20
+            self._bounds = QRectF(
+                low[0], low[1], high[0] - low[0], high[1] - low[1]
+            )
+        else:
+            self._bounds = QRectF()
+        self._edge_path = None
+        self._point_polygons = None
+        self.update()
+
+    def boundingRect(self):
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        if not len(self.positions):
+            return
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+            painter.worldTransform()
+        )
+        self._paint_edges(painter, lod)
+        if lod < POINT_DETAIL:
+            self._paint_points(painter)
+            return
+        self._paint_nodes(painter)
+        if lod >= LABEL_DETAIL:
+            # Labels are drawn one by one, so only for nodes in view
+            exposed = option.exposedRect
+            x, y = self.positions[:, 0], self.positions[:, 1]
+            visible = (
+                (x >= exposed.left()) & (x <= exposed.right())
+                & (y >= exposed.top()) & (y <= exposed.bottom())
+            )
+            self._paint_labels(painter, visible)
+
+    def _paint_edges(self, painter, lod):
+        edges = self._edges
+        if not len(edges):
+            return
+        if lod < POINT_DETAIL and len(edges) > MAX_OVERVIEW_EDGES:
+            return
+        if self._edge_path is None:
+            self._edge_path = lines_path(
+                self.positions[edges[:, 0]], self.positions[edges[:, 1]]
+            )
+        painter.setPen(QPen(QColor(0, 0, 0, 40), 0))  # Cosmetic: one pixel
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self._edge_path)
+
+    def _kind_polygons(self):
+        """(kind, QPolygonF of node positions) for each kind with nodes"""
+        if self._point_polygons is None:
+            self._point_polygons = [
+                (kind, points_polygon(self.positions[self._kinds == code]))
+                for code, kind in enumerate(NODE_KINDS)
+                if (self._kinds == code).any()
+            ]
+        return self._point_polygons
+
+    def _paint_points(self, painter):
+        for kind, polygon in self._kind_polygons():
+            pen = QPen(NODE_COLORS[kind], 3)
+            pen.setCosmetic(True)  # Three pixels wide however far zoomed out
+            painter.setPen(pen)
+            painter.drawPoints(polygon)
+
+    def _paint_nodes(self, painter):
+        # Each node is a round point as wide as the node, so a kind takes a
+        # single call rather than one ellipse per node
+        painter.setRenderHint(QPainter.Antialiasing)
+        for kind, polygon in self._kind_polygons():
+            pen = QPen(NODE_COLORS[kind], 2 * NODE_RADIUS[kind])
+            pen.setCapStyle(Qt.RoundCap)
+            painter.setPen(pen)
+            painter.drawPoints(polygon)
+
+    def _paint_labels(self, painter, visible):
+        painter.setPen(QColor("#333333"))
+        painter.setFont(QFont("Segoe UI", 5))
+        labels = self.graph.labels
+        for index in np.flatnonzero(visible)[:MAX_LABELS].tolist():
+            px, py = self.positions[index]
+            radius = NODE_RADIUS[NODE_KINDS[self._kinds[index]]]
+            painter.drawText(QPointF(px + radius + 1, py + 1.5), labels[index])
+
+
+class GraphView(QGraphicsView):
+    """Zoomable, pannable view of a GraphItem"""
+
+    def __init__(self, scene, parent=None):
+        super().__init__(scene, parent)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        self.setStyleSheet("QGraphicsView { border: none; background: white; }")
+
+    def wheelEvent(self, event):
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        self.scale(factor, factor)
+
+    def fit(self):
+        """Zoom to show the whole graph"""
+        rect = self.scene().itemsBoundingRect()
+        if not rect.isEmpty():
+            self.fitInView(rect, Qt.KeepAspectRatio)
+
+
+class GraphWidget(QWidget):
+    """Network graph page: hosts, IP addresses, ASNs and certificate issuers"""
+
+    # Sends new (anchors, edges) to the layout worker
+    layout_changed = Signal(object, object)
+    layout_cleared = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.graph = NetworkGraph()
+        self._fitted = False
+        self._pending_positions = None
+        self.setup_ui()
+        self.setup_layout_thread()
+
+    def setup_ui(self):
+        """Setup the UI components"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 24, 24, 24)
+        layout.setSpacing(16)
+
+        toolbar = QHBoxLayout()
+        toolbar.setSpacing(12)
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet(
+            "QLabel { color: #666666; font-size: 14px; }"
+        )
+        legend = QLabel("  ".join(
+            f'<span style="color: {NODE_COLORS[kind].name()}">&#9679;</span> '
+            f"{kind.upper() if kind in (IP, ASN) else kind.title()}"
+            for kind in reversed(NODE_KINDS)
+        ))
+        legend.setStyleSheet("QLabel { color: #333333; font-size: 14px; }")
+        fit_button = QPushButton("Fit")
+        fit_button.clicked.connect(lambda: self.view.fit())
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        for button in (fit_button, clear_button):
+            button.setStyleSheet("""
+                QPushButton {
+                    background-color: #f5f5f5;
+                    color: #333333;
+                    border: 1px solid #e0e0e0;
+                    border-radius: 4px;
+                    padding: 6px 12px;
+                    font-size: 14px;
+                }
+                QPushButton:hover {
+                    background-color: #e0e0e0;
+                }
+            """)
+        toolbar.addWidget(legend)
+        toolbar.addStretch()
+        toolbar.addWidget(self.count_label)
+        toolbar.addWidget(fit_button)
+        toolbar.addWidget(clear_button)
+
+        self.scene = QGraphicsScene(self)
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.item = GraphItem(self.graph)
+        self.scene.addItem(self.item)
+        self.view = GraphView(self.scene)
+
+        layout.addLayout(toolbar)
+        layout.addWidget(self.view, 1)
+        self.update_count()
+
+        # Coalesces position updates from the layout into timed repaints
+        self.repaint_timer = QTimer(self)
+        self.repaint_timer.setSingleShot(True)
+        self.repaint_timer.setInterval(REPAINT_INTERVAL_MS)
+        self.repaint_timer.timeout.connect(self.show_positions)
+
+    def setup_layout_thread(self):
+        """Start the layout worker thread"""
+        self.layout_thread = QThread(self)
+        self.worker = LayoutWorker()
+        self.worker.moveToThread(self.layout_thread)
+        self.layout_thread.started.connect(self.worker.start)
+        self.layout_changed.connect(self.worker.add)
+        self.layout_cleared.connect(self.worker.clear)
+        self.worker.positions_ready.connect(self.update_positions)
+        self.layout_thread.finished.connect(self.worker.deleteLater)
+        self.layout_thread.start()
+
+    def shutdown(self):
+        """Stop the layout thread"""
+        QMetaObject.invokeMethod(self.worker, "stop", Qt.BlockingQueuedConnection)
+        self.layout_thread.quit()
+        self.layout_thread.wait()
+
+    def watch_model(self, model):
+        """Add rows to the graph as they are appended to a ResultTableModel"""
+        model.rowsInserted.connect(
+            lambda parent, first, last: self.add_rows(
+                model.row_dict(row) for row in range(first, last + 1)
+            )
+        )
+
+    @traced("graph.add_rows")
+    def add_rows(self, rows):
+        """Add lookup result rows to the graph"""
+        self.graph.add_rows(rows)
+        anchors, edges = self.graph.take_changes()
+        if anchors or edges:
+            self.layout_changed.emit(anchors, edges)
+
+    def clear(self):
+        """Remove everything from the graph"""
+        self.graph = NetworkGraph()
+        self.item.graph = self.graph
+        self._fitted = False
+        self.layout_cleared.emit()
+        self.update_count()
+
+    def update_positions(self, positions):
+        """Queue new positions from the layout worker to be shown"""
+        self._pending_positions = positions
+        if not self.repaint_timer.isActive():
+            self.repaint_timer.start()
+
+    @traced("graph.update_positions")
+    def show_positions(self):
+        """Show the latest positions from the layout worker"""
+        positions, self._pending_positions = self._pending_positions, None
+        if positions is None or len(positions) > len(self.graph):
+            return  # Stale positions from before a clear
+        self.item.set_positions(positions)
+        self.scene.setSceneRect(self.item.boundingRect())
+        if not self._fitted and len(positions):
+            self.view.fit()
+            self._fitted = True
+        self.update_count()
+
+    def update_count(self):
+        """Update the node/edge count"""
+        self.count_label.setText(
+            f"{len(self.graph)} nodes, {len(self.graph.edges)} edges"
+        )
@@ -1,41 +1,72 @@
 """
 Icon management for NetViewer
+
+Icons are loaded from the compiled resource bundle (resources_rc.py), which
+holds PNGs pre-rasterized from the SVGs in icons/ at every size in use. Each
+icon is built once and then shared, so widgets never parse SVG or touch the
+filesystem. Run build_resources.py after changing an icon.
 """
-from pathlib import Path
-from PySide6.QtGui import QIcon
+from functools import lru_cache
+
+from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtCore import QSize
-import os
+
+from . import resources_rc  # noqa: F401  (registers the :/icons resources)
 
 # Icon sizes
 ICON_SIZE = QSize(24, 24)
 SMALL_ICON_SIZE = QSize(16, 16)
 
-def get_icon_path(name):
-    """Get the path to an icon file"""
-    module_dir = Path(__file__).parent
-    return str(module_dir / 'icons' / f'{name}.svg')
+# Device pixel ratios with pre-rasterized variants in the resource bundle
+_SCALES = (1, 2)
+
+
+def get_icon_path(name, size=ICON_SIZE, scale=1):
+    """Get the resource path of a pre-rasterized icon"""
+    suffix = "" if scale == 1 else f"@{scale}x"
+    return f":/icons/{name}-{size.width()}{suffix}.png"
+
+
+@lru_cache(maxsize=None)
+def _load_pixmap(name, width, height, scale):
+    pixmap = QPixmap(get_icon_path(name, QSize(width, height), scale))
+    if pixmap.isNull():
+        raise FileNotFoundError(f"Icon not in resource bundle: {name} ({width}px)")
+    pixmap.setDevicePixelRatio(scale)
+    return pixmap
+
+
+def get_pixmap(name, size=ICON_SIZE, scale=1):
+    """Get a cached, pre-rasterized pixmap"""
+    return _load_pixmap(name, size.width(), size.height(), scale)
+
+
+@lru_cache(maxsize=None)
+def get_icon(name):
+    """Get a cached icon with every pre-rasterized size and scale"""
+    icon = QIcon()
+    for size in (SMALL_ICON_SIZE, ICON_SIZE):
+        for scale in _SCALES:
+            icon.addPixmap(get_pixmap(name, size, scale))
+    return icon
+
 
 # Create icons for our tools
 def create_dns_icon():
     """Create DNS icon"""
-    icon = QIcon()
-    icon.addFile(
-        os.path.join(os.path.dirname(__file__), "icons", "format-list-bulleted.svg")
-    )
-    return icon
+    return get_icon("format-list-bulleted")
+
 
 def create_ssl_icon():
     """Create SSL icon"""
-    icon = QIcon()
-    icon.addFile(
-        os.path.join(os.path.dirname(__file__), "icons", "certificate-outline.svg")
-    )
-    return icon
+    return get_icon("certificate-outline")
+
 
 def create_ip_icon():
     """Create IP icon"""
-    icon = QIcon()
-    icon.addFile(
-        os.path.join(os.path.dirname(__file__), "icons", "server-network-outline.svg")
-    )
-    return icon 
\ No newline at end of file
+    return get_icon("server-network-outline")
+
+
+def create_graph_icon():
+    """Create network graph icon"""
+    return get_icon("graph-outline")
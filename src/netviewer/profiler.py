@@ -0,0 +1,232 @@
+"""
+Built-in profiling for NetViewer
+
+While active, the profiler:
+
+- runs cProfile on the GUI thread (saved as cprofile.prof, for pstats/snakeviz)
+- samples the GUI thread's Python stack from a background thread and writes
+  the samples in collapsed-stack format (samples.folded), which flamegraph.pl,
+  speedscope and inferno read directly
+- detects event-loop stalls: a heartbeat timer on the GUI thread measures how
+  late it fires, and the sampler records the stack that was running while the
+  heartbeat was overdue, i.e. the call that blocked the event loop
+- times named hot-path sections marked with trace() or @traced
+
+Stalls and section timings are written to summary.json. Profiling is started
+with the --profile command line flag or from the Tools menu.
+"""
+import cProfile
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer
+
+# Seconds between stack samples of the GUI thread
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# An event loop blocked for longer than this many seconds counts as a stall
+DEFAULT_STALL_THRESHOLD = 0.1
+
+# Milliseconds between heartbeats used to detect stalls
+HEARTBEAT_INTERVAL_MS = 20
+
+# The profiler currently recording, if any
+_active = None
+
+
+def active_profiler():
+    """Return the profiler currently recording, or None"""
+    return _active
+
+
+@contextmanager
+def trace(name):
+    """Time a hot-path section when profiling is active"""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record_trace(name, time.perf_counter() - start)
+
+
+def traced(name):
+    """Decorator form of trace()"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})"
+
+
+def _collapse(frame):
+    """Collapse a stack into 'outer;...;inner' form"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class Profiler(QObject):
+    """Profiles the GUI thread and records event-loop stalls"""
+
+    def __init__(self, output_dir=None,
+                 sample_interval=DEFAULT_SAMPLE_INTERVAL,
+                 stall_threshold=DEFAULT_STALL_THRESHOLD,
+                 parent=None):
+        super().__init__(parent)
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self.stall_threshold = stall_threshold
+
+        self._lock = threading.Lock()
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(HEARTBEAT_INTERVAL_MS)
+        self._heartbeat.timeout.connect(self._beat)
+        self._sampler = None
+        self._stop_sampling = threading.Event()
+        self._reset()
+
+    def _reset(self):
+        self._cprofile = None
+        self._samples = Counter()
+        self._stall_samples = Counter()
+        self._stalls = []
+        self._traces = {}
+        self._last_beat = time.perf_counter()
+        self._started_at = None
+
+    @property
+    def is_active(self):
+        """Whether the profiler is currently recording"""
+        return _active is self
+
+    def start(self):
+        """Start profiling; must be called from the GUI thread"""
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profiler is already running")
+        self._reset()
+        self._started_at = datetime.now()
+        self._gui_thread_id = threading.get_ident()
+        _active = self
+
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+        self._last_beat = time.perf_counter()
+        self._heartbeat.start()
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="netviewer-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self):
+        """Stop profiling and write the results
+
+        Returns:
+            The directory the results were written to
+        """
+        global _active
+        if _active is not self:
+            return None
+        self._cprofile.disable()
+        self._heartbeat.stop()
+        self._stop_sampling.set()
+        self._sampler.join()
+        _active = None
+        return self.dump()
+
+    def record_trace(self, name, duration):
+        """Record the duration of a traced section"""
+        with self._lock:
+            count, total, longest = self._traces.get(name, (0, 0.0, 0.0))
+            self._traces[name] = (count + 1, total + duration, max(longest, duration))
+
+    def _beat(self):
+        """Heartbeat on the GUI thread; a late beat means the loop was blocked"""
+        now = time.perf_counter()
+        blocked = now - self._last_beat - HEARTBEAT_INTERVAL_MS / 1000
+        self._last_beat = now
+        if blocked < self.stall_threshold:
+            return
+        with self._lock:
+            stacks = self._stall_samples
+            self._stall_samples = Counter()
+        stack, samples = stacks.most_common(1)[0] if stacks else ("", 0)
+        self._stalls.append({
+            "ended_at": datetime.now().isoformat(),
+            "duration_ms": round(blocked * 1000, 1),
+            "stack": stack.split(";") if stack else [],
+            "samples": samples,
+        })
+
+    def _sample_loop(self):
+        """Sample the GUI thread's stack until stopped"""
+        while not self._stop_sampling.wait(self.sample_interval):
+            frame = sys._current_frames().get(self._gui_thread_id)
+            if frame is None:
+                continue
+            stack = _collapse(frame)
+            overdue = time.perf_counter() - self._last_beat > self.stall_threshold
+            with self._lock:
+                self._samples[stack] += 1
+                if overdue:
+                    self._stall_samples[stack] += 1
+
+    def dump(self):
+        """Write the collected results to the output directory"""
+        output_dir = Path(
+            self.output_dir
+            or f"netviewer-profile-{self._started_at:%Y%m%d-%H%M%S}"
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        self._cprofile.dump_stats(str(output_dir / "cprofile.prof"))
+        with self._lock:
+            samples = self._samples.most_common()
+            traces = dict(self._traces)
+        with open(output_dir / "samples.folded", "w", encoding="utf-8") as f:
+            for stack, count in samples:
+                f.write(f"{stack} {count}\n")
+
+        summary = {
+            "started_at": self._started_at.isoformat(),
+            "stopped_at": datetime.now().isoformat(),
+            "sample_interval_ms": self.sample_interval * 1000,
+            "stall_threshold_ms": self.stall_threshold * 1000,
+            "stalls": sorted(
+                self._stalls, key=lambda s: s["duration_ms"], reverse=True
+            ),
+            "traces": {
+                name: {
+                    "count": count,
+                    "total_ms": round(total * 1000, 3),
+                    "mean_ms": round(total * 1000 / count, 3),
+                    "max_ms": round(longest * 1000, 3),
+                }
+                for name, (count, total, longest) in sorted(traces.items())
+            },
+        }
+        with open(output_dir / "summary.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return output_dir
@@ -0,0 +1,341 @@
+"""
+Resilient lookups for NetViewer tools
+
+A lookup is split into phases (e.g. resolve, connect, certificate), each run
+under its own deadline. Transient failures are retried a bounded number of
+times with jittered exponential backoff, and a per-host circuit breaker skips
+hosts that keep failing so that a few dead hosts can't dominate a bulk scan.
+Phases run on a shared pool of worker threads; a phase's deadline starts
+when a worker picks it up, and a phase that can't get a worker in time fails
+as busy without counting against the host. Failures are raised as LookupFailure subclasses carrying the host, phase and
+kind of error.
+"""
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+# Default per-phase deadlines in seconds
+DEFAULT_TIMEOUTS = {
+    "resolve": 2.0,
+    "reverse": 2.0,
+    "connect": 3.0,
+    "certificate": 10.0,
+    "favicon": 2.0,
+}
+DEFAULT_TIMEOUT = 5.0
+
+# Worker threads used to enforce deadlines on blocking calls. A call that
+# overruns its deadline keeps its worker until the call itself returns, so
+# phases also pass their deadline on as a socket timeout where they can.
+MAX_WORKERS = 32
+_executor = ThreadPoolExecutor(
+    max_workers=MAX_WORKERS, thread_name_prefix="netviewer-lookup"
+)
+_executor_workers = MAX_WORKERS
+_executor_lock = threading.Lock()
+
+
+class WorkersBusy(Exception):
+    """No worker thread became free to start a call before its deadline"""
+
+
+class LookupFailure(Exception):
+    """A lookup phase failed
+
+    Attributes:
+        host: Host being looked up
+        phase: Phase that failed
+        message: Human readable description
+        attempts: Number of attempts made
+    """
+    kind = "failed"
+    # Whether the failure suggests the host is unavailable (counts against
+    # the circuit breaker) and is worth retrying
+    transient = False
+
+    def __init__(self, host, phase, message, attempts=1):
+        super().__init__(message)
+        self.host = host
+        self.phase = phase
+        self.message = message
+        self.attempts = attempts
+
+    def __str__(self):
+        return f"{self.phase}: {self.message}"
+
+    def to_dict(self):
+        """Return the failure as a plain dictionary"""
+        return {
+            "host": self.host,
+            "phase": self.phase,
+            "type": self.kind,
+            "message": self.message,
+            "attempts": self.attempts,
+        }
+
+
+class LookupTimeout(LookupFailure):
+    """A phase did not finish before its deadline"""
+    kind = "timeout"
+    transient = True
+
+
+class ConnectionFailure(LookupFailure):
+    """The host refused or dropped the connection"""
+    kind = "connection"
+    transient = True
+
+
+class ResolutionFailure(LookupFailure):
+    """The host name could not be resolved"""
+    kind = "dns"
+
+
+class InvalidInput(LookupFailure):
+    """The host or address to look up is not valid"""
+    kind = "invalid"
+
+
+class CircuitOpen(LookupFailure):
+    """The host was skipped because its circuit breaker is open"""
+    kind = "circuit_open"
+
+
+class LookupBusy(LookupFailure):
+    """Every worker was busy, so the phase never ran; says nothing of the host"""
+    kind = "busy"
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff"""
+
+    def __init__(self, attempts=3, base_delay=0.25, max_delay=2.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """Seconds to wait after the given (zero-based) failed attempt"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker
+
+    After failure_threshold consecutive failures a host's circuit opens and
+    lookups are rejected immediately. Once reset_timeout seconds have passed a
+    single trial lookup is let through (half-open); success closes the
+    circuit, failure opens it again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=3, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened_at = {}
+        self._trial = set()
+
+    def state(self, host):
+        """Return the circuit state for a host"""
+        with self._lock:
+            return self._state(host)
+
+    def _state(self, host):
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self, host):
+        """Whether a lookup of host may proceed"""
+        with self._lock:
+            state = self._state(host)
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and host not in self._trial:
+                self._trial.add(host)
+                return True
+            return False
+
+    def record_success(self, host):
+        """Close the circuit for host"""
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial.discard(host)
+
+    def record_failure(self, host):
+        """Count a failure, opening the circuit once the threshold is hit"""
+        with self._lock:
+            self._trial.discard(host)
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold or host in self._opened_at:
+                self._opened_at[host] = time.monotonic()
+
+    def release(self, host):
+        """End a lookup without counting it, freeing any half-open trial"""
+        with self._lock:
+            self._trial.discard(host)
+
+    def reset(self):
+        """Close every circuit"""
+        with self._lock:
+            self._failures.clear()
+            self._opened_at.clear()
+            self._trial.clear()
+
+
+def ensure_workers(count):
+    """Grow the deadline worker pool to at least count threads"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor_workers >= count:
+            return
+        previous = _executor
+        _executor_workers = count
+        _executor = ThreadPoolExecutor(
+            max_workers=count, thread_name_prefix="netviewer-lookup"
+        )
+    # Calls already queued on the old pool still run there
+    previous.shutdown(wait=False)
+
+
+def run_with_deadline(func, timeout, *args, **kwargs):
+    """Run func on a worker thread with a deadline of timeout seconds
+
+    The deadline starts when a worker starts the call, not when it is queued.
+    Raises WorkersBusy if no worker starts the call within timeout seconds,
+    and concurrent.futures.TimeoutError if the call runs past its deadline.
+    """
+    started = []
+    ready = threading.Event()
+
+    def call():
+        started.append(time.monotonic())
+        ready.set()
+        return func(*args, **kwargs)
+
+    with _executor_lock:
+        future = _executor.submit(call)
+    # A call still queued at the deadline is cancelled so it never runs
+    if not ready.wait(timeout) and future.cancel():
+        raise WorkersBusy(f"no worker free within {timeout:g}s")
+    ready.wait()
+    remaining = started[0] + timeout - time.monotonic()
+    return future.result(timeout=max(remaining, 0))
+
+
+def split_host_port(address, default_port):
+    """Split 'host[:port]' or '[ipv6]:port' into (host, port)
+
+    A bare IPv6 address has more than one colon and is never split.
+    """
+    if address.startswith("["):
+        host, _, rest = address[1:].partition("]")
+        if rest.startswith(":") and rest[1:].isdigit():
+            return host, int(rest[1:])
+        return host, default_port
+    if address.count(":") == 1:
+        host, _, port = address.partition(":")
+        if port.isdigit():
+            return host, int(port)
+    return address, default_port
+
+
+def resolve(host, port):
+    """Resolve a host name"""
+    return socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+
+
+def probe_port(host, port, timeout):
+    """Check that a TCP connection to host:port can be opened"""
+    socket.create_connection((host, port), timeout=timeout).close()
+
+
+class LookupPipeline:
+    """Runs lookup phases with deadlines, retries and a circuit breaker
+
+    Timeouts in the phases listed in no_retry_timeouts are not retried. By
+    default that is the connect phase: a host that doesn't accept a
+    connection within the deadline is almost always down or filtered, and
+    retrying it would make every dead host in a bulk scan cost several
+    deadlines. The tradeoff is that a host that is only briefly slow to
+    accept fails on the first timeout instead of being retried. Refused or
+    reset connections fail fast and are still retried.
+    """
+
+    def __init__(self, timeouts=None, retry=None, breaker=None,
+                 no_retry_timeouts=("connect",)):
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.no_retry_timeouts = frozenset(no_retry_timeouts)
+
+    def timeout(self, phase):
+        """Deadline in seconds for a phase"""
+        return self.timeouts.get(phase, DEFAULT_TIMEOUT)
+
+    def run_phase(self, host, phase, func, *args, **kwargs):
+        """Run one phase, retrying transient failures"""
+        attempts = self.retry.attempts
+        for attempt in range(attempts):
+            try:
+                return run_with_deadline(func, self.timeout(phase), *args, **kwargs)
+            except WorkersBusy as e:
+                raise LookupBusy(host, phase, str(e), attempt + 1)
+            except FutureTimeoutError:
+                failure = LookupTimeout(
+                    host, phase, f"timed out after {self.timeout(phase):g}s"
+                )
+            except (socket.gaierror, socket.herror) as e:
+                raise ResolutionFailure(host, phase, str(e), attempt + 1)
+            except socket.timeout:
+                failure = LookupTimeout(host, phase, "timed out")
+            except OSError as e:
+                failure = ConnectionFailure(host, phase, str(e) or type(e).__name__)
+            except LookupFailure:
+                raise
+            except Exception as e:
+                raise LookupFailure(host, phase, str(e), attempt + 1)
+            failure.attempts = attempt + 1
+            if (isinstance(failure, LookupTimeout)
+                    and phase in self.no_retry_timeouts):
+                break
+            if attempt + 1 < attempts:
+                time.sleep(self.retry.delay(attempt))
+        raise failure
+
+    def lookup(self, host, phases):
+        """Run a sequence of (phase, func) steps for host
+
+        Returns:
+            The result of the last phase
+        """
+        if not self.breaker.allow(host):
+            raise CircuitOpen(host, "circuit", "host skipped after repeated failures")
+        result = None
+        try:
+            for phase, func in phases:
+                result = self.run_phase(host, phase, func)
+        except LookupBusy:
+            self.breaker.release(host)
+            raise
+        except LookupFailure as e:
+            if e.transient or isinstance(e, ResolutionFailure):
+                self.breaker.record_failure(host)
+            else:
+                # The host answered, so it isn't dead
+                self.breaker.record_success(host)
+            raise
+        self.breaker.record_success(host)
+        return result
@@ -1,193 +1,500 @@
-/****************************************************************************
-** Resource object code
-**
-** Created by: The Resource Compiler for Qt version 6.8.2
-**
-** WARNING! All changes made in this file will be lost!
-*****************************************************************************/
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
 
-#ifdef _MSC_VER
-// disable informational message "function ... selected for automatic inline expansion"
-#pragma warning (disable: 4711)
-#endif
+from PySide6 import QtCore
 
-static const unsigned char qt_resource_data[] = {
-  // dns.svg
-  0x0,0x0,0x1,0x4c,
-  0x3c,
-  0x3f,0x78,0x6d,0x6c,0x20,0x76,0x65,0x72,0x73,0x69,0x6f,0x6e,0x3d,0x22,0x31,0x2e,
-  0x30,0x22,0x20,0x65,0x6e,0x63,0x6f,0x64,0x69,0x6e,0x67,0x3d,0x22,0x55,0x54,0x46,
-  0x2d,0x38,0x22,0x3f,0x3e,0xd,0xa,0x3c,0x73,0x76,0x67,0x20,0x77,0x69,0x64,0x74,
-  0x68,0x3d,0x22,0x32,0x34,0x22,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3d,0x22,0x32,
-  0x34,0x22,0x20,0x76,0x69,0x65,0x77,0x42,0x6f,0x78,0x3d,0x22,0x30,0x20,0x30,0x20,
-  0x32,0x34,0x20,0x32,0x34,0x22,0x20,0x66,0x69,0x6c,0x6c,0x3d,0x22,0x6e,0x6f,0x6e,
-  0x65,0x22,0x20,0x78,0x6d,0x6c,0x6e,0x73,0x3d,0x22,0x68,0x74,0x74,0x70,0x3a,0x2f,
-  0x2f,0x77,0x77,0x77,0x2e,0x77,0x33,0x2e,0x6f,0x72,0x67,0x2f,0x32,0x30,0x30,0x30,
-  0x2f,0x73,0x76,0x67,0x22,0x3e,0xd,0xa,0x20,0x20,0x20,0x20,0x3c,0x70,0x61,0x74,
-  0x68,0x20,0x64,0x3d,0x22,0x4d,0x31,0x32,0x20,0x32,0x43,0x36,0x2e,0x34,0x38,0x20,
-  0x32,0x20,0x32,0x20,0x36,0x2e,0x34,0x38,0x20,0x32,0x20,0x31,0x32,0x73,0x34,0x2e,
-  0x34,0x38,0x20,0x31,0x30,0x20,0x31,0x30,0x20,0x31,0x30,0x20,0x31,0x30,0x2d,0x34,
-  0x2e,0x34,0x38,0x20,0x31,0x30,0x2d,0x31,0x30,0x53,0x31,0x37,0x2e,0x35,0x32,0x20,
-  0x32,0x20,0x31,0x32,0x20,0x32,0x7a,0x6d,0x30,0x20,0x31,0x38,0x63,0x2d,0x34,0x2e,
-  0x34,0x31,0x20,0x30,0x2d,0x38,0x2d,0x33,0x2e,0x35,0x39,0x2d,0x38,0x2d,0x38,0x73,
-  0x33,0x2e,0x35,0x39,0x2d,0x38,0x20,0x38,0x2d,0x38,0x20,0x38,0x20,0x33,0x2e,0x35,
-  0x39,0x20,0x38,0x20,0x38,0x2d,0x33,0x2e,0x35,0x39,0x20,0x38,0x2d,0x38,0x20,0x38,
-  0x7a,0x6d,0x2d,0x31,0x2d,0x31,0x33,0x68,0x32,0x76,0x36,0x68,0x2d,0x32,0x7a,0x6d,
-  0x30,0x20,0x38,0x68,0x32,0x76,0x32,0x68,0x2d,0x32,0x7a,0x22,0x20,0x66,0x69,0x6c,
-  0x6c,0x3d,0x22,0x63,0x75,0x72,0x72,0x65,0x6e,0x74,0x43,0x6f,0x6c,0x6f,0x72,0x22,
-  0x2f,0x3e,0xd,0xa,0x3c,0x2f,0x73,0x76,0x67,0x3e,0x20,
-    // security.svg
-  0x0,0x0,0x1,0x46,
-  0x3c,
-  0x3f,0x78,0x6d,0x6c,0x20,0x76,0x65,0x72,0x73,0x69,0x6f,0x6e,0x3d,0x22,0x31,0x2e,
-  0x30,0x22,0x20,0x65,0x6e,0x63,0x6f,0x64,0x69,0x6e,0x67,0x3d,0x22,0x55,0x54,0x46,
-  0x2d,0x38,0x22,0x3f,0x3e,0xd,0xa,0x3c,0x73,0x76,0x67,0x20,0x77,0x69,0x64,0x74,
-  0x68,0x3d,0x22,0x32,0x34,0x22,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3d,0x22,0x32,
-  0x34,0x22,0x20,0x76,0x69,0x65,0x77,0x42,0x6f,0x78,0x3d,0x22,0x30,0x20,0x30,0x20,
-  0x32,0x34,0x20,0x32,0x34,0x22,0x20,0x66,0x69,0x6c,0x6c,0x3d,0x22,0x6e,0x6f,0x6e,
-  0x65,0x22,0x20,0x78,0x6d,0x6c,0x6e,0x73,0x3d,0x22,0x68,0x74,0x74,0x70,0x3a,0x2f,
-  0x2f,0x77,0x77,0x77,0x2e,0x77,0x33,0x2e,0x6f,0x72,0x67,0x2f,0x32,0x30,0x30,0x30,
-  0x2f,0x73,0x76,0x67,0x22,0x3e,0xd,0xa,0x20,0x20,0x20,0x20,0x3c,0x70,0x61,0x74,
-  0x68,0x20,0x64,0x3d,0x22,0x4d,0x31,0x32,0x20,0x31,0x4c,0x33,0x20,0x35,0x76,0x36,
-  0x63,0x30,0x20,0x35,0x2e,0x35,0x35,0x20,0x33,0x2e,0x38,0x34,0x20,0x31,0x30,0x2e,
-  0x37,0x34,0x20,0x39,0x20,0x31,0x32,0x20,0x35,0x2e,0x31,0x36,0x2d,0x31,0x2e,0x32,
-  0x36,0x20,0x39,0x2d,0x36,0x2e,0x34,0x35,0x20,0x39,0x2d,0x31,0x32,0x56,0x35,0x6c,
-  0x2d,0x39,0x2d,0x34,0x7a,0x6d,0x30,0x20,0x32,0x2e,0x31,0x38,0x6c,0x37,0x20,0x33,
-  0x2e,0x31,0x32,0x76,0x34,0x2e,0x37,0x63,0x30,0x20,0x34,0x2e,0x38,0x33,0x2d,0x32,
-  0x2e,0x37,0x39,0x20,0x39,0x2e,0x33,0x36,0x2d,0x37,0x20,0x31,0x30,0x2e,0x39,0x33,
-  0x2d,0x34,0x2e,0x32,0x31,0x2d,0x31,0x2e,0x35,0x37,0x2d,0x37,0x2d,0x36,0x2e,0x31,
-  0x2d,0x37,0x2d,0x31,0x30,0x2e,0x39,0x33,0x76,0x2d,0x34,0x2e,0x37,0x6c,0x37,0x2d,
-  0x33,0x2e,0x31,0x32,0x7a,0x22,0x20,0x66,0x69,0x6c,0x6c,0x3d,0x22,0x63,0x75,0x72,
-  0x72,0x65,0x6e,0x74,0x43,0x6f,0x6c,0x6f,0x72,0x22,0x2f,0x3e,0xd,0xa,0x3c,0x2f,
-  0x73,0x76,0x67,0x3e,0x20,
-    // network.svg
-  0x0,0x0,0x1,0x4c,
-  0x3c,
-  0x3f,0x78,0x6d,0x6c,0x20,0x76,0x65,0x72,0x73,0x69,0x6f,0x6e,0x3d,0x22,0x31,0x2e,
-  0x30,0x22,0x20,0x65,0x6e,0x63,0x6f,0x64,0x69,0x6e,0x67,0x3d,0x22,0x55,0x54,0x46,
-  0x2d,0x38,0x22,0x3f,0x3e,0xd,0xa,0x3c,0x73,0x76,0x67,0x20,0x77,0x69,0x64,0x74,
-  0x68,0x3d,0x22,0x32,0x34,0x22,0x20,0x68,0x65,0x69,0x67,0x68,0x74,0x3d,0x22,0x32,
-  0x34,0x22,0x20,0x76,0x69,0x65,0x77,0x42,0x6f,0x78,0x3d,0x22,0x30,0x20,0x30,0x20,
-  0x32,0x34,0x20,0x32,0x34,0x22,0x20,0x66,0x69,0x6c,0x6c,0x3d,0x22,0x6e,0x6f,0x6e,
-  0x65,0x22,0x20,0x78,0x6d,0x6c,0x6e,0x73,0x3d,0x22,0x68,0x74,0x74,0x70,0x3a,0x2f,
-  0x2f,0x77,0x77,0x77,0x2e,0x77,0x33,0x2e,0x6f,0x72,0x67,0x2f,0x32,0x30,0x30,0x30,
-  0x2f,0x73,0x76,0x67,0x22,0x3e,0xd,0xa,0x20,0x20,0x20,0x20,0x3c,0x70,0x61,0x74,
-  0x68,0x20,0x64,0x3d,0x22,0x4d,0x31,0x32,0x20,0x32,0x43,0x36,0x2e,0x34,0x38,0x20,
-  0x32,0x20,0x32,0x20,0x36,0x2e,0x34,0x38,0x20,0x32,0x20,0x31,0x32,0x73,0x34,0x2e,
-  0x34,0x38,0x20,0x31,0x30,0x20,0x31,0x30,0x20,0x31,0x30,0x20,0x31,0x30,0x2d,0x34,
-  0x2e,0x34,0x38,0x20,0x31,0x30,0x2d,0x31,0x30,0x53,0x31,0x37,0x2e,0x35,0x32,0x20,
-  0x32,0x20,0x31,0x32,0x20,0x32,0x7a,0x6d,0x30,0x20,0x31,0x38,0x63,0x2d,0x34,0x2e,
-  0x34,0x31,0x20,0x30,0x2d,0x38,0x2d,0x33,0x2e,0x35,0x39,0x2d,0x38,0x2d,0x38,0x73,
-  0x33,0x2e,0x35,0x39,0x2d,0x38,0x20,0x38,0x2d,0x38,0x20,0x38,0x20,0x33,0x2e,0x35,
-  0x39,0x20,0x38,0x20,0x38,0x2d,0x33,0x2e,0x35,0x39,0x20,0x38,0x2d,0x38,0x20,0x38,
-  0x7a,0x6d,0x2d,0x31,0x2d,0x31,0x33,0x68,0x32,0x76,0x36,0x68,0x2d,0x32,0x7a,0x6d,
-  0x30,0x20,0x38,0x68,0x32,0x76,0x32,0x68,0x2d,0x32,0x7a,0x22,0x20,0x66,0x69,0x6c,
-  0x6c,0x3d,0x22,0x63,0x75,0x72,0x72,0x65,0x6e,0x74,0x43,0x6f,0x6c,0x6f,0x72,0x22,
-  0x2f,0x3e,0xd,0xa,0x3c,0x2f,0x73,0x76,0x67,0x3e,0x20,
-  
-};
+qt_resource_data = b"\
+\x00\x00\x00\x85\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x007IDAT8\x8dc\
+`\x18\xf2\x80\x11J+100\x1cd``hf\
+``\xb8\xcc\xc0\xc0PL\x84\xde\x10\x06\x06\x06\x06&\
+$\x81\xffTu\x1a\xdd\xc0h\x18\x8c\x86\x01U\x00\x00\
+\xd3\xde\x0c\x07R\xb1\xbf\xc6\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x00\xb6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00hIDATX\x85\xed\
+\xd4\xb1\x09\x800\x10\x85\xe1_\xd7\xd0\x19\xec\xed\xdc\xc7\
+y\xd2f\x82\x90\x15c\x13A-l\x12\xc8\xc1\xbd\x0f\
+\xae\x08!\x1c\xe1\x1d\x07\x22\xdeM\x9f\xf3\x0ad`\x03\
+\x22p\x02\x05\xd8\x81\xa5S\xcf\xf4w\x19j\xc3\xbb\x8e\
+\xc7\xa3\xd2\xa9^\xe6\xb6\xcf\xb43\x17\x81\xf8cn\x08\
+\xb5\x07\x86G \xfe\x98\x1bB\xed\x81\xe1\x11\x88\xf8s\
+\x01z\xe1[Q\xe3\xa4e\xfd\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x02\xc1\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x02sIDATh\x81\xed\
+\x98=h\x14A\x14\xc7\x7fwQ\x03\xca)*\x86`\
+\x04\x8b (6\x22\x82V9\x11\xacD\x11\xb4\x15\xad\
+\xac\x15\xb4\x89\x22\xd8\x09B\x04\xc1\xc2J\x14lD\x10\
+\xb9\x03\xed\xfchl\xfc*\x05\xb1\x10$Q\x04\xbf\xa2\
+'\xf8u\x16\xef\x85,\xcb\xcc\xed\xce\xee\xdb\xdd(\xfb\
+\x83)vv\xe6\xff\xfe3s3s\xfb\xa0\xa6\xa6\xa6\
+\xc6\x906\xd0\x05f\xb4t\xb5\xee\x9f`\x12\xe8;\xca\
+\x1f}\x97\x89\xb2f\xa4\x8d\x18u\x0d`n\x10\xc1q\
+\x0b\x99\x11\x0f]O\xach\xe9\x84\x08\x162#@\x13\
+h\x01c\xc0&`;\xb0\x1bY\xdd\xa4\x01L\xbb\x04\
+\x17y\x02\x9d\x04\x1a\x03\x8c4\x80S\xc0\x08\xb0<R\
+V\xc4\x9e\xe3\xf5-\x8f\xee\xe7\x01\xb1\x06\xe239\x03\
+\x8c&\xf4\xed\x01K3\xc4\xec!\x86\xbfD\xcab`\
+\x22\xa1_\x17\xd8\x1b\xaf\xf4\xad@\x1a\xbe\x01w\x1df\
+\xe6\x8a\xab~\x16\xf8\xe5\xd0j\x03\xf7\xf0Oh\x1f8\
+\x1fb\xce|S\xa5\xc0\xf4\xd0H\xb3\x89\x93\x96<\x94\
+\xf1\x88\xfe;d\xd3v\xc8qlO\xe2\x1eD\x11\xc7\
+(\xc0M\xd5\xbfd)\xdaFfaZ\xcb3\x02\x7f\
+\x8b)\x99@\xcc\x7f\x02\xd6\x14\xa0\x0f\xc0Z\xe0+\xb2\
+y\xd7\x1b\xea6\x81\xc7\xc8\x00N\x18\xea:\xb9\xaa\x81\
+n\x1bj\x1eR\xcdW\xc0\xb0\xa1\xae\x93\x11\xe0\x83\x06\
+\xdcg\xa0\xb7\x0cx\xa3z\x07\x0c\xf4RqT\x03\xbe\
+V\x03y8\xa3Z\x0f\x19|\xf3\x9b\xd2\x04\x1ei\xe0\
+s9t\xc6\x90\xfd\xd4\x07\xb6\x19\xf8\x0ab\x0b\xf0\x1b\
+\xf8\x09l\xce\xa8q\x051\x7f\xcd\xcaT(\x17\xd4\xc0\
+\x03\xc2\x97\x7f+r\x9f\xf4\x80u\xc6\xbeR\xd3b~\
+\x03\x1e\x0e\xe8\xd7\x00\xeek\xbf\xb3\xf6\xb6\xc28\xa8F\
+\xde\x03\xabR\xf6\xd9\xcf\xfc\xff\xfb\xbc\x87@n\x1a\xc0\
+\x1d\xc4\xd0\xe5\x14\xed\x97\x00/\xb5\xfd\x91\xe2l\x851\
+\x0e|GL\xedHh{\x5c\xdb=EN\xb3\x05\xc3\
+i\xc4\xd8s\xfc\xdf\x18\xab\x81\x8f\xdang9\xb6\xd2\
+3\x0c\xbc@\xcc\x1d\xf3\xb4\xb9\xa8\xefo\x95e*\x94\
+]\x88\xc1Y\xe4\x92\x8a\xb2\x11\xf9\x12\xfb\x01l(\xd9\
+W\x10\xd7\x91A\xdc\x88\xd5w\xb4~\xaatG\x81\x8c\
+\x22G\xea\x140\xa4uC\xfa\xfc\x16XY\x91\xaf \
+Z\xb83z{\xaa4\x15B\x99\x19=s\x8a\xca\xe8\
+\x95F\x15\xe9\x18S2\xe78\xb3\xb2\xa0\xae\xf3,X\
+\x0f\xe0\x89Q\x9b\xca\xa8\x22\xa3gN\xd9\x19\xbdB\x88\
+g\xf4r\xe58kjj\xfec\xfe\x02\xff\xc6\x04\xf4\
+\xc3IN\xbb\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x00\xee\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xa0IDAT8\x8d\xdd\
+\xd0K\x0e\x01Q\x10\x85\xe1\xcf#\x96\xc0@,\xa4\x19\
+X\x90\x89\x81e\x18H\xc4.z\x13\x06\xc2>\x90`\
+\x09&m\xa0\xc8Mk\xaf!\x7frSU'\xb7r\
+N\x8a\x9f\xa7\x16u\x80q2\xbf\xa3\xc0\x0c\xabz\x08\
+#\xf4\xbf0\xee\xc7\x8ef\x08-\xac\xb1\x89y\x8aI\
+\xd4*\xf2\xd8Q\x7f\xf2\xe1cn\x09\xce\x18\x96\x1c\xd2\
+Z&\xc3\x12\x1a!\x1c\xd0\xf5x\xc4\x0c=\xecJ\xfa\
+\x16\xf3\xa8/\xc9_\xa4 q\xcc\x22A\xca\x02\xed\xe8\
+O\xe2\xea\x09{\xd7\xc3\xdf\x9d\x8a/_\x9e&\xa8b\
+\x81N\xf4\xc7\x8a\x04\xff\xc2\x05A\x8f$\xf6l\xd9\x1a\
+\xcb\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01|\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01.IDATH\x89\xdd\
+\xd5\xbf.\x04Q\x14\x06\xf0\x1f\x96D\x82mDDA\
+\xac\x07\xd0J\x94j\x8df_@\x96\x07P\xa0Wz\
+\x03Z\x89J\x88FD\xa1\xd1\x8a\xa8HVD\xa2\xa0\
+c\x13QH(\xe6N2Y\xcc\xce\xecL\xc3\x97\x9c\
+\xe4\xfe\xf9\xcew\xef9'\xe7^\xfe:zJ\xd2\xa9\
+\xa2\x1e\xc6\xfbxI#6\x82Us\x887\xf1\x19\xac\
+\xf9\x9bof\xa2(\xf2!L`=\xe1\x13[#&\
+V\x12Nu\xd4\x12\xf3\x1a\x8e\xf0\x16\x0e\x1aI\xd80\
+\xdeE\xa9h\xa5\x85WI\xdb\xc4%N\xf0\xdaf-\
+|\x04N\x15\xb7\x18\x0b\xf3;Q\x1d\xbe!O\x8a\xda\
+q\x8eS\x19j\x17\x17\xf9\x10+\x19\xc5\x17p\x83\xfe\
+\x8c|0\x8b'\x8cv\xe0\xf5\xe1\x0a\x8by\xc4cl\
+c\xb7\x03g\x19g\xba\xec\xa7a<`>e\xffQ\
+\x14m\xd7X\xc2\xb5\x9f\xf3\xbb\x85\x9d\x22\xe2D\xa1\x1f\
+c\xadm}\x0a\xcf\x18/z\x00L\x07\xb1\xc9\xc4\xda\
+\x1e6\xcb\x10\x8f\xb1\x81\x830\x9e\xc3=\x06\xb38f\
+\xad\xfe\x00VE\xcf\xc3\x0c.D\xbdR\x1a\x8aty\
+&4\xa4\xbc\x98i\xe8-\xf3\x16E\xd0u\x8a\xf2\xb4\
+x\xe6o\xf1\x7f\xe1\x0b9[H\xc3C\xbd\xbe\xa9\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00\xcb\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00}IDATH\x89\xed\
+\x92K\x0e\x80 \x0cD\x9f\xc6\xa5\xb7\xf6\x00z2.\
+\x03kp#\x09\x06\x89U\xca\x0a^\xd2\x84_g\xc8\
+\x00\x0c\xbab\x03<\x10*\xcb_Z\x19VA<\x96\
+}2\x88\x9b\xb5\xdctf\xc9\xa1\x1a\xe3\x92\x81\x1aK\
+a}z\x99\xff2p\xc0\x8a\xce;\xb88H#:\
+\x94\xc4\x03\xb0\xd74\x7f\xbaD\xf3G\x96\x1a\x18\xf2o\
+k$\x8d\xe9\xef\xd0\xc8?\xd3n\x1e\x91\x94\x18QZ\
+\xa2\x88\x06\x1dp\x02\xf4\xeb@\x17\xb2\xd5\xe4S\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01 \
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xd2IDAT8\x8d\xcd\
+\xd1\xc1J\x82Q\x10\x05\xe0\xcf\x10w\xed\x03\xdd\xf4\x18\
+-\x02\xa3G\xa8@z\x86v\xe2S\xd4\x8f+_A\
+z\x8c\x04A_BZ\x09.\xdcH\x9bv\xb9p\x8c\
+\xdb\xf0W\xff\xd2\x03\x03\xf7\x0c3\xe7\x9e\x99\xe1Tp\
+\x8b\x0d\xbe\x1a\xc6&z\xb4B`\x8aKT\x0d?\x1c\
+\xe2\x1d\x8f\xedHt\xb0\xc6\x00wE\xe1\x03\xde\xf0\x11\
+\xfc\x1c\xdb\xa8\xeb\xc0YR\xae\xa2\xe9\x18K\xf4\xb1\x8a\
+\xe8g+\xed\xc4\x87\x85\x83\x16\xae0F7r\xe3p\
+\xfa\x8d\xbf\x1c\xc0\xc2\xcf\xbdT\x91k\xe4@\x08\xcdp\
+\x13|\xf7\xdf\x08\x15^\x0b\xbeD\x0fO\xc1_\xb2\xc0\
+\x11#\xf5\xf7\xbe\x8f\xa8\xe3\xa3\xd2\xc1s\xccv\x91\x84\
+\x17\x0e\x8b\xcc\xb9k\xcc\xf3\x08\xf3\xdf\xec%\xac\x15\x97\
+\xc8;\xa8\xc3'&\xc5\xfb\xc4\xb0\x07\xbck9\x84\xca\
+U)F\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01&\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xd8IDATh\x81\xed\
+\xd7A\x0e\xc2 \x10\x05\xd0\xafq\xafKO\xe7\xedz\
+\x04O\xd0\xfb\x10{\x02\xdc\xb4\xb1\x8e\xb4@\x03\xcc\x10\
+\xffK\xd8\x10\x1b\xfft\xcaT\x01\x22\x22\x22\xb2\xe5\x0e\
+`\x04\xe0\x8d\xadq\xce\x165\x18\x08\xbb\xb5\x06\x19\xf6\
+\x14(\xe0\x05\xe0\x9aR\xa9\x82\x09\xc0m\xbd\x11*\xc0\
+\xb7\xc9r\xd8W\xe6K\xee\x05\x0avo\xe8\xb9U\x8a\
+ZR:\xb0\x90wBv\xc6o\xecW\xd5}\x07X\
+\x80\xb6\x9c3\x10{\xb6U\xa6\xd5_t\xc0\xf4\x8b-\
+\xd4\x81\xa9y\x8at?\xd9B\x05<\x1b\x049*)\
+[W?\xa7kN\x8e\xd8\x9b\xbb\x88\xee\xa7\x10\x0b\xd0\
+V\xb2\x80\x07\x00\x87\xcf\xa1\x93\x96}7\x7f\xd6\x9cu\
+\xf8\xd8r\xa5\xbe\xb4\xfb\xbf\x94<\x03\xda\xba/\xa0$\
+\x95C\x5c\x92\x1c\xa3{\xe1M\x8eQ\x22\x22\x22\xca\xf5\
+\x06=\xeb\xa7\x8eu\xd8\x8c\xf7\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x014\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xe6IDAT8\x8d\xb5\
+\xd2?J\x03Q\x10\xc7\xf1\xcfF%\x8a`\xe1\x9fB\
+R\x8b\xa5\x18\xc8\x09l\xb4\x11\xac\xb4\x14\xc1Z\xc8\x19\
+\xbc\x82h\xb37\x10\x0bA\xa2\x95\x85\x9d\x9dGP\xbc\
+\x80ha\x17\x8b\xcc\x925\xec[\xb2\x88_\x18\x98\xf7\
+f\xe6\xf7\xfe\xcc\xf0Gf\x1a\xe6\xcfc\x07\xdf\xf8\x9c\
+\x0c\x1e#\xc7v\x8d\xc0=\x86\xf8@\x07\xb2\x08\xf4\xf0\
+\x1c\xfe;.\xb0T\xb2\xc5\x88\xeda!\xfc]<(\
+\x09\x0c\xc3^c\xbd\x89\xf5(.\x0e\xba\x8a\x9c\x01\xda\
+UOx\xc4Q\xe2\xfa\x19n\xb0\x5c\xf3Dk\xb8E\
+\xab\x22v\x80\xb3\xba\xe2\x82S\x9cL\xec\xb5q\x87\xb9\
+i\x04Zq\x8b\x95\xd2^\x1f\xfb\xd3\x14\x17l\xe12\
+\xfcU\x5c\x1b\x7f\xe4/f\x13\x02/\xf8\xc2\x06\x0eq\
+n\xf4\xfb\x8d\xe8\x1a\xb5\xf4M\xfdp%\xc9\x8dg#\
+O%U\xb5\xab\xe0)\xe17\xa2\x17\xf6\x7f\xfc\x00s\
+\xd2#\x85:\x13I\x12\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x01\xcb\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01}IDATX\x85\xed\
+\xd6\xbfN\x1bA\x10\xc7\xf1\x8f\x22\x14\xaaH\xa4H\x85\
+iB\xc7\x13\x90H\x91,(HC\xc5\x9f\x17\x80\x06\
+\xb9\xa1\xc8c\xa4N\x954)\x83)\x90\xe8\xe3\xce\x96\
+\x1b:\xe8h\x12\xb7$\x12-\x09\x14\xb7A\xeb\xcbq\
+\xe7=\x1f\x0d\xf2WZiogw\xe7\xa7\xd9\xd1\xcc\
+1c\xc68\xefp\x81\xdbG\x1a\x17\xc1G!\xaf\xf0\
+\xeb\x11\x9d\xff\x1bW\xc1\x17\x98\x8b\x04\xbc\xc5B\x98\x0f\
+0\xaa\x0eX\x12\x8bX\xc5\xcb\xe0\xeb$\xbfa;R\
+\xb9\xdd\xb0\xf3\x07\xef\x7f6\xe1\x81\xa2\xd1mBU\x99\
+\x80\x14v\xd1\x8a\xbe[a\xad\x92\xb9\x12\xdb\x08\xc7%\
+\xf6AN\xc0W|\x0e\xdf\xfb8\xc5\xb7i\x04\xf4\xa5\
+\xe5\xc2<:\x09\xfbQ/\x07bZ\xf8\x84\xcd\x82\xf3\
+\x9b\xc1\xd6*\xb0\xddS\x16\x81*^\xc8B\xbe\xf1\x80\
+\xfd9\x0e\xf0\x1a;u\x04T\xe5\xc05\xde\xa3\x8d/\
+\xc1Q\xcc%\xf6\xd0+\xb9\xa3\x91\x1c\xe8\xe1\xac@\xc0\
+Y\x95s\x9a\xab\x03\xb7\xf8.\x8bF;\xcc\xf3\xf9R\
+\xc849\x10sh\xbct\xaf\xc9J\xefT\x02R\xea\
+\xc0\x12\xde\xe4\xec?M\xd0O\x9a\xaa\x03\x1f\xb0\x95[\
+;\x9e\xe4|\x9c\x03\xbf\xa3\xf9\x91\xea\xb6\x9a\xd2\x0b\xba\
+\xe1\xce\xff|\xc5\x02z\x18&\x5cZ\x97\xa1,I1\
+\xfe\x047X\x97\x85sEu\xa3\xea'8\xed\xe3/\
+\xce\xf1\x11\x7f\x12\xceNDW\xcd'j\xaa\x1d\xd7\xe6\
+\xc9\x09\x18I\xfc\x97lJ\xc0\x0f\xd9\xbf\xc0r\x18\x9d\
+\xb06cF%wH\xe5\x93\x9b\xb1\xe4U\xc7\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00\xc7\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00yIDATh\x81\xed\
+\xd61\x0e\x80 \x0cF\xe1\xa7\x93\x8b\x9e\x9e\x13xD\
+=\x80.L\x8d&\x0e\x82\xa2\xefK\xba\x14\x862\xd0\
+\xfc I\xd2\x07\x0d@\x02\x96\x5c)\xf7\x9a\x91\x80-\
+T\x0aw\xe2y\xe9:\xd4\x9d\xf4\x17`\x0c\xbd\x15\x98\
+\xc2\x03j:\x9c\xb5\xaf<\xc4\xed\xce\x1e0_\xec\xbd\
+V\xf3\x9fX\x92\x9e\xd5\xfc\x1a5\x0b\x15`\x162\x0b\
+I\xd2\x7f4\xbfF\xcdB\x05\x98\x85\xccB\x92$)\
+\xd8\x01iU\x82\x9c\xce\x07\xf6\xbd\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x01F\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xf8IDATX\x85\xed\
+\x94\xcb\x0d\xc20\x0c@\x1f\x15b\x00\xee0\x06\xb4\x12\
+[\xd0.\x02s\xc0\x22\x15s\xf0\x19\x03\xb8v\x01.\
+p \x80e\x12h\x0a\xa1B\xed\x93\x22\xd9qk;\
+\xb1chii:\x1d\xa5\x0f\x81Q\xe0\x98;`o\
+3\xf4\x81\x028\x07^\x85\x89\x05@$\x12\x98HC\
+@\xfa&\x16\x00]a\xe8\x09y\x09\xac\xbf\x1c8\x01\
+f:V\xd7\xfe-k`\x03\xc4F\xdf\x00G#\xa7\
+J\xff\x88\xe8\x85-\x06r\xb3b\xb1\xaf\xf5`\x09\xfc\
+\x04W\x09\xe0z\xcd\x99\x90odJ\x0f\x92@\xa2t\
+}\xe5UJ\xa0}>%p\x12\xf2L\x7f\xf8eN\
+\xb6\xcdZ\x06\xd1'\xa3X\xbek\x9f\xb9\xe1\x1c\xc5\xbe\
+\xa4<N\x95VuR\xfb3\xacB\x8e\xbb\xbe\xb9\xaf\
+3\xd9\x03\x090/\xf1\xcf\xf4\x8d}U\xc2\xc7\x02K\
+\xcf\xc8\x9a\x86^\xf7\x9e\xf9\xcb\x1e8\xe0>\xd9\xc1\xd7\
+\x99\x9e\x03e\x18\x00c\x87m[%\x89\x96\x96fs\
+\x01\x0c0|A(\xf2R\xf3\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x00\xf3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xa5IDATH\x89\xed\
+\x94I\x0e\x80 \x0cE\xbf\xc6\x83\xe1\xdaK\xc3i\xf4\
+\x16\xb8\xa9I\x19J\x19$q\xe1K\xba\xa1\xf0;h\
+\x0b\xfc4p\x008\x01\xf8A;I+\xe1\x0dq\x1e\
+$\xe1q\x8e\x12\xe8l\x85K9\x96\xd6hk\xeb\x03\
+\xc2\x020d\xb6t\x91g\xe43g\x12q\x85\xa2\x8e\
+TA\xfc\xd1\x1e\x0c\xf2\x19[\xf2%\xf4\xb6\xa8\x9a\xcf\
+\xb4(n\x95\x03\xb0\x93\xb9R&R\xe4\x91\xdf4\xa8\
+@\x9a\x03M\xa8\xd4\xa2\x00\xde\xa2\x8b=\xd6Z\xa4\x05\
+\xber\xce\x9ae\xc7\x85\xa4\xf3`\xd95\x8f~\x94\xa9\
+\xaa3}\x0e\xa6\x07\xe8\xc5\xa2r\xd9\xfd\xa8\xdc\xc8\xd5\
+`B\xf1\x1fG\x82\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x02&\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01\xd8IDATX\x85\xed\
+\xd6=h\x14A\x14\xc0\xf1\xdf\x19#\xc4\x04m\x04\x0f\
+D1\xad\x86\xa4V\xabk\xb4\x89\xa8\xa5)l\x02\x16\
+\xda\x08I\xa3\xf6V\xb6\xda\x9c\xd8XY\x05\xac\xe27\
+X\x99V\x0b\xed\x04\x91\x14V^\xfc\x84\x80\xb1\x98]\
+\xb27\xee\xdem\xf6\xf6\x92&\x7fx\xb0\xb33\xefc\
+f\xde\xcc\x1bv\xd9aF\x86l\xff(\x16p\x05M\
+\xbc\xc3\xdf2\x8aM\x9c\xc3\x14\x1a\x15\x9dO\xa3\x83\x8d\
+\x8c\xbc\xc1h?\xc5E\xacg\x94\x96q\xa0B\x00\xcf\
+#\xe7\xa9\x5c\xcd\x0e\x8ag\xd7\xc2\xab\x1cc\xf7q=\
+\xf9\x1e\xc1\x04\x0e&\x81\xa5\x12\xb7\x170\x9ec\xeb!\
+\xe6\xd3\xc6\xde\xa8\xf3R\xc1l\xe6p11<Q0\
+f\x03k\x19\xf9\x8a\xc9\x9cq_\xb2\x8d8\x80\x22\xfe\
+\xe0\xae\xb0\xa7\xa9\x83\xec\xf7\x1a~\xeaN\xb0y<\x88\
+\xect\xd0\xee\xe5\xa8%\x7f\xdf\xee\x95\x0c4K\x03\xbf\
+\x13\xfd\x0e\x9e\x09\x89\xd9\x978\x09\x9f\xaa\x96\x84\xa7\x12\
+\xfd\xf3\x15t5q\x16K\xfa,Y\x01{\xf0\x16/\
+U?\xc6\xe0\x820\x8b3[\xd4\xbb,\xe4\xc3\xcc \
+\xceS\x9e\xe0\xbd\x12\x17H\xc2\x18>\xfb?\x01+s\
+\x1c\xbf\x84\xdc(\xc3-\xfc\x10\xb6\xb16n&F\x8f\
+\xf5\x19\xd7\xc4w\xdc\xae\xd39\xec\xc3\x07!){\xd1\
+\x16\x96\x7f\xac\xee\x00\xd8\xbc#f\x0b\xfag\x84\xc4\x9b\
+\x1b\x86\xf3\x94G\xf8\x84\xfd\xd1\xff\x06^`E8\x82\
+C\xe30\xbe\xe1N\xf4\x7fVX\x9d\xd3\xc3t\x9er\
+M\xb8)O$\xedQ|\xc4\xe3\xedpN(\xc7+\
+\xb8\x91\xb4\xa7\xb1*\x1c\xd7m\xe3\x90P\xa0V\x13i\
+\xabV/*\xd1\x10\x0aT\x5c1\x97\x0dx\xef\x97e\
+*\xc7y*'\xb7j\xac\xca\x919R\xb1\xaf6\x9a\
+\xba\xdf\x0b\xa9\xac\xab\xf9\xfe\xef\xc5bN\x00e\x8bU\
+\x17\x83$M\xcb\xe6#v\x09\xaf\x07\xb0\xb5\xcb\xce\xf1\
+\x0ffCv\xd0\xbd\xa0r\xd8\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x01\x92\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01DIDATh\x81\xed\
+\x98=n\xc30\x0cF_\x8bN\xed\x15\x92\xbb\xa8\xf7\
+m\xe6vT\x0e\x94\xd1^\xd3\xa1\x16\xd0\x10\x94-\xd9\
+\xfaq\x0c>@Cd!\xfa>\x93\x22,\x82a\x18\
+\xc6\x1e9\x03\x17`\x00\xee\x9d\xc70i9\xa5\x8a?\
+\x01\xb7\x1d\x08\x97\xe3\x96j\xe2\xb2\x03\xb1\xb1\xf1%\xc5\
+\xbe(\x06\x06\xe0=\xc5i\x07F\xe0\xe3\xff\x84f\xe0\
+.~kkZ2\xab\xe7\xb5\xa1\x90*\xbce\xac\x95\
+ob\x89&\x91{\xfa\x08\xb44\xe0\x01\xa7\xcc\xbb\xe9\
+Y1d\xe9\x8a\xcd/\x8d\xd8\xff\xfaIt\x10\x1e[\
+\xbf\xa4\x07h[\x85\x96\xcePl\x9fcW\xa1\x1c\x03\
+\xb9)\x13p\xa4\xe5\xb8G?#\xd9\xac=\x03\x12\xc7\
+c\x8e\xa7\x0eidv\x9f\xa7O!\x8dR\x11\x088\
+\xd2\x22\xe1\xd1S\xc8\xaa\xd0\xae)Y\x85RS\xea\x0a\
+|N\xe3\x9a/9_hl>\xd7\x80g\xdd\xa7D\
+\xb13\xd0\xebk\xf4\xd8g \xe7>\xb0\xf5\x8d\xae\xad\
+B\xb3\x1c2\x02#\x8f\x97\xfa\xdc\xdc\x0f\xd4\x88\xd8(\
+'\xb4\x08|o\xdc\xb8&?)\x8bJ5\xb6$[\
+\xd7'7\xb6\x82\x89\xad\xad\xc5R\x06\x06\xfe\x1aZ\xaa\
+\xf8\x96=\x1f\xabB\x1af\xa07f\xa07=\x0cT\
+\xbf\x0f\xd4\xc2\xd3\xa8\xb5h\x18\x86\xd1\x8e_4\xb5E\
+\x14\x83\xaa\x8e\x94\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x00\x9c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00NIDATH\x89c\
+`\x18\x05\x03\x0d\x18\x91\xd8L\x0c\x0c\x0c^P\xf66\
+\x06\x06\x86\x7f\xd4\xb6\xcc\x87\x81\x81\xe1?\x14{C\xc5\
+\xfe\x93\x89Q\x5cMS\x80\x1eD\x9eP\xf6v\x06\x1a\
+\x04\xd1\xd0\x04\xa3\xa9\x88 \x18ME\x04\xc1h*\x22\
+\x08FS\xd1\x08\x00\x003j=\xa2\x12-\xf3\xd8\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+"
 
-static const unsigned char qt_resource_name[] = {
-  // icons
-  0x0,0x5,
-  0x0,0x6f,0xa6,0x53,
-  0x0,0x69,
-  0x0,0x63,0x0,0x6f,0x0,0x6e,0x0,0x73,
-    // dns.svg
-  0x0,0x7,
-  0xb,0x56,0x5a,0x7,
-  0x0,0x64,
-  0x0,0x6e,0x0,0x73,0x0,0x2e,0x0,0x73,0x0,0x76,0x0,0x67,
-    // security.svg
-  0x0,0xc,
-  0xf,0x8f,0x3,0xe7,
-  0x0,0x73,
-  0x0,0x65,0x0,0x63,0x0,0x75,0x0,0x72,0x0,0x69,0x0,0x74,0x0,0x79,0x0,0x2e,0x0,0x73,0x0,0x76,0x0,0x67,
-    // network.svg
-  0x0,0xb,
-  0x6,0x67,0xcd,0x7,
-  0x0,0x6e,
-  0x0,0x65,0x0,0x74,0x0,0x77,0x0,0x6f,0x0,0x72,0x0,0x6b,0x0,0x2e,0x0,0x73,0x0,0x76,0x0,0x67,
-  
-};
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x1b\
+\x0dI\xb3\xa7\
+\x00f\
+\x00o\x00r\x00m\x00a\x00t\x00-\x00l\x00i\x00s\x00t\x00-\x00b\x00u\x00l\x00l\x00e\
+\x00t\x00e\x00d\x00-\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x1e\
+\x0d\xd4\xfe\x07\
+\x00f\
+\x00o\x00r\x00m\x00a\x00t\x00-\x00l\x00i\x00s\x00t\x00-\x00b\x00u\x00l\x00l\x00e\
+\x00t\x00e\x00d\x00-\x001\x006\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x17\
+\x03|3\xa7\
+\x00g\
+\x00r\x00a\x00p\x00h\x00-\x00o\x00u\x00t\x00l\x00i\x00n\x00e\x00-\x002\x004\x00@\
+\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x1d\
+\x05\x92\xa7\xc7\
+\x00s\
+\x00e\x00r\x00v\x00e\x00r\x00-\x00n\x00e\x00t\x00w\x00o\x00r\x00k\x00-\x00o\x00u\
+\x00t\x00l\x00i\x00n\x00e\x00-\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x14\
+\x0b(Y'\
+\x00g\
+\x00r\x00a\x00p\x00h\x00-\x00o\x00u\x00t\x00l\x00i\x00n\x00e\x00-\x002\x004\x00.\
+\x00p\x00n\x00g\
+\x00\x1d\
+\x05\x8c\xa7\xc7\
+\x00s\
+\x00e\x00r\x00v\x00e\x00r\x00-\x00n\x00e\x00t\x00w\x00o\x00r\x00k\x00-\x00o\x00u\
+\x00t\x00l\x00i\x00n\x00e\x00-\x002\x004\x00.\x00p\x00n\x00g\
+\x00\x1a\
+\x0b\xd2\xd0\xe7\
+\x00c\
+\x00e\x00r\x00t\x00i\x00f\x00i\x00c\x00a\x00t\x00e\x00-\x00o\x00u\x00t\x00l\x00i\
+\x00n\x00e\x00-\x001\x006\x00.\x00p\x00n\x00g\
+\x00 \
+\x0c\x93\xe7'\
+\x00s\
+\x00e\x00r\x00v\x00e\x00r\x00-\x00n\x00e\x00t\x00w\x00o\x00r\x00k\x00-\x00o\x00u\
+\x00t\x00l\x00i\x00n\x00e\x00-\x002\x004\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x14\
+\x0b6Y'\
+\x00g\
+\x00r\x00a\x00p\x00h\x00-\x00o\x00u\x00t\x00l\x00i\x00n\x00e\x00-\x001\x006\x00.\
+\x00p\x00n\x00g\
+\x00\x1d\
+\x0b\xe0-g\
+\x00c\
+\x00e\x00r\x00t\x00i\x00f\x00i\x00c\x00a\x00t\x00e\x00-\x00o\x00u\x00t\x00l\x00i\
+\x00n\x00e\x00-\x001\x006\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x1e\
+\x0d\xd4\xfcG\
+\x00f\
+\x00o\x00r\x00m\x00a\x00t\x00-\x00l\x00i\x00s\x00t\x00-\x00b\x00u\x00l\x00l\x00e\
+\x00t\x00e\x00d\x00-\x002\x004\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00 \
+\x0c\x93\xe5g\
+\x00s\
+\x00e\x00r\x00v\x00e\x00r\x00-\x00n\x00e\x00t\x00w\x00o\x00r\x00k\x00-\x00o\x00u\
+\x00t\x00l\x00i\x00n\x00e\x00-\x001\x006\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x1a\
+\x0b\xcc\xd0\xe7\
+\x00c\
+\x00e\x00r\x00t\x00i\x00f\x00i\x00c\x00a\x00t\x00e\x00-\x00o\x00u\x00t\x00l\x00i\
+\x00n\x00e\x00-\x002\x004\x00.\x00p\x00n\x00g\
+\x00\x17\
+\x03|1\xe7\
+\x00g\
+\x00r\x00a\x00p\x00h\x00-\x00o\x00u\x00t\x00l\x00i\x00n\x00e\x00-\x001\x006\x00@\
+\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x1d\
+\x0b\xe0/'\
+\x00c\
+\x00e\x00r\x00t\x00i\x00f\x00i\x00c\x00a\x00t\x00e\x00-\x00o\x00u\x00t\x00l\x00i\
+\x00n\x00e\x00-\x002\x004\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x1b\
+\x0dW\xb3\xa7\
+\x00f\
+\x00o\x00r\x00m\x00a\x00t\x00-\x00l\x00i\x00s\x00t\x00-\x00b\x00u\x00l\x00l\x00e\
+\x00t\x00e\x00d\x00-\x002\x004\x00.\x00p\x00n\x00g\
+"
 
-static const unsigned char qt_resource_struct[] = {
-  // :
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x1,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/icons
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x2,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/icons/icons
-  0x0,0x0,0x0,0x0,0x0,0x2,0x0,0x0,0x0,0x3,0x0,0x0,0x0,0x3,
-0x0,0x0,0x0,0x0,0x0,0x0,0x0,0x0,
-  // :/icons/icons/network.svg
-  0x0,0x0,0x0,0x42,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x2,0x9a,
-0x0,0x0,0x1,0x95,0x91,0x77,0xb2,0xb7,
-  // :/icons/icons/dns.svg
-  0x0,0x0,0x0,0x10,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x0,0x0,
-0x0,0x0,0x1,0x95,0x91,0x77,0xa2,0x8e,
-  // :/icons/icons/security.svg
-  0x0,0x0,0x0,0x24,0x0,0x0,0x0,0x0,0x0,0x1,0x0,0x0,0x1,0x50,
-0x0,0x0,0x1,0x95,0x91,0x77,0xa9,0xe0,
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x10\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x03 \x00\x00\x00\x00\x00\x01\x00\x00\x0f\xaa\
+\x00\x00\x01\xa1U0\x04L\
+\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x01C\
+\x00\x00\x01\xa1U0\x04M\
+\x00\x00\x010\x00\x00\x00\x00\x00\x01\x00\x00\x06z\
+\x00\x00\x01\xa1U0\x04P\
+\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00\x04\x08\
+\x00\x00\x01\xa1U0\x04N\
+\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x00\x04\xfa\
+\x00\x00\x01\xa1U0\x04M\
+\x00\x00\x01\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x09\x97\
+\x00\x00\x01\xa1U0\x04K\
+\x00\x00\x02\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xb3\
+\x00\x00\x01\xa1U0\x04D\
+\x00\x00\x01p\x00\x00\x00\x00\x00\x01\x00\x00\x07I\
+\x00\x00\x01\xa1U0\x04B\
+\x00\x00\x02\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xcf\
+\x00\x00\x01\xa1U0\x04C\
+\x00\x00\x03T\x00\x00\x00\x00\x00\x01\x00\x00\x11\xd4\
+\x00\x00\x01\xa1U0\x04F\
+\x00\x00\x02\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x0di\
+\x00\x00\x01\xa1U0\x04O\
+\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x08m\
+\x00\x00\x01\xa1U0\x04Q\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1U0\x04G\
+\x00\x00\x03\x94\x00\x00\x00\x00\x00\x01\x00\x00\x13j\
+\x00\x00\x01\xa1U0\x04I\
+\x00\x00\x02^\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x9e\
+\x00\x00\x01\xa1U0\x04J\
+\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x00\x00\x89\
+\x00\x00\x01\xa1U0\x04H\
+"
 
-};
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-#ifdef QT_NAMESPACE
-#  define QT_RCC_PREPEND_NAMESPACE(name) ::QT_NAMESPACE::name
-#  define QT_RCC_MANGLE_NAMESPACE0(x) x
-#  define QT_RCC_MANGLE_NAMESPACE1(a, b) a##_##b
-#  define QT_RCC_MANGLE_NAMESPACE2(a, b) QT_RCC_MANGLE_NAMESPACE1(a,b)
-#  define QT_RCC_MANGLE_NAMESPACE(name) QT_RCC_MANGLE_NAMESPACE2( \
-        QT_RCC_MANGLE_NAMESPACE0(name), QT_RCC_MANGLE_NAMESPACE0(QT_NAMESPACE))
-#else
-#   define QT_RCC_PREPEND_NAMESPACE(name) name
-#   define QT_RCC_MANGLE_NAMESPACE(name) name
-#endif
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-#if defined(QT_INLINE_NAMESPACE)
-inline namespace QT_NAMESPACE {
-#elif defined(QT_NAMESPACE)
-namespace QT_NAMESPACE {
-#endif
-
-bool qRegisterResourceData(int, const unsigned char *, const unsigned char *, const unsigned char *);
-bool qUnregisterResourceData(int, const unsigned char *, const unsigned char *, const unsigned char *);
-
-#ifdef QT_NAMESPACE
-}
-#endif
-
-int QT_RCC_MANGLE_NAMESPACE(qInitResources)();
-int QT_RCC_MANGLE_NAMESPACE(qInitResources)()
-{
-    int version = 3;
-    QT_RCC_PREPEND_NAMESPACE(qRegisterResourceData)
-        (version, qt_resource_struct, qt_resource_name, qt_resource_data);
-    return 1;
-}
-
-int QT_RCC_MANGLE_NAMESPACE(qCleanupResources)();
-int QT_RCC_MANGLE_NAMESPACE(qCleanupResources)()
-{
-    int version = 3;
-    QT_RCC_PREPEND_NAMESPACE(qUnregisterResourceData)
-       (version, qt_resource_struct, qt_resource_name, qt_resource_data);
-    return 1;
-}
-
-#ifdef __clang__
-#   pragma clang diagnostic push
-#   pragma clang diagnostic ignored "-Wexit-time-destructors"
-#endif
-
-namespace {
-   struct initializer {
-       initializer() { QT_RCC_MANGLE_NAMESPACE(qInitResources)(); }
-       ~initializer() { QT_RCC_MANGLE_NAMESPACE(qCleanupResources)(); }
-   } dummy;
-}
-
-#ifdef __clang__
-#   pragma clang diagnostic pop
-#endif
+qInitResources()
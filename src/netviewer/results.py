@@ -0,0 +1,458 @@
+"""
+Virtualized result table for NetViewer tools
+
+Results are kept column by column in plain Python lists so that appending a
+batch of rows is cheap, and only the rows actually visible in the view are
+ever turned into display strings. Sorting and filtering are done by the
+proxy directly on those lists, so neither calls back into the model per
+comparison.
+"""
+from collections import namedtuple
+import operator
+import re
+
+from PySide6.QtCore import (
+    Qt,
+    QAbstractProxyModel,
+    QAbstractTableModel,
+    QModelIndex,
+)
+from PySide6.QtWidgets import QTableView, QAbstractItemView, QHeaderView
+
+
+# A result column: dictionary key, header title, whether values are numeric and
+# an optional callable used to turn a stored value into display text
+Column = namedtuple(
+    "Column", ["key", "title", "numeric", "formatter"], defaults=(False, None)
+)
+
+# Sort key used for missing numeric values so they sort after real values
+_MISSING_NUMBER = float("inf")
+
+_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_CONDITION_RE = re.compile(r"^\s*(\w+)\s*(<=|>=|==|!=|<|>|=|~)\s*(.+?)\s*$")
+
+
+class FilterError(ValueError):
+    """Raised when a filter expression cannot be parsed"""
+
+
+class ResultTableModel(QAbstractTableModel):
+    """Columnar table model that supports incremental appends"""
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._keys = [column.key for column in self.columns]
+        self._data = {key: [] for key in self._keys}
+        self._row_count = 0
+
+    def column_index(self, key):
+        """Return the index of the column with the given key"""
+        return self._keys.index(key)
+
+    def column_values(self, key):
+        """Return the stored values of a column (not a copy)"""
+        return self._data[key]
+
+    def sort_key(self, column, row):
+        """Sort key of a cell, of a single type per column"""
+        value = self._data[self.columns[column].key][row]
+        if self.columns[column].numeric:
+            return _MISSING_NUMBER if value is None else float(value)
+        return "" if value is None else str(value)
+
+    def sort_keys(self, column):
+        """Sort keys of every row in a column"""
+        if self.columns[column].numeric:
+            return [
+                _MISSING_NUMBER if value is None else float(value)
+                for value in self._data[self.columns[column].key]
+            ]
+        return [
+            "" if value is None else str(value)
+            for value in self._data[self.columns[column].key]
+        ]
+
+    def row_dict(self, row):
+        """Return a single row as a dictionary"""
+        return {key: self._data[key][row] for key in self._keys}
+
+    def rows(self):
+        """Iterate over all rows as dictionaries"""
+        for row in range(self._row_count):
+            yield self.row_dict(row)
+
+    def append_rows(self, rows):
+        """Append a batch of row dictionaries to the end of the model"""
+        rows = list(rows)
+        if not rows:
+            return
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for key in self._keys:
+            self._data[key].extend(row.get(key) for row in rows)
+        self._row_count += len(rows)
+        self.endInsertRows()
+
+    def append_row(self, row):
+        """Append a single row dictionary"""
+        self.append_rows([row])
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        # Emptied in place so that column_values() references stay valid
+        for values in self._data.values():
+            values.clear()
+        self._row_count = 0
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = self.columns[index.column()]
+        value = self._data[column.key][index.row()]
+        if role == Qt.DisplayRole:
+            if value is None:
+                return ""
+            if column.formatter is not None:
+                return column.formatter(value)
+            return str(value)
+        if role == Qt.UserRole:
+            return self.sort_key(index.column(), index.row())
+        if role == Qt.TextAlignmentRole and column.numeric:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section].title
+        return str(section + 1)
+
+
+class ResultFilterProxyModel(QAbstractProxyModel):
+    """Sort/filter proxy for a ResultTableModel
+
+    Filter expressions are either free text, matched against every column, or
+    one or more ``column op value`` conditions joined with ``and``, e.g.
+    ``days_until_expiry < 30 and issuer ~ Let's Encrypt``.
+
+    The filter is kept as a mask over source rows and the sort as a list of
+    (key, source row) pairs built once from the model's column lists. The
+    shown rows are the sorted rows the mask accepts. Rows appended to the
+    source are merged into both rather than re-sorting or re-filtering
+    everything.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._expression = ""
+        self._predicate = None
+        self._mask = None
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._sorted = None
+        self._rows = []
+        self._proxy_rows = None
+
+    def setSourceModel(self, model):
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelAboutToBeReset.disconnect(self.beginResetModel)
+            previous.modelReset.disconnect(self._source_reset)
+            previous.rowsInserted.disconnect(self._source_rows_inserted)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        if model is not None:
+            model.modelAboutToBeReset.connect(self.beginResetModel)
+            model.modelReset.connect(self._source_reset)
+            model.rowsInserted.connect(self._source_rows_inserted)
+        self._rebuild()
+        self.endResetModel()
+
+    # Mapping
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(
+            self._rows[proxy_index.row()], proxy_index.column()
+        )
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._proxy_rows is None:
+            self._proxy_rows = {row: i for i, row in enumerate(self._rows)}
+        row = self._proxy_rows.get(source_index.row())
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        return super().headerData(section, orientation, role)
+
+    # Sorting and filtering
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort by a column, or restore source order if column is -1"""
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        self._sort_column = column
+        self._sort_order = order
+        self._sorted = self._sort_all()
+        self._rows = self._shown_rows()
+        self._proxy_rows = None
+        self._update_persistent(old_rows)
+        self.layoutChanged.emit()
+
+    def set_filter_expression(self, expression):
+        """Apply a filter expression, raising FilterError if it is invalid"""
+        predicate = self._compile(expression) if expression.strip() else None
+        self.beginResetModel()
+        self._expression = expression
+        self._predicate = predicate
+        self._mask = self._build_mask(0, self.sourceModel().rowCount())
+        self._rows = self._shown_rows()
+        self._proxy_rows = None
+        self.endResetModel()
+
+    def _build_mask(self, first, end):
+        if self._predicate is None:
+            return None
+        return bytearray(self._predicate(row) for row in range(first, end))
+
+    def _sort_all(self):
+        if self._sort_column < 0:
+            return None
+        keys = self.sourceModel().sort_keys(self._sort_column)
+        return sorted(zip(keys, range(len(keys))))
+
+    def _shown_rows(self):
+        """Source rows shown, in display order"""
+        mask = self._mask
+        if self._sorted is None:
+            rows = range(self.sourceModel().rowCount())
+            return [row for row in rows if mask[row]] if mask else list(rows)
+        if mask is None:
+            rows = [row for _, row in self._sorted]
+        else:
+            rows = [row for _, row in self._sorted if mask[row]]
+        if self._sort_order == Qt.DescendingOrder:
+            rows.reverse()
+        return rows
+
+    def _rebuild(self):
+        if self.sourceModel() is None:
+            self._mask, self._sorted, self._rows = None, None, []
+        else:
+            if self._predicate is not None:
+                self._predicate = self._compile(self._expression)
+            self._mask = self._build_mask(0, self.sourceModel().rowCount())
+            self._sorted = self._sort_all()
+            self._rows = self._shown_rows()
+        self._proxy_rows = None
+
+    def _source_reset(self):
+        self._rebuild()
+        self.endResetModel()
+
+    def _source_rows_inserted(self, parent, first, last):
+        """Merge rows appended to the source into the mask and sort order"""
+        end = last + 1
+        if self._mask is not None:
+            self._mask.extend(self._build_mask(first, end))
+        accepted = [
+            row for row in range(first, end) if self._mask is None or self._mask[row]
+        ]
+        if self._sorted is not None:
+            model = self.sourceModel()
+            # Two sorted runs, which the sort merges in linear time
+            self._sorted.extend(sorted(
+                (model.sort_key(self._sort_column, row), row)
+                for row in range(first, end)
+            ))
+            self._sorted.sort()
+        if not accepted:
+            return
+        if self._sorted is None:
+            new_rows = self._rows + accepted
+        else:
+            new_rows = self._shown_rows()
+
+        # Insert each run of consecutive new rows with a single signal
+        added = set(accepted)
+        positions = [i for i, row in enumerate(new_rows) if row in added]
+        runs = []
+        for position in positions:
+            if runs and runs[-1][1] == position:
+                runs[-1][1] = position + 1
+            else:
+                runs.append([position, position + 1])
+        for start, stop in runs:
+            self.beginInsertRows(QModelIndex(), start, stop - 1)
+            self._rows[start:start] = new_rows[start:stop]
+            self._proxy_rows = None
+            self.endInsertRows()
+
+    def _update_persistent(self, old_rows):
+        """Move persistent indexes (e.g. the selection) to their new rows"""
+        persistent = self.persistentIndexList()
+        if not persistent:
+            return
+        new_positions = {row: i for i, row in enumerate(self._rows)}
+        updated = []
+        for index in persistent:
+            row = new_positions.get(old_rows[index.row()])
+            updated.append(
+                QModelIndex() if row is None
+                else self.createIndex(row, index.column())
+            )
+        self.changePersistentIndexList(persistent, updated)
+
+    def _compile(self, expression):
+        """Compile a filter expression into a row predicate"""
+        model = self.sourceModel()
+        parts = re.split(r"\s+and\s+", expression.strip(), flags=re.IGNORECASE)
+        conditions = [_CONDITION_RE.match(part) for part in parts]
+
+        if not all(conditions):
+            # Free text search across all columns
+            text = expression.strip().lower()
+            values = [model.column_values(column.key) for column in model.columns]
+
+            def matches_text(row):
+                return any(
+                    v[row] is not None and text in str(v[row]).lower()
+                    for v in values
+                )
+            return matches_text
+
+        checks = []
+        for match in conditions:
+            key, op, raw = match.groups()
+            try:
+                column = model.columns[model.column_index(key)]
+            except ValueError:
+                raise FilterError(f"Unknown column: {key}")
+            compare = _OPERATORS.get(op)
+            if op == "~":
+                checks.append(
+                    self._text_check(model.column_values(key), raw.lower())
+                )
+            elif column.numeric:
+                try:
+                    target = float(raw)
+                except ValueError:
+                    raise FilterError(f"Expected a number for {key}: {raw}")
+                checks.append(
+                    self._value_check(model.column_values(key), compare, target)
+                )
+            else:
+                checks.append(
+                    self._value_check(
+                        model.column_values(key), compare, raw.strip("'\"")
+                    )
+                )
+
+        def matches_all(row):
+            return all(check(row) for check in checks)
+        return matches_all
+
+    @staticmethod
+    def _value_check(values, compare, target):
+        def check(row):
+            value = values[row]
+            if value is None:
+                return False
+            try:
+                return compare(type(target)(value), target)
+            except (TypeError, ValueError):
+                return False
+        return check
+
+    @staticmethod
+    def _text_check(values, text):
+        def check(row):
+            value = values[row]
+            return value is not None and text in str(value).lower()
+        return check
+
+
+class ResultTableView(QTableView):
+    """Table view configured for large, uniformly sized result sets"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortingEnabled(True)
+        self.setAlternatingRowColors(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setWordWrap(False)
+        # Fixed row heights and interactive column widths avoid Qt measuring
+        # every row's contents, which is what keeps large tables responsive
+        vertical = self.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(24)
+        vertical.setVisible(False)
+        horizontal = self.horizontalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal.setStretchLastSection(True)
+        self.setStyleSheet("""
+            QTableView {
+                border: none;
+                padding: 0;
+                font-size: 13px;
+                color: #333333;
+                alternate-background-color: #fafafa;
+            }
+            QHeaderView::section {
+                background-color: #f5f5f5;
+                color: #666666;
+                border: none;
+                border-bottom: 1px solid #e0e0e0;
+                padding: 4px 8px;
+            }
+        """)
@@ -0,0 +1,326 @@
+"""
+Local HTTP/JSON API for the NetViewer tools
+
+Started with ``python -m netviewer serve``. Endpoints:
+
+    GET /ssl?host=example.com     certificate details (same row as exports)
+    GET /dns?host=example.com     IPv4 and IPv6 addresses
+    GET /ip?address=192.0.2.1     address details and reverse DNS
+    GET /health                   server status
+
+The server runs on asyncio using only the standard library. Lookups are
+blocking, so they run on a thread pool. Concurrent requests for the same
+lookup share one in-flight call, and results are kept in a shared TTL cache;
+failed lookups are cached for a shorter time.
+"""
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from .resilience import LookupFailure, ensure_workers
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Seconds results are cached for
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_ERROR_TTL = 30.0
+DEFAULT_CACHE_SIZE = 10000
+
+# Threads available for running blocking lookups
+DEFAULT_WORKERS = 32
+
+# Largest request line or header accepted, in bytes
+MAX_LINE_LENGTH = 8192
+
+
+class ResultCache:
+    """Bounded LRU cache whose entries expire after a per-entry TTL"""
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value, ttl):
+        """Cache value for ttl seconds"""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class LookupService:
+    """Runs lookups with request coalescing and a shared result cache
+
+    Lookups are registered by name with a blocking function taking a single
+    argument. A lookup returns (ok, result) where result is either the
+    function's return value or a LookupFailure as a dictionary. Unexpected
+    exceptions are reported as failures of type "internal"; neither those nor
+    "busy" failures, which say nothing about the host, are cached.
+    """
+
+    def __init__(self, cache_ttl=DEFAULT_CACHE_TTL, error_ttl=DEFAULT_ERROR_TTL,
+                 cache_size=DEFAULT_CACHE_SIZE, workers=DEFAULT_WORKERS):
+        self.cache_ttl = cache_ttl
+        self.error_ttl = error_ttl
+        self.cache = ResultCache(cache_size)
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="netviewer-api"
+        )
+        # Each worker runs one lookup phase at a time on the deadline pool
+        ensure_workers(workers)
+        self.lookups = {}
+        self._in_flight = {}
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "lookups": 0}
+
+    def register(self, name, func):
+        """Register a blocking lookup function under a name"""
+        self.lookups[name] = func
+
+    @property
+    def in_flight(self):
+        """Number of lookups currently running"""
+        return len(self._in_flight)
+
+    async def lookup(self, name, argument):
+        """Look up argument with the named lookup"""
+        self.stats["requests"] += 1
+        key = (name, argument.lower())
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._run(name, argument)
+            ok, value = result
+            if ok:
+                self.cache.put(key, result, self.cache_ttl)
+            elif value["type"] not in ("internal", "busy"):
+                self.cache.put(key, result, self.error_ttl)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception so it isn't reported as never retrieved
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def _run(self, name, argument):
+        self.stats["lookups"] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            value = await loop.run_in_executor(
+                self.executor, self.lookups[name], argument
+            )
+        except LookupFailure as e:
+            return False, e.to_dict()
+        except Exception as e:
+            return False, {
+                "host": argument,
+                "phase": name,
+                "type": "internal",
+                "message": str(e) or type(e).__name__,
+                "attempts": 1,
+            }
+        return True, value
+
+    def close(self):
+        """Stop the worker threads"""
+        self.executor.shutdown(wait=False)
+
+
+class APIServer:
+    """Minimal asyncio HTTP/1.1 server exposing a LookupService as JSON"""
+
+    # Endpoint path: (lookup name, query parameter)
+    ROUTES = {
+        "/ssl": ("ssl", "host"),
+        "/dns": ("dns", "host"),
+        "/ip": ("ip", "address"),
+    }
+
+    # HTTP status for each LookupFailure kind; anything else is 502
+    ERROR_STATUS = {
+        "internal": HTTPStatus.INTERNAL_SERVER_ERROR,
+        "invalid": HTTPStatus.BAD_REQUEST,
+        "timeout": HTTPStatus.GATEWAY_TIMEOUT,
+        "circuit_open": HTTPStatus.SERVICE_UNAVAILABLE,
+        "busy": HTTPStatus.SERVICE_UNAVAILABLE,
+    }
+
+    def __init__(self, service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.service = service
+        self.host = host
+        self.port = port
+        self._started = time.monotonic()
+
+    async def serve_forever(self):
+        """Accept connections until cancelled"""
+        server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_LINE_LENGTH
+        )
+        addresses = ", ".join(
+            f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}"
+            for sock in server.sockets
+        )
+        print(f"NetViewer API listening on {addresses}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection, honouring keep-alive"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers = request
+                status, body = await self.dispatch(method, target)
+                keep_alive = self._keep_alive(version, headers)
+                await self._write_response(writer, status, body, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except (ValueError, asyncio.LimitOverrunError):
+            await self._write_response(
+                writer, HTTPStatus.BAD_REQUEST,
+                {"error": "Malformed request"}, False,
+            )
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        method, target, version = line.decode("latin-1").split()
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        if length:
+            await reader.readexactly(length)  # Request bodies are ignored
+        return method, target, version, headers
+
+    @staticmethod
+    def _keep_alive(version, headers):
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    @staticmethod
+    async def _write_response(writer, status, body, keep_alive):
+        payload = json.dumps(body, default=str).encode()
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
+
+    async def dispatch(self, method, target):
+        """Route a request, returning (status, JSON body)"""
+        if method != "GET":
+            return (
+                HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Only GET is supported"}
+            )
+        url = urlsplit(target)
+        if url.path == "/health":
+            return HTTPStatus.OK, {
+                "status": "ok",
+                "uptime_s": round(time.monotonic() - self._started, 1),
+                "cache_entries": len(self.service.cache),
+                "in_flight": self.service.in_flight,
+                **self.service.stats,
+            }
+        route = self.ROUTES.get(url.path)
+        if route is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {url.path}"}
+        name, parameter = route
+        value = parse_qs(url.query).get(parameter, [""])[0].strip()
+        if not value:
+            return (
+                HTTPStatus.BAD_REQUEST, {"error": f"Missing parameter: {parameter}"}
+            )
+
+        ok, result = await self.service.lookup(name, value)
+        if ok:
+            return HTTPStatus.OK, result
+        status = self.ERROR_STATUS.get(result["type"], HTTPStatus.BAD_GATEWAY)
+        return status, {"error": result}
+
+
+def ssl_lookup(host, cert_monitor):
+    """Certificate lookup for the API, raising LookupFailure on errors"""
+    from .tools.ssl_lookup import certificate_row, lookup_phases, ssl_pipeline
+
+    addresses = []
+    cert_info = ssl_pipeline.lookup(
+        host, lookup_phases(host, cert_monitor, ssl_pipeline, addresses)
+    )
+    return certificate_row(host, cert_info, addresses=addresses)
+
+
+def create_service(**kwargs):
+    """Create a LookupService with the NetViewer tools registered"""
+    from diagnostics.network import SSLCertMonitor
+    from .tools.dns_info import lookup_dns, lookup_ip
+
+    cert_monitor = SSLCertMonitor()
+    service = LookupService(**kwargs)
+    service.register("ssl", lambda host: ssl_lookup(host, cert_monitor))
+    service.register("dns", lookup_dns)
+    service.register("ip", lookup_ip)
+    return service
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, **kwargs):
+    """Run the API server until interrupted"""
+    service = create_service(**kwargs)
+    try:
+        asyncio.run(APIServer(service, host, port).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
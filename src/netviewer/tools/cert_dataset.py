@@ -0,0 +1,357 @@
+"""
+Offline certificate dataset analyzer
+
+Scans local certificate datasets without any network access. Files are
+memory-mapped and certificate boundaries are found directly in the mapping,
+so only one certificate at a time is ever copied out of the file. Supported
+inputs are:
+
+- PEM bundles (any number of concatenated certificates)
+- Concatenated DER certificates
+- NDJSON, one object per line: a base64 DER or PEM certificate, a CT log
+  get-entries entry (leaf_input and extra_data), or a row previously
+  exported by NetViewer
+
+Each certificate becomes a result row in the same shape as live lookups (see
+certificate_row), with an extra "issues" column listing what was found.
+"""
+import base64
+import binascii
+import json
+import mmap
+from datetime import datetime, timezone
+
+from cryptography import x509
+from cryptography.exceptions import UnsupportedAlgorithm
+from cryptography.hazmat.primitives.asymmetric import dsa, ec, rsa
+
+from .ssl_lookup import certificate_row
+
+# Certificates expiring within this many days are reported
+DEFAULT_EXPIRY_DAYS = 30
+
+# Smallest acceptable key sizes in bits
+MIN_RSA_KEY_SIZE = 2048
+MIN_EC_KEY_SIZE = 256
+
+# CA/Browser Forum limit for leaf certificates issued on or after 2020-09-01
+MAX_VALIDITY_DAYS = 398
+_VALIDITY_LIMIT_START = datetime(2020, 9, 1, tzinfo=timezone.utc)
+
+_WEAK_HASHES = ("md5", "sha1")
+
+_PEM_BEGIN = b"-----BEGIN CERTIFICATE-----"
+_PEM_END = b"-----END CERTIFICATE-----"
+
+# NDJSON keys that may hold a certificate (base64 DER or PEM text)
+_CERT_KEYS = ("pem", "cert", "certificate", "der", "leaf_cert")
+
+# RFC 6962 MerkleTreeLeaf: version, leaf type, timestamp and entry type
+# precede the entry itself
+_CT_LEAF_HEADER = 12
+_CT_X509_ENTRY = 0
+_CT_PRECERT_ENTRY = 1
+
+
+def _der_length(data, pos):
+    """Return the total length of the DER element starting at pos"""
+    if pos + 2 > len(data):
+        return None
+    first = data[pos + 1]
+    if first < 0x80:
+        return 2 + first
+    count = first & 0x7F
+    if count == 0 or count > 4 or pos + 2 + count > len(data):
+        return None
+    length = int.from_bytes(data[pos + 2:pos + 2 + count], "big")
+    return 2 + count + length
+
+
+def iter_pem(data):
+    """Yield each PEM certificate in a buffer"""
+    pos = 0
+    while True:
+        start = data.find(_PEM_BEGIN, pos)
+        if start < 0:
+            return
+        end = data.find(_PEM_END, start)
+        if end < 0:
+            return
+        pos = end + len(_PEM_END)
+        yield data[start:pos], x509.load_pem_x509_certificate
+
+
+def iter_der(data):
+    """Yield each certificate from concatenated DER certificates"""
+    pos = 0
+    while pos < len(data):
+        length = _der_length(data, pos)
+        if length is None or pos + length > len(data):
+            return
+        yield data[pos:pos + length], x509.load_der_x509_certificate
+        pos += length
+
+
+def _decode_json_certificate(value):
+    """Decode a PEM or base64 DER certificate value from a JSON object"""
+    if value.lstrip().startswith("-----BEGIN"):
+        return value.encode(), x509.load_pem_x509_certificate
+    return base64.b64decode(value), x509.load_der_x509_certificate
+
+
+def _ct_certificate(data, pos):
+    """Read a 3-byte length prefixed ASN.1Cert from CT log data"""
+    if pos + 3 > len(data):
+        raise ValueError("Truncated CT log entry")
+    length = int.from_bytes(data[pos:pos + 3], "big")
+    if pos + 3 + length > len(data):
+        raise ValueError("Truncated CT log entry")
+    return data[pos + 3:pos + 3 + length]
+
+
+def _decode_ct_entry(record):
+    """Decode the certificate from a CT log get-entries entry
+
+    X.509 entries carry the certificate in the MerkleTreeLeaf itself. For
+    precertificate entries the leaf only holds the TBSCertificate, so the
+    precertificate is read from the start of extra_data instead.
+    """
+    leaf = base64.b64decode(record["leaf_input"])
+    if len(leaf) < _CT_LEAF_HEADER:
+        raise ValueError("Truncated CT log entry")
+    entry_type = int.from_bytes(leaf[10:12], "big")
+    if entry_type == _CT_X509_ENTRY:
+        der = _ct_certificate(leaf, _CT_LEAF_HEADER)
+    elif entry_type == _CT_PRECERT_ENTRY:
+        der = _ct_certificate(base64.b64decode(record.get("extra_data") or ""), 0)
+    else:
+        raise ValueError(f"Unknown CT log entry type: {entry_type}")
+    return der, x509.load_der_x509_certificate
+
+
+def iter_ndjson(data):
+    """Yield certificates, or already analyzed rows, from NDJSON lines"""
+    pos = 0
+    size = len(data)
+    while pos < size:
+        end = data.find(b"\n", pos)
+        if end < 0:
+            end = size
+        line = data[pos:end].strip()
+        pos = end + 1
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield None, "Invalid JSON line"
+            continue
+        if not isinstance(record, dict):
+            yield None, "JSON line is not an object"
+            continue
+        if isinstance(record.get("leaf_input"), str):
+            try:
+                yield _decode_ct_entry(record)
+            except (binascii.Error, ValueError) as e:
+                yield None, f"Invalid CT log entry: {e}"
+            continue
+        value = next(
+            (record[key] for key in _CERT_KEYS if isinstance(record.get(key), str)),
+            None,
+        )
+        if value is None:
+            # An exported result row rather than a raw certificate
+            yield record, None
+            continue
+        try:
+            yield _decode_json_certificate(value)
+        except (binascii.Error, ValueError):
+            yield None, "Invalid certificate encoding"
+
+
+def _detect_reader(data):
+    """Pick a reader based on the first non-whitespace byte of a buffer"""
+    head = data[:64].lstrip()
+    if head.startswith(b"{"):
+        return iter_ndjson
+    if head.startswith(b"\x30"):
+        return iter_der
+    return iter_pem
+
+
+def _utc(cert, name):
+    """Read a validity date as an aware UTC datetime"""
+    value = getattr(cert, f"{name}_utc", None)
+    if value is None:
+        # cryptography < 42 only offers naive datetimes
+        value = getattr(cert, name).replace(tzinfo=timezone.utc)
+    return value
+
+
+def _domain(cert):
+    """Best guess of the domain a certificate was issued for"""
+    try:
+        names = cert.extensions.get_extension_for_class(
+            x509.SubjectAlternativeName
+        ).value.get_values_for_type(x509.DNSName)
+        if names:
+            return names[0]
+    except x509.ExtensionNotFound:
+        pass
+    common_names = cert.subject.get_attributes_for_oid(x509.NameOID.COMMON_NAME)
+    return common_names[0].value if common_names else None
+
+
+def _is_ca(cert):
+    try:
+        return cert.extensions.get_extension_for_class(
+            x509.BasicConstraints
+        ).value.ca
+    except x509.ExtensionNotFound:
+        return False
+
+
+def key_issues(cert):
+    """Report weak public keys and signature hashes"""
+    issues = []
+    key = cert.public_key()
+    if isinstance(key, rsa.RSAPublicKey) and key.key_size < MIN_RSA_KEY_SIZE:
+        issues.append(f"Weak RSA key ({key.key_size} bits)")
+    elif (isinstance(key, ec.EllipticCurvePublicKey)
+            and key.key_size < MIN_EC_KEY_SIZE):
+        issues.append(f"Weak EC key ({key.curve.name})")
+    elif isinstance(key, dsa.DSAPublicKey):
+        issues.append(f"DSA key ({key.key_size} bits)")
+    try:
+        algorithm = cert.signature_hash_algorithm
+        if algorithm is not None and algorithm.name in _WEAK_HASHES:
+            issues.append(f"Weak signature hash ({algorithm.name})")
+    except UnsupportedAlgorithm:
+        issues.append("Unsupported signature algorithm")
+    return issues
+
+
+def issuance_issues(cert, not_before, not_after):
+    """Report certificates that break common issuance rules"""
+    issues = []
+    if not_before >= not_after:
+        issues.append("Validity period ends before it starts")
+    serial = cert.serial_number
+    if serial <= 0:
+        issues.append("Non-positive serial number")
+    elif serial.bit_length() > 159:
+        issues.append("Serial number longer than 20 bytes")
+    if not _is_ca(cert):
+        validity_days = (not_after - not_before).days
+        if (not_before >= _VALIDITY_LIMIT_START
+                and validity_days > MAX_VALIDITY_DAYS):
+            issues.append(f"Validity period of {validity_days} days")
+        try:
+            cert.extensions.get_extension_for_class(x509.SubjectAlternativeName)
+        except x509.ExtensionNotFound:
+            issues.append("No subjectAltName")
+    return issues
+
+
+def expiry_issue(days_until_expiry, expiry_days):
+    """Report expired and soon to expire certificates"""
+    if days_until_expiry < 0:
+        return "Expired"
+    if days_until_expiry < expiry_days:
+        return f"Expires in {days_until_expiry} days"
+    return None
+
+
+def analyze_certificate(cert, now=None, expiry_days=DEFAULT_EXPIRY_DAYS):
+    """Analyze a parsed certificate, returning a result row"""
+    now = now or datetime.now(timezone.utc)
+    not_before = _utc(cert, "not_valid_before")
+    not_after = _utc(cert, "not_valid_after")
+    days_until_expiry = (not_after - now).days
+
+    issues = key_issues(cert) + issuance_issues(cert, not_before, not_after)
+    expiry = expiry_issue(days_until_expiry, expiry_days)
+    if expiry:
+        issues.insert(0, expiry)
+
+    cert_info = {
+        'subject': cert.subject.rfc4514_string(),
+        'issuer': cert.issuer.rfc4514_string(),
+        'not_before': not_before.isoformat(),
+        'not_after': not_after.isoformat(),
+        'days_until_expiry': days_until_expiry,
+        'version': cert.version.name,
+        'serial_number': cert.serial_number,
+    }
+    return certificate_row(
+        _domain(cert), cert_info, issues="; ".join(issues) or None
+    )
+
+
+def analyze_row(row, now=None, expiry_days=DEFAULT_EXPIRY_DAYS):
+    """Re-check the expiry of a previously exported result row"""
+    now = now or datetime.now(timezone.utc)
+    addresses = row.get("addresses") or []
+    if isinstance(addresses, str):
+        addresses = addresses.split(", ")
+    elif not isinstance(addresses, list):
+        addresses = [addresses]
+    result = certificate_row(
+        row.get("domain"), row,
+        error=row.get("error"), error_type=row.get("error_type"),
+        addresses=[str(a) for a in addresses if a],
+    )
+    try:
+        not_after = datetime.fromisoformat(row["not_after"].replace('Z', '+00:00'))
+        if not_after.tzinfo is None:
+            not_after = not_after.replace(tzinfo=timezone.utc)
+    except (KeyError, AttributeError, ValueError):
+        return result
+    result["days_until_expiry"] = (not_after - now).days
+    result["issues"] = expiry_issue(result["days_until_expiry"], expiry_days)
+    return result
+
+
+def analyze_buffer(data, source=None, now=None,
+                   expiry_days=DEFAULT_EXPIRY_DAYS):
+    """Analyze every certificate in a buffer, yielding result rows"""
+    now = now or datetime.now(timezone.utc)
+    for index, (item, loader) in enumerate(_detect_reader(data)(data)):
+        if isinstance(loader, str):
+            yield certificate_row(f"{source}#{index}", error=loader)
+            continue
+        # Malformed certificates can fail when parsed or only once a field
+        # is read (e.g. duplicate extensions), and exported rows can hold
+        # unexpected values; either way the entry is reported and the scan
+        # carries on
+        try:
+            if loader is None:
+                row = analyze_row(item, now, expiry_days)
+            else:
+                cert = loader(bytes(item))
+                row = analyze_certificate(cert, now, expiry_days)
+        except Exception as e:
+            row = certificate_row(
+                f"{source}#{index}", error=str(e) or type(e).__name__
+            )
+        yield row
+
+
+def analyze_file(path, now=None, expiry_days=DEFAULT_EXPIRY_DAYS):
+    """Memory-map a certificate dataset and yield a result row per certificate"""
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file
+        with data:
+            yield from analyze_buffer(data, str(path), now, expiry_days)
+
+
+def analyze_files(paths, expiry_days=DEFAULT_EXPIRY_DAYS, only_issues=False):
+    """Analyze several datasets, optionally yielding only rows with findings"""
+    now = datetime.now(timezone.utc)
+    for path in paths:
+        for row in analyze_file(path, now, expiry_days):
+            if not only_issues or row.get("issues") or row.get("error"):
+                yield row
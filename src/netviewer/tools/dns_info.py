@@ -0,0 +1,58 @@
+"""
+DNS and IP address lookups
+
+Plain standard library lookups run through the resilience pipeline, so they
+share its deadlines, retries and circuit breaker with the other tools.
+"""
+import ipaddress
+import socket
+
+from ..resilience import InvalidInput, LookupFailure, LookupPipeline, resolve
+
+# Shared so circuit breaker state carries over between lookups
+dns_pipeline = LookupPipeline()
+
+
+def lookup_dns(host, pipeline=None):
+    """Resolve a host name to its IPv4 and IPv6 addresses"""
+    pipeline = pipeline or dns_pipeline
+    infos = pipeline.lookup(host, [("resolve", lambda: resolve(host, None))])
+    addresses = []
+    for family, _, _, _, sockaddr in infos:
+        if sockaddr[0] not in addresses:
+            addresses.append(sockaddr[0])
+    return {
+        "host": host,
+        "ipv4": [a for a in addresses if ":" not in a],
+        "ipv6": [a for a in addresses if ":" in a],
+    }
+
+
+def lookup_ip(address, pipeline=None):
+    """Describe an IP address and look up its reverse DNS name"""
+    pipeline = pipeline or dns_pipeline
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        raise InvalidInput(address, "parse", "Not a valid IP address")
+
+    result = {
+        "address": str(ip),
+        "version": ip.version,
+        "private": ip.is_private,
+        "global": ip.is_global,
+        "hostname": None,
+        "aliases": [],
+    }
+    try:
+        hostname, aliases, _ = pipeline.lookup(
+            str(ip), [("reverse", lambda: socket.gethostbyaddr(str(ip)))]
+        )
+    except LookupFailure as e:
+        if e.kind != "dns":
+            raise
+        # No PTR record; the address itself is still described
+        return result
+    result["hostname"] = hostname
+    result["aliases"] = aliases
+    return result
@@ -9,14 +9,18 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLabel,
     QFrame,
-    QGridLayout,
+    QFileDialog,
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QThread, Signal
 from PySide6.QtGui import QFont, QPixmap, QImage
+from abc import abstractmethod
 from datetime import datetime, timedelta
+import logging
 import os
+import re
 import sys
 import tempfile
+import time
 import subprocess
 import requests
 from urllib.parse import urlparse
@@ -24,6 +28,117 @@ from icalendar import Calendar, Event
 
 from diagnostics.network import SSLCertMonitor
 
+from ..export import ExportError, export_rows
+from ..profiler import trace, traced
+from ..resilience import LookupFailure, LookupPipeline, RetryPolicy
+from ..results import (
+    Column,
+    FilterError,
+    ResultFilterProxyModel,
+    ResultTableModel,
+    ResultTableView,
+)
+from .ssl_lookup import lookup_row
+
+logger = logging.getLogger(__name__)
+
+FAVICON_SERVICE = "www.google.com"
+
+# Shared so circuit breaker state carries over between lookups
+favicon_pipeline = LookupPipeline(retry=RetryPolicy(attempts=1))
+
+
+def fetch_favicon(domain):
+    """Download a domain's favicon using Google's favicon service"""
+    url = f'https://{FAVICON_SERVICE}/s2/favicons?domain={domain}&sz=64'
+    response = requests.get(url, timeout=favicon_pipeline.timeout("favicon"))
+    if response.status_code == 200:
+        return response.content
+    return None
+
+
+# Most rows sent to the table at a time
+ROW_BATCH_SIZE = 2000
+
+# Pending rows are sent to the table at least this often, in seconds
+ROW_BATCH_INTERVAL = 0.1
+
+
+class ResultRowsThread(QThread):
+    """Produce result rows off the GUI thread, streaming them in batches
+    
+    Rows are emitted as Python objects rather than converted to QVariant,
+    which would truncate large integers such as certificate serial numbers.
+    """
+    rows_ready = Signal(object)
+    failed = Signal(str)
+    
+    def __init__(self, parent=None):
+        # ABCMeta has no effect alongside QThread's metaclass, so the
+        # abstract method is checked here instead
+        if getattr(type(self).iter_rows, "__isabstractmethod__", False):
+            raise TypeError(
+                f"Can't instantiate abstract class {type(self).__name__}"
+            )
+        super().__init__(parent)
+        
+    @abstractmethod
+    def iter_rows(self):
+        """Yield result rows; runs on the worker thread"""
+        
+    def run(self):
+        batch = []
+        flushed = time.monotonic()
+        try:
+            for row in self.iter_rows():
+                if self.isInterruptionRequested():
+                    return
+                batch.append(row)
+                if (len(batch) >= ROW_BATCH_SIZE
+                        or time.monotonic() - flushed >= ROW_BATCH_INTERVAL):
+                    self.rows_ready.emit(batch)
+                    batch = []
+                    flushed = time.monotonic()
+        except Exception as e:
+            # Report the failure and still hand over the rows found so far
+            logger.exception("Result rows failed")
+            self.failed.emit(str(e) or type(e).__name__)
+        if batch:
+            self.rows_ready.emit(batch)
+            
+    def stop(self):
+        """Interrupt the thread and wait for it to finish"""
+        self.requestInterruption()
+        self.wait()
+
+
+class CertificateLookupThread(ResultRowsThread):
+    """Look up certificates off the GUI thread"""
+    
+    def __init__(self, domains, cert_monitor, parent=None):
+        super().__init__(parent)
+        self.domains = domains
+        self.cert_monitor = cert_monitor
+        
+    def iter_rows(self):
+        for domain in self.domains:
+            with trace("ssl.lookup_host"):
+                row = lookup_row(domain, self.cert_monitor)
+            yield row
+
+
+class DatasetAnalysisThread(ResultRowsThread):
+    """Analyze offline certificate datasets off the GUI thread"""
+    
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+        
+    def iter_rows(self):
+        # Imported here so cryptography is only needed for offline analysis
+        from .cert_dataset import analyze_files
+        return analyze_files(self.paths)
+
 
 class SSLCertWidget(QWidget):
     """Widget for SSL certificate lookup"""
@@ -33,28 +148,33 @@ class SSLCertWidget(QWidget):
         self.cert_monitor = SSLCertMonitor()
         self.setup_ui()
         
+    @traced("ssl.get_favicon")
     def get_favicon(self, domain):
         """Get favicon for the domain using Google's favicon service"""
         try:
-            # Use Google's favicon service
-            url = f'https://www.google.com/s2/favicons?domain={domain}&sz=64'
-            response = requests.get(url, timeout=2)
-            if response.status_code == 200:
-                # Convert response content to QPixmap
-                image = QImage()
-                image.loadFromData(response.content)
-                if not image.isNull():
-                    pixmap = QPixmap.fromImage(image)
-                    
-                    # Scale to 32x32 while maintaining aspect ratio
-                    return pixmap.scaled(
-                        QSize(32, 32),
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
+            content = favicon_pipeline.lookup(
+                FAVICON_SERVICE, [("favicon", lambda: fetch_favicon(domain))]
+            )
+        except LookupFailure as e:
+            # The favicon is cosmetic, so the failure is logged, not shown
+            logger.info("Favicon lookup failed for %s: %s", domain, e.to_dict())
             return None
-        except Exception:
+        if not content:
             return None
+            
+        # Convert response content to QPixmap
+        image = QImage()
+        image.loadFromData(content)
+        if image.isNull():
+            return None
+        pixmap = QPixmap.fromImage(image)
+        
+        # Scale to 32x32 while maintaining aspect ratio
+        return pixmap.scaled(
+            QSize(32, 32),
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
         
     def update_favicon(self, domain):
         """Update the favicon display"""
@@ -199,13 +319,27 @@ class SSLCertWidget(QWidget):
             QPushButton:pressed {
                 background-color: #005ba1;
             }
+            QPushButton:disabled {
+                background-color: #80bbe9;
+            }
         """)
         self.search_button.clicked.connect(self.lookup_certificate)
+        self.lookup_thread = None
         
         search_layout.addWidget(self.favicon_label)
         search_layout.addWidget(self.domain_input)
         search_layout.addWidget(self.search_button)
         
+        # Offline dataset button
+        self.dataset_button = QPushButton("Open Dataset...")
+        self.dataset_button.setToolTip(
+            "Analyze local PEM, DER or NDJSON certificate files offline"
+        )
+        self.dataset_button.setStyleSheet(self.search_button.styleSheet())
+        self.dataset_button.clicked.connect(self.analyze_dataset)
+        search_layout.addWidget(self.dataset_button)
+        self.dataset_thread = None
+        
         # Results section
         self.results_frame = QFrame()
         self.results_frame.setStyleSheet("""
@@ -220,6 +354,115 @@ class SSLCertWidget(QWidget):
         self.results_layout.setContentsMargins(16, 16, 16, 16)
         self.results_layout.setSpacing(16)
         
+        # Filter row
+        filter_layout = QHBoxLayout()
+        filter_layout.setSpacing(12)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText(
+            "Filter (e.g., days_until_expiry < 30 and issuer ~ Let's Encrypt)"
+        )
+        self.filter_input.textChanged.connect(self.apply_filter)
+        self.filter_input.setStyleSheet("""
+            QLineEdit {
+                padding: 6px 10px;
+                border: 1px solid #e0e0e0;
+                border-radius: 4px;
+                background-color: white;
+                font-size: 14px;
+                color: #333333;
+            }
+            QLineEdit:focus {
+                border-color: #0078d4;
+            }
+        """)
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 14px;
+                border: none;
+            }
+        """)
+        self.clear_button = QPushButton("Clear")
+        self.clear_button.setStyleSheet("""
+            QPushButton {
+                background-color: #f5f5f5;
+                color: #333333;
+                border: 1px solid #e0e0e0;
+                border-radius: 4px;
+                padding: 6px 12px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+        """)
+        self.clear_button.clicked.connect(self.clear_results)
+        self.export_button = QPushButton("Export...")
+        self.export_button.setStyleSheet(self.clear_button.styleSheet())
+        self.export_button.clicked.connect(self.export_results)
+        filter_layout.addWidget(self.filter_input, 1)
+        filter_layout.addWidget(self.count_label)
+        filter_layout.addWidget(self.export_button)
+        filter_layout.addWidget(self.clear_button)
+        
+        # Error message for filter and lookup failures
+        self.error_label = QLabel()
+        self.error_label.setWordWrap(True)
+        self.error_label.setStyleSheet("""
+            QLabel {
+                color: #d13438;
+                font-size: 14px;
+                border: none;
+            }
+        """)
+        self.error_label.hide()
+        
+        # Results table
+        self.results_model = ResultTableModel(self.columns(), self)
+        self.results_proxy = ResultFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_view = ResultTableView()
+        self.results_view.setModel(self.results_proxy)
+        self.results_view.selectionModel().selectionChanged.connect(
+            self.update_calendar_button
+        )
+        self.results_proxy.rowsInserted.connect(self.update_count)
+        self.results_proxy.rowsRemoved.connect(self.update_count)
+        self.results_proxy.modelReset.connect(self.update_count)
+        self.results_proxy.layoutChanged.connect(self.update_count)
+        self.update_count()
+        
+        # Calendar button
+        self.calendar_button = QPushButton("Add Renewal Reminder")
+        self.calendar_button.setStyleSheet("""
+            QPushButton {
+                background-color: #28a745;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 6px 12px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #218838;
+            }
+            QPushButton:pressed {
+                background-color: #1e7e34;
+            }
+            QPushButton:disabled {
+                background-color: #a8d5b3;
+            }
+        """)
+        self.calendar_button.setEnabled(False)
+        self.calendar_button.clicked.connect(self.add_selected_reminder)
+        
+        self.results_layout.addLayout(filter_layout)
+        self.results_layout.addWidget(self.error_label)
+        self.results_layout.addWidget(self.results_view, 1)
+        self.results_layout.addWidget(self.calendar_button, 0, Qt.AlignLeft)
+        
         # Add widgets to main layout
         layout.addWidget(search_frame)
         layout.addWidget(self.results_frame, 1)  # Add stretch factor of 1 to make it expand
@@ -227,121 +470,186 @@ class SSLCertWidget(QWidget):
         # Initially hide results
         self.results_frame.hide()
         
+    def columns(self):
+        """Columns shown in the results table"""
+        return [
+            Column("domain", "Domain"),
+            Column("addresses", "Addresses"),
+            Column("subject", "Subject"),
+            Column("issuer", "Issuer"),
+            Column("not_before", "Valid From", formatter=self.format_date),
+            Column("not_after", "Valid Until", formatter=self.format_date),
+            Column("days_until_expiry", "Days Until Expiry", numeric=True),
+            Column("version", "Version"),
+            Column("serial_number", "Serial Number"),
+            Column("issues", "Issues"),
+            Column("error", "Error"),
+            Column("error_type", "Error Type"),
+        ]
+        
     def clear_results(self):
-        """Clear all results from the results frame"""
-        # Remove all widgets from the layout
-        while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                # If it's a layout, remove all its widgets
-                while item.layout().count():
-                    subitem = item.layout().takeAt(0)
-                    if subitem.widget():
-                        subitem.widget().deleteLater()
-                item.layout().deleteLater()
+        """Clear all results from the results table"""
+        for thread in (self.lookup_thread, self.dataset_thread):
+            if thread is not None and not thread.isInterruptionRequested():
+                # Stop streaming rows into the cleared table
+                thread.requestInterruption()
+                thread.rows_ready.disconnect(self.results_model.append_rows)
+        self.results_model.clear()
+        self.error_label.hide()
+        self.calendar_button.setEnabled(False)
         
-    def lookup_certificate(self):
-        """Lookup SSL certificate for the given domain"""
-        domain = self.domain_input.text().strip()
-        if not domain:
-            return
+    def update_count(self, *args):
+        """Update the shown/total row count"""
+        shown = self.results_proxy.rowCount()
+        total = self.results_model.rowCount()
+        if shown == total:
+            self.count_label.setText(f"{total} results")
+        else:
+            self.count_label.setText(f"{shown} of {total} results")
             
+    @traced("results.filter")
+    def apply_filter(self, expression):
+        """Filter the results table by a column expression or free text"""
         try:
-            # Clear previous results first
-            self.clear_results()
-            
-            # Update favicon when searching
-            self.update_favicon(domain)
-            
-            # Get SSL info from certificate monitor
-            cert_info = self.cert_monitor.check_certificate(domain)
-            if not cert_info:
-                raise Exception("Failed to retrieve certificate information")
-            
-            # Create grid for certificate info
-            grid = QGridLayout()
-            grid.setSpacing(12)
-            
-            # Add certificate information
-            info = [
-                ("Subject", cert_info.get('subject', 'Unknown')),
-                ("Issuer", cert_info.get('issuer', 'Unknown')),
-                ("Valid From", self.format_date(cert_info.get('not_before', 'Unknown'))),
-                ("Valid Until", self.format_date(cert_info.get('not_after', 'Unknown'))),
-                ("Days Until Expiry", str(cert_info.get('days_until_expiry', 'Unknown'))),
-                ("Version", cert_info.get('version', 'Unknown')),
-                ("Serial Number", str(cert_info.get('serial_number', 'Unknown'))),
-            ]
-            
-            for i, (label, value) in enumerate(info):
-                # Label
-                label_widget = QLabel(label)
-                label_widget.setStyleSheet("""
-                    QLabel {
-                        color: #666666;
-                        font-size: 14px;
-                    }
-                """)
-                
-                # Value
-                value_widget = QLabel(value)
-                value_widget.setWordWrap(True)
-                value_widget.setStyleSheet("""
-                    QLabel {
-                        color: #333333;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                """)
-                
-                grid.addWidget(label_widget, i, 0)
-                grid.addWidget(value_widget, i, 1)
+            self.results_proxy.set_filter_expression(expression)
+            self.error_label.hide()
+        except FilterError as e:
+            self.error_label.setText(f"Filter error: {str(e)}")
+            self.error_label.show()
+        self.update_count()
+        
+    def visible_rows(self):
+        """Iterate over the rows currently shown, in display order"""
+        for proxy_row in range(self.results_proxy.rowCount()):
+            source = self.results_proxy.mapToSource(
+                self.results_proxy.index(proxy_row, 0)
+            )
+            yield self.results_model.row_dict(source.row())
             
-            self.results_layout.addLayout(grid)
+    @traced("results.export")
+    def export_results(self):
+        """Export the rows currently shown to CSV, NDJSON or Parquet"""
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Results",
+            "ssl_certificates.csv",
+            "CSV (*.csv);;NDJSON (*.ndjson *.jsonl);;Parquet (*.parquet)",
+        )
+        if not path:
+            return
+        try:
+            export_rows(
+                self.visible_rows(),
+                path,
+                columns=[column.key for column in self.results_model.columns],
+            )
+            self.error_label.hide()
+        except (ExportError, OSError) as e:
+            self.error_label.setText(f"Export error: {str(e)}")
+            self.error_label.show()
             
-            # Add calendar button
-            try:
-                expiry_date = datetime.fromisoformat(
-                    cert_info.get('not_after', '').replace('Z', '+00:00')
-                )
-                calendar_button = QPushButton("Add Renewal Reminder")
-                calendar_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #28a745;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 6px 12px;
-                        font-size: 14px;
-                        font-weight: bold;
-                        margin-top: 8px;
-                    }
-                    QPushButton:hover {
-                        background-color: #218838;
-                    }
-                    QPushButton:pressed {
-                        background-color: #1e7e34;
-                    }
-                """)
-                calendar_button.clicked.connect(
-                    lambda: self.create_calendar_event(domain, expiry_date)
-                )
-                self.results_layout.addWidget(calendar_button)
-            except (ValueError, TypeError):
-                pass  # Skip calendar button if date parsing fails
+    def selected_row(self):
+        """Return the currently selected result row, if any"""
+        indexes = self.results_view.selectionModel().selectedRows()
+        if not indexes:
+            return None
+        source = self.results_proxy.mapToSource(indexes[0])
+        return self.results_model.row_dict(source.row())
+        
+    def selected_expiry(self):
+        """Return (domain, expiry date) for the selected row, if available"""
+        row = self.selected_row()
+        if not row or not row.get('not_after'):
+            return None
+        try:
+            expiry_date = datetime.fromisoformat(
+                row['not_after'].replace('Z', '+00:00')
+            )
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return row['domain'], expiry_date
+        
+    def update_calendar_button(self, *args):
+        """Enable the calendar button when a row with an expiry is selected"""
+        self.calendar_button.setEnabled(self.selected_expiry() is not None)
+        
+    def add_selected_reminder(self):
+        """Create a renewal reminder for the selected certificate"""
+        selected = self.selected_expiry()
+        if selected:
+            self.create_calendar_event(*selected)
+        
+    def analyze_dataset(self):
+        """Analyze local certificate datasets and show the results"""
+        paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Open Certificate Dataset",
+            "",
+            "Certificate datasets (*.pem *.crt *.cer *.der *.ndjson *.jsonl *.json);;"
+            "All files (*)",
+        )
+        if not paths:
+            return
             
-            self.results_frame.show()
+        self.error_label.hide()
+        self.results_frame.show()
+        self.update_favicon(None)
+        
+        # A new scan replaces one that is still running
+        if self.dataset_thread is not None:
+            self.dataset_thread.finished.disconnect(self.dataset_finished)
+            self.dataset_thread.stop()
+            self.dataset_thread.deleteLater()
+        self.dataset_thread = DatasetAnalysisThread(paths, self)
+        self.dataset_thread.rows_ready.connect(self.results_model.append_rows)
+        self.dataset_thread.failed.connect(self.show_dataset_error)
+        self.dataset_thread.finished.connect(self.dataset_finished)
+        self.dataset_thread.start()
+        
+    def show_dataset_error(self, message):
+        """Show an error raised while analyzing a dataset"""
+        self.error_label.setText(f"Dataset error: {message}")
+        self.error_label.show()
+        
+    def dataset_finished(self):
+        """Clean up after a dataset analysis completes"""
+        self.dataset_thread.deleteLater()
+        self.dataset_thread = None
+        
+    @traced("ssl.start_lookup")
+    def lookup_certificate(self):
+        """Lookup SSL certificates for the given domains
+        
+        Several domains can be entered separated by commas or whitespace.
+        Lookups run on a worker thread and results are appended to the table
+        in batches as they arrive.
+        """
+        if self.lookup_thread is not None:
+            return
+        domains = [d for d in re.split(r"[\s,;]+", self.domain_input.text()) if d]
+        if not domains:
+            return
             
-        except Exception as e:
-            # Show error message
-            error_label = QLabel(f"Error: {str(e)}")
-            error_label.setStyleSheet("""
-                QLabel {
-                    color: #d13438;
-                    font-size: 14px;
-                }
-            """)
-            self.results_layout.addWidget(error_label)
-            self.results_frame.show() 
\ No newline at end of file
+        self.error_label.hide()
+        self.results_frame.show()
+        
+        # Update favicon when searching a single domain
+        self.update_favicon(domains[0] if len(domains) == 1 else None)
+        
+        self.search_button.setEnabled(False)
+        self.lookup_thread = CertificateLookupThread(domains, self.cert_monitor, self)
+        self.lookup_thread.rows_ready.connect(self.results_model.append_rows)
+        self.lookup_thread.finished.connect(self.lookup_finished)
+        self.lookup_thread.start()
+        
+    def lookup_finished(self):
+        """Clean up after a lookup completes"""
+        self.search_button.setEnabled(True)
+        self.lookup_thread.deleteLater()
+        self.lookup_thread = None
+        
+    def shutdown(self):
+        """Stop any running worker threads; called when the window closes"""
+        for thread in (self.lookup_thread, self.dataset_thread):
+            if thread is not None:
+                thread.stop()
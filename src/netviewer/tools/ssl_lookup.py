@@ -0,0 +1,117 @@
+"""
+SSL certificate lookups without a GUI
+
+The lookup pipeline and result rows shared by the SSL certificate widget, the
+``export-ssl`` command and the API server. Nothing here depends on Qt.
+"""
+import inspect
+
+from ..resilience import (
+    LookupFailure,
+    LookupPipeline,
+    probe_port,
+    resolve,
+    split_host_port,
+)
+
+HTTPS_PORT = 443
+
+# Shared so circuit breaker state carries over between lookups
+ssl_pipeline = LookupPipeline()
+
+
+def certificate_row(domain, cert_info=None, error=None, issues=None,
+                    error_type=None, addresses=None):
+    """Convert certificate information into a flat result row"""
+    cert_info = cert_info or {}
+    return {
+        "domain": domain,
+        "addresses": ", ".join(addresses) if addresses else None,
+        "subject": cert_info.get('subject'),
+        "issuer": cert_info.get('issuer'),
+        "not_before": cert_info.get('not_before'),
+        "not_after": cert_info.get('not_after'),
+        "days_until_expiry": cert_info.get('days_until_expiry'),
+        "version": cert_info.get('version'),
+        "serial_number": cert_info.get('serial_number'),
+        "issues": issues,
+        "error": error,
+        "error_type": error_type,
+    }
+
+
+def _accepts_timeout(func):
+    """Whether func can be passed a timeout keyword argument"""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.name == "timeout" or p.kind is inspect.Parameter.VAR_KEYWORD
+        for p in parameters
+    )
+
+
+def lookup_phases(domain, cert_monitor, pipeline, addresses=None):
+    """Lookup phases for a domain: resolve, connect, then read the certificate
+
+    If an addresses list is given, the resolved IP addresses are added to it.
+    """
+    host, port = split_host_port(domain, HTTPS_PORT)
+
+    def resolve_host():
+        infos = resolve(host, port)
+        if addresses is not None and not addresses:
+            for *_, sockaddr in infos:
+                if sockaddr[0] not in addresses:
+                    addresses.append(sockaddr[0])
+        return infos
+
+    def check_certificate():
+        # Pass the deadline on so an overrunning check doesn't hold its
+        # worker thread long after the phase has timed out
+        if _accepts_timeout(cert_monitor.check_certificate):
+            cert_info = cert_monitor.check_certificate(
+                domain, timeout=pipeline.timeout("certificate")
+            )
+        else:
+            cert_info = cert_monitor.check_certificate(domain)
+        if not cert_info:
+            raise LookupFailure(
+                domain, "certificate", "No certificate information returned"
+            )
+        return cert_info
+
+    return [
+        ("resolve", resolve_host),
+        ("connect", lambda: probe_port(host, port, pipeline.timeout("connect"))),
+        ("certificate", check_certificate),
+    ]
+
+
+def lookup_row(domain, cert_monitor, pipeline=None):
+    """Look up one domain, returning a result row (with any error in it)"""
+    pipeline = pipeline or ssl_pipeline
+    addresses = []
+    try:
+        cert_info = pipeline.lookup(
+            domain, lookup_phases(domain, cert_monitor, pipeline, addresses)
+        )
+    except LookupFailure as e:
+        return certificate_row(
+            domain, error=str(e), error_type=e.kind, addresses=addresses
+        )
+    return certificate_row(domain, cert_info, addresses=addresses)
+
+
+def iter_certificate_rows(domains, cert_monitor=None, pipeline=None):
+    """Look up each domain in turn, yielding one result row per domain
+
+    Dead or unresponsive hosts fail fast in the resolve/connect phases, and
+    hosts that keep failing are skipped by the pipeline's circuit breaker.
+    """
+    if cert_monitor is None:
+        from diagnostics.network import SSLCertMonitor
+        cert_monitor = SSLCertMonitor()
+    for domain in domains:
+        yield lookup_row(domain, cert_monitor, pipeline)
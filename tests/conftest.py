@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+# Qt widgets and models are tested without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """A QApplication shared by every test that needs one"""
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
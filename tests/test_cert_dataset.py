@@ -0,0 +1,183 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.x509.oid import NameOID
+
+from netviewer.tools.cert_dataset import (
+    analyze_buffer,
+    analyze_file,
+    analyze_files,
+    iter_der,
+    iter_pem,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+EC_KEY = ec.generate_private_key(ec.SECP256R1())
+
+
+def make_cert(domain="example.com", days=90, key=EC_KEY, serial=2 ** 150,
+              start=NOW - timedelta(days=1), alt_names=True):
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, domain)])
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(serial)
+        .not_valid_before(start)
+        .not_valid_after(start + timedelta(days=days))
+        .add_extension(
+            x509.SubjectKeyIdentifier.from_public_key(key.public_key()), False
+        )
+    )
+    if alt_names:
+        builder = builder.add_extension(
+            x509.SubjectAlternativeName([x509.DNSName(domain)]), False
+        )
+    return builder.sign(key, hashes.SHA256())
+
+
+def der(cert):
+    return cert.public_bytes(serialization.Encoding.DER)
+
+
+def pem(cert):
+    return cert.public_bytes(serialization.Encoding.PEM)
+
+
+def duplicate_extension_der():
+    """A certificate whose subjectKeyIdentifier OID is rewritten to repeat the
+    subjectAltName extension, which parses but fails on reading extensions"""
+    data = der(make_cert("dup.example"))
+    ski = bytes.fromhex("0603551d0e")
+    assert data.count(ski) == 1
+    return data.replace(ski, bytes.fromhex("0603551d11"))
+
+
+def ct_leaf(entry_type, body):
+    header = bytes([0, 0]) + (1_700_000_000_000).to_bytes(8, "big")
+    return header + entry_type.to_bytes(2, "big") + body
+
+
+def asn1_cert(data):
+    return len(data).to_bytes(3, "big") + data
+
+
+def b64(data):
+    return base64.b64encode(data).decode()
+
+
+def analyze(data):
+    return list(analyze_buffer(data, "test", NOW, expiry_days=30))
+
+
+def test_iter_pem_and_der_split_concatenated_certificates():
+    certs = [make_cert("a.example"), make_cert("b.example")]
+    assert len(list(iter_pem(b"junk\n" + b"".join(pem(c) for c in certs)))) == 2
+    assert len(list(iter_der(b"".join(der(c) for c in certs)))) == 2
+
+
+def test_good_certificate_has_no_issues():
+    (row,) = analyze(pem(make_cert()))
+    assert row["domain"] == "example.com"
+    assert row["issues"] is None
+    assert row["error"] is None
+    assert row["serial_number"] == 2 ** 150
+
+
+def test_reports_expiry_and_issuance_issues():
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+    cert = make_cert(days=10, key=rsa_key, alt_names=False)
+    (row,) = analyze(der(cert))
+    issues = row["issues"].split("; ")
+    assert issues[0].startswith("Expires in")
+    assert "Weak RSA key (1024 bits)" in issues
+    assert "No subjectAltName" in issues
+
+    (row,) = analyze(der(make_cert(days=500)))
+    assert "Validity period of 500 days" in row["issues"]
+    (row,) = analyze(der(make_cert(start=NOW - timedelta(days=100), days=50)))
+    assert row["issues"] == "Expired"
+
+
+def test_malformed_certificate_does_not_stop_the_scan():
+    data = der(make_cert("a.example")) + duplicate_extension_der()
+    data += der(make_cert("b.example"))
+    rows = analyze(data)
+    assert [row["error"] is None for row in rows] == [True, False, True]
+    assert rows[1]["domain"] == "test#1"
+    assert rows[2]["domain"] == "b.example"
+
+
+def test_ndjson_certificates_and_rows():
+    lines = [
+        {"pem": pem(make_cert("a.example")).decode()},
+        {"der": b64(der(make_cert("b.example")))},
+        {"domain": "c.example", "not_after": "2025-01-11T00:00:00Z"},
+        {"cert": "not base64!"},
+    ]
+    data = "\n".join(json.dumps(line) for line in lines).encode() + b"\nnot json\n"
+    rows = analyze(data)
+    assert [row["domain"] for row in rows[:3]] == [
+        "a.example", "b.example", "c.example",
+    ]
+    assert rows[2]["issues"] == "Expires in 10 days"
+    assert rows[3]["error"] == "Invalid certificate encoding"
+    assert rows[4]["error"] == "Invalid JSON line"
+
+
+def test_unexpected_ndjson_values_do_not_stop_the_scan():
+    lines = [
+        {"a": 1},
+        [1, 2],
+        {"domain": "a.example", "addresses": ["192.0.2.1", "192.0.2.2"]},
+        {"domain": "b.example", "addresses": 7, "not_after": 5},
+        "text",
+    ]
+    data = "\n".join(json.dumps(line) for line in lines).encode()
+    rows = analyze(data)
+    assert len(rows) == 5
+    assert rows[1]["error"] == "JSON line is not an object"
+    assert rows[2]["addresses"] == "192.0.2.1, 192.0.2.2"
+    assert rows[3]["addresses"] == "7"
+    assert rows[4]["error"] == "JSON line is not an object"
+
+
+def test_ct_log_entries():
+    x509_entry = {"leaf_input": b64(
+        ct_leaf(0, asn1_cert(der(make_cert("leaf.example"))) + b"\0\0")
+    ), "extra_data": b64(asn1_cert(b""))}
+    precert_entry = {
+        "leaf_input": b64(ct_leaf(1, bytes(32) + asn1_cert(b"tbs") + b"\0\0")),
+        "extra_data": b64(asn1_cert(der(make_cert("pre.example")))),
+    }
+    truncated = {"leaf_input": b64(ct_leaf(0, b"\x00\x10\x00abc"))}
+    data = "\n".join(
+        json.dumps(entry) for entry in (x509_entry, precert_entry, truncated)
+    ).encode()
+    rows = analyze(data)
+    assert [row["domain"] for row in rows[:2]] == ["leaf.example", "pre.example"]
+    assert rows[2]["error"].startswith("Invalid CT log entry")
+
+
+def test_analyze_files(tmp_path):
+    good = tmp_path / "good.pem"
+    # Issued before the 398 day limit and valid until well after today
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    good.write_bytes(pem(make_cert(start=start, days=365 * 50)))
+    bad = tmp_path / "dup.der"
+    bad.write_bytes(duplicate_extension_der())
+    empty = tmp_path / "empty.pem"
+    empty.write_bytes(b"")
+    assert list(analyze_file(empty)) == []
+    rows = list(analyze_files([good, bad, empty], only_issues=True))
+    assert len(rows) == 1
+    assert rows[0]["error"]
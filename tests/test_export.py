@@ -0,0 +1,124 @@
+import csv
+import json
+from datetime import datetime
+
+import pytest
+
+from netviewer.__main__ import cli
+from netviewer.export import (
+    ExportError,
+    ResultWriter,
+    export_rows,
+    format_from_path,
+    iter_chunks,
+)
+from netviewer.tools import ssl_lookup
+
+ROWS = [
+    {"domain": "a.example", "days": 10, "when": datetime(2030, 1, 2, 3, 4, 5)},
+    {"domain": "b.example", "days": None, "extra": "ignored"},
+]
+
+
+def test_iter_chunks():
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_chunks([], 2)) == []
+
+
+def test_format_from_path():
+    assert format_from_path("out.CSV") == "csv"
+    assert format_from_path("out.jsonl") == "ndjson"
+    assert format_from_path("out.pq") == "parquet"
+    with pytest.raises(ExportError):
+        format_from_path("out.txt")
+
+
+def test_csv_export(tmp_path):
+    path = tmp_path / "out.csv"
+    count = export_rows(iter(ROWS), path, columns=["domain", "days"], chunk_size=1)
+    assert count == 2
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {"domain": "a.example", "days": "10"},
+        {"domain": "b.example", "days": ""},
+    ]
+
+
+def test_ndjson_export_columns_from_first_row(tmp_path):
+    path = tmp_path / "out.ndjson"
+    assert export_rows(ROWS, path) == 2
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0] == {
+        "domain": "a.example", "days": 10, "when": "2030-01-02T03:04:05",
+    }
+    assert lines[1] == {"domain": "b.example", "days": None, "when": None}
+
+
+def test_empty_export_writes_header(tmp_path):
+    path = tmp_path / "out.csv"
+    assert export_rows([], path, columns=["domain"]) == 0
+    assert path.read_text().strip() == "domain"
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ExportError):
+        export_rows(ROWS, tmp_path / "out.csv", fmt="xml")
+
+
+def test_parquet_requires_pyarrow(tmp_path):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ExportError):
+            export_rows(ROWS, tmp_path / "out.parquet")
+    else:
+        import pyarrow.parquet as pq
+        assert export_rows(ROWS, tmp_path / "out.parquet", chunk_size=1) == 2
+        table = pq.read_table(tmp_path / "out.parquet")
+        assert table.column("domain").to_pylist() == ["a.example", "b.example"]
+
+
+def test_parquet_uses_fixed_types_for_known_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [
+        {"domain": "a.example", "serial_number": 2 ** 158 + 1,
+         "days_until_expiry": None, "version": None, "score": 1.5},
+        {"domain": "b.example", "serial_number": 7,
+         "days_until_expiry": 30, "version": 3, "score": 2.0},
+    ]
+    export_rows(rows, tmp_path / "out.parquet", chunk_size=1)
+    schema = pq.read_schema(tmp_path / "out.parquet")
+    assert str(schema.field("serial_number").type) == "string"
+    assert str(schema.field("days_until_expiry").type) == "int64"
+    assert str(schema.field("version").type) == "string"
+    assert str(schema.field("score").type) == "double"
+
+
+def test_failed_export_keeps_existing_file(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_text("previous")
+
+    def rows():
+        yield {"domain": "a.example"}
+        raise RuntimeError("lookup crashed")
+
+    with pytest.raises(RuntimeError):
+        export_rows(rows(), path, chunk_size=1)
+    assert path.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+    assert export_rows(ROWS, path) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+
+def test_writers_must_implement_write_chunk(tmp_path):
+    with pytest.raises(TypeError):
+        ResultWriter(tmp_path / "out.csv", ["domain"])
+
+
+def test_cli_reports_unwritable_output(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(ssl_lookup, "iter_certificate_rows", lambda domains: [])
+    output = tmp_path / "missing" / "out.csv"
+    assert cli(["export-ssl", "-o", str(output)]) == 1
+    assert "ERROR" in capsys.readouterr().err
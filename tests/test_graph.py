@@ -0,0 +1,68 @@
+import numpy as np
+
+from netviewer.graph import (
+    ASN,
+    HOST,
+    IP,
+    ISSUER,
+    ForceLayout,
+    NetworkGraph,
+    issuer_name,
+)
+
+
+def test_issuer_name():
+    assert issuer_name("CN=R3,O=Let's Encrypt,C=US") == "Let's Encrypt"
+    assert issuer_name("CN=Example Root") == "Example Root"
+    assert issuer_name("C=US") == "C=US"
+
+
+def test_rows_become_nodes_and_edges():
+    graph = NetworkGraph()
+    graph.add_rows([
+        {"domain": "a.example", "addresses": "192.0.2.1, 2001:db8::1",
+         "issuer": "CN=R3,O=Let's Encrypt", "asn": 64500},
+        {"domain": "b.example", "addresses": "192.0.2.1",
+         "issuer": "O=Let's Encrypt"},
+        {"domain": None},
+    ])
+    nodes = set(zip(graph.kinds, graph.labels))
+    assert nodes == {
+        (HOST, "a.example"), (HOST, "b.example"), (IP, "192.0.2.1"),
+        (IP, "2001:db8::1"), (ASN, "64500"), (ISSUER, "Let's Encrypt"),
+    }
+    # Shared address and issuer nodes are reused, and edges are not repeated
+    assert len(graph.edges) == len(set(graph.edges)) == 7
+
+
+def test_take_changes_is_incremental():
+    graph = NetworkGraph()
+    graph.add_row({"domain": "a.example", "addresses": "192.0.2.1"})
+    anchors, edges = graph.take_changes()
+    assert anchors == [-1, 0]
+    assert edges == [(0, 1)]
+    graph.add_row({"domain": "a.example", "addresses": "192.0.2.1"})
+    assert graph.take_changes() == ([], [])
+
+
+def test_layout_settles_and_separates_nodes():
+    layout = ForceLayout(seed=0)
+    layout.add_nodes([-1] * 50)
+    layout.add_edges([(i, i + 1) for i in range(49)])
+    steps = 0
+    while layout.step(10):
+        steps += 1
+        assert steps < 100
+    assert layout.settled
+    positions = layout.positions
+    assert np.isfinite(positions).all()
+    distance = np.sqrt(((positions[:, None] - positions[None]) ** 2).sum(axis=2))
+    assert distance[np.triu_indices(50, 1)].min() > 1
+
+
+def test_new_nodes_start_near_their_anchor():
+    layout = ForceLayout(seed=0)
+    layout.add_nodes([-1])
+    layout.add_nodes([0, 1])
+    gaps = np.sqrt((np.diff(layout.positions, axis=0) ** 2).sum(axis=1))
+    assert np.allclose(gaps, layout.ideal_length)
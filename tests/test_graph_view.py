@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from netviewer.graph import NetworkGraph
+from netviewer.graph_view import GraphWidget, lines_path, points_polygon
+
+
+def test_points_polygon(qapp):
+    points = np.array([[1.5, -2.0], [3.0, 4.25]])
+    polygon = points_polygon(points)
+    assert [(p.x(), p.y()) for p in polygon] == [(1.5, -2.0), (3.0, 4.25)]
+    assert points_polygon(np.zeros((0, 2))).isEmpty()
+
+
+def test_lines_path(qapp):
+    path = lines_path(np.array([[0.0, 0.0], [5.0, 5.0]]),
+                      np.array([[1.0, 2.0], [6.0, 7.0]]))
+    elements = [path.elementAt(i) for i in range(path.elementCount())]
+    assert [(e.type.value, e.x, e.y) for e in elements] == [
+        (0, 0.0, 0.0), (1, 1.0, 2.0), (0, 5.0, 5.0), (1, 6.0, 7.0),
+    ]
+
+
+@pytest.fixture
+def widget(qapp):
+    widget = GraphWidget()
+    yield widget
+    widget.shutdown()
+    widget.deleteLater()
+    qapp.processEvents()
+
+
+def test_position_updates_are_coalesced(widget, qapp):
+    widget.graph.add_rows(
+        {"domain": f"h{i}.example", "addresses": f"192.0.2.{i}"} for i in range(3)
+    )
+    shown = []
+    widget.item.set_positions = shown.append
+    for offset in range(5):
+        widget.update_positions(np.full((6, 2), float(offset)))
+    assert shown == []
+    widget.show_positions()
+    assert len(shown) == 1
+    assert shown[0][0, 0] == 4.0
+
+
+def test_stale_positions_after_clear_are_ignored(widget):
+    widget.graph = NetworkGraph()
+    widget.update_positions(np.zeros((3, 2)))
+    widget.show_positions()
+    assert len(widget.item.positions) == 0
@@ -0,0 +1,67 @@
+import json
+import time
+
+import pytest
+from PySide6.QtCore import QEventLoop, QTimer
+
+from netviewer.profiler import Profiler, active_profiler, trace, traced
+
+
+def block_event_loop():
+    time.sleep(0.4)
+
+
+def run_event_loop(ms, during=None):
+    loop = QEventLoop()
+    if during is not None:
+        QTimer.singleShot(ms // 4, during)
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_records_stalls_and_traces(qapp, tmp_path):
+    profiler = Profiler(tmp_path, sample_interval=0.002)
+
+    @traced("test.traced")
+    def work():
+        pass
+
+    profiler.start()
+    assert active_profiler() is profiler
+    with trace("test.section"):
+        pass
+    work()
+    work()
+    run_event_loop(800, block_event_loop)
+    assert profiler.stop() == tmp_path
+    assert active_profiler() is None
+
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["traces"]["test.section"]["count"] == 1
+    assert summary["traces"]["test.traced"]["count"] == 2
+    (stall,) = [s for s in summary["stalls"] if s["duration_ms"] >= 300]
+    assert any(frame.startswith("block_event_loop ") for frame in stall["stack"])
+    assert (tmp_path / "samples.folded").read_text()
+    assert (tmp_path / "cprofile.prof").exists()
+
+
+def test_trace_is_free_when_inactive():
+    with trace("test.inactive"):
+        pass
+    assert active_profiler() is None
+
+
+def test_unwritable_profile_is_reported(qapp, tmp_path):
+    pytest.importorskip("diagnostics")
+    from netviewer.app import MainWindow
+
+    output = tmp_path / "profile"
+    output.write_text("a file, not a directory")
+    window = MainWindow(output)
+    window.profile_action.setChecked(True)
+    window.profile_action.setChecked(False)
+    assert not window.profiler.is_active
+    assert window.statusBar().currentMessage().startswith("Could not write profile")
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
@@ -0,0 +1,170 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from netviewer import resilience
+from netviewer.resilience import (
+    CircuitBreaker,
+    CircuitOpen,
+    ConnectionFailure,
+    LookupBusy,
+    LookupFailure,
+    LookupPipeline,
+    LookupTimeout,
+    ResolutionFailure,
+    RetryPolicy,
+    split_host_port,
+)
+
+
+@pytest.mark.parametrize("address, expected", [
+    ("example.com", ("example.com", 443)),
+    ("example.com:8443", ("example.com", 8443)),
+    ("192.0.2.1:80", ("192.0.2.1", 80)),
+    ("::1", ("::1", 443)),
+    ("2001:db8::1", ("2001:db8::1", 443)),
+    ("[2001:db8::1]", ("2001:db8::1", 443)),
+    ("[2001:db8::1]:8443", ("2001:db8::1", 8443)),
+    ("example.com:https", ("example.com:https", 443)),
+])
+def test_split_host_port(address, expected):
+    assert split_host_port(address, 443) == expected
+
+
+def test_retry_delay_is_bounded():
+    policy = RetryPolicy(base_delay=0.5, max_delay=1.0)
+    assert all(0 <= policy.delay(attempt) <= 1.0 for attempt in range(10))
+
+
+def pipeline(**kwargs):
+    return LookupPipeline(
+        retry=RetryPolicy(attempts=3, base_delay=0, max_delay=0),
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        **kwargs,
+    )
+
+
+class Flaky:
+    """Raises the given errors in turn, then returns 'ok'"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def test_transient_failures_are_retried():
+    func = Flaky(ConnectionResetError(), socket.timeout())
+    assert pipeline().run_phase("host", "certificate", func) == "ok"
+    assert func.calls == 3
+
+
+def test_retries_are_bounded():
+    func = Flaky(*[ConnectionRefusedError("refused")] * 5)
+    with pytest.raises(ConnectionFailure) as info:
+        pipeline().run_phase("host", "connect", func)
+    assert info.value.attempts == 3
+    assert info.value.to_dict()["type"] == "connection"
+
+
+def test_connect_timeouts_are_not_retried():
+    func = Flaky(socket.timeout(), socket.timeout())
+    with pytest.raises(LookupTimeout) as info:
+        pipeline().run_phase("host", "connect", func)
+    assert func.calls == 1
+    assert info.value.attempts == 1
+
+
+def test_deadline_is_enforced():
+    lookups = pipeline(timeouts={"certificate": 0.05})
+    start = time.monotonic()
+    with pytest.raises(LookupTimeout):
+        lookups.run_phase("host", "certificate", lambda: time.sleep(0.5))
+    assert time.monotonic() - start < 0.45
+
+
+@pytest.fixture
+def one_worker(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(resilience, "_executor", executor)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_deadline_starts_when_the_call_starts(one_worker):
+    one_worker.submit(time.sleep, 0.2)
+    lookups = pipeline(timeouts={"certificate": 0.3})
+    assert lookups.run_phase("host", "certificate", lambda: time.sleep(0.2)) is None
+
+
+def test_saturated_workers_do_not_count_against_the_host(one_worker):
+    release = threading.Event()
+    one_worker.submit(release.wait)
+    lookups = pipeline(timeouts={"certificate": 0.05})
+    calls = []
+    try:
+        for _ in range(3):
+            with pytest.raises(LookupBusy):
+                lookups.lookup("host", [("certificate", lambda: calls.append(1))])
+    finally:
+        release.set()
+    assert lookups.breaker.state("host") == CircuitBreaker.CLOSED
+    one_worker.shutdown(wait=True)
+    # Calls cancelled while queued never run
+    assert calls == []
+
+
+def test_permanent_failures_are_not_retried():
+    func = Flaky(socket.gaierror("no such host"))
+    with pytest.raises(ResolutionFailure):
+        pipeline().run_phase("host", "resolve", func)
+    func = Flaky(RuntimeError("bad certificate"))
+    with pytest.raises(LookupFailure) as info:
+        pipeline().run_phase("host", "certificate", func)
+    assert info.value.kind == "failed"
+    assert func.calls == 1
+
+
+def test_circuit_opens_after_repeated_failures():
+    lookups = pipeline()
+
+    def refused():
+        raise ConnectionRefusedError()
+
+    for _ in range(2):
+        with pytest.raises(ConnectionFailure):
+            lookups.lookup("dead", [("connect", refused)])
+    assert lookups.breaker.state("dead") == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpen):
+        lookups.lookup("dead", [("connect", refused)])
+    assert lookups.lookup("alive", [("connect", lambda: "ok")]) == "ok"
+
+
+def test_answering_hosts_do_not_trip_the_circuit():
+    lookups = pipeline()
+
+    def no_certificate():
+        raise LookupFailure("host", "certificate", "no certificate")
+
+    for _ in range(3):
+        with pytest.raises(LookupFailure):
+            lookups.lookup("host", [("certificate", no_certificate)])
+    assert lookups.breaker.state("host") == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_one_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure("host")
+    assert breaker.state("host") == CircuitBreaker.HALF_OPEN
+    assert breaker.allow("host")
+    assert not breaker.allow("host")
+    breaker.record_success("host")
+    assert breaker.state("host") == CircuitBreaker.CLOSED
@@ -0,0 +1,151 @@
+import time
+
+import pytest
+
+from PySide6.QtCore import QPersistentModelIndex, Qt
+
+from netviewer.results import (
+    Column,
+    FilterError,
+    ResultFilterProxyModel,
+    ResultTableModel,
+)
+
+
+@pytest.fixture
+def models(qapp):
+    model = ResultTableModel([
+        Column("name", "Name"),
+        Column("n", "N", numeric=True),
+    ])
+    proxy = ResultFilterProxyModel()
+    proxy.setSourceModel(model)
+    return model, proxy
+
+
+def shown(proxy):
+    return sorted(
+        proxy.data(proxy.index(row, 0)) for row in range(proxy.rowCount())
+    )
+
+
+def test_append_and_row_dict(models):
+    model, _ = models
+    model.append_rows([{"name": "a", "n": 1}, {"name": "b"}])
+    assert model.rowCount() == 2
+    assert model.row_dict(1) == {"name": "b", "n": None}
+    assert list(model.rows())[0] == {"name": "a", "n": 1}
+
+
+def test_numeric_filter(models):
+    model, proxy = models
+    model.append_rows([{"name": "a", "n": 10}, {"name": "b", "n": 40}])
+    proxy.set_filter_expression("n < 30")
+    assert shown(proxy) == ["a"]
+
+
+def test_combined_and_text_filters(models):
+    model, proxy = models
+    model.append_rows([
+        {"name": "alpha", "n": 10},
+        {"name": "beta", "n": 20},
+        {"name": "alphabet", "n": 40},
+    ])
+    proxy.set_filter_expression("name ~ alpha and n >= 10")
+    assert shown(proxy) == ["alpha", "alphabet"]
+    proxy.set_filter_expression("bet")
+    assert shown(proxy) == ["alphabet", "beta"]
+    proxy.set_filter_expression("")
+    assert proxy.rowCount() == 3
+
+
+def test_rows_appended_after_filter_are_filtered(models):
+    model, proxy = models
+    model.append_rows([{"name": "a", "n": 10}])
+    proxy.set_filter_expression("n < 30")
+    model.append_rows([{"name": "b", "n": 50}, {"name": "c", "n": 5}])
+    assert shown(proxy) == ["a", "c"]
+
+
+def test_invalid_filters(models):
+    _, proxy = models
+    with pytest.raises(FilterError):
+        proxy.set_filter_expression("missing < 3")
+    with pytest.raises(FilterError):
+        proxy.set_filter_expression("n < soon")
+
+
+def test_clear_with_active_filter(models):
+    model, proxy = models
+    model.append_rows([{"name": "a", "n": 10}, {"name": "b", "n": 50}])
+    proxy.set_filter_expression("n < 30")
+    model.clear()
+    assert proxy.rowCount() == 0
+
+    model.append_rows([
+        {"name": "x", "n": 100},
+        {"name": "y", "n": 1},
+        {"name": "z", "n": 2},
+    ])
+    assert shown(proxy) == ["y", "z"]
+
+
+def test_sorts_numerically_with_missing_last(models):
+    model, proxy = models
+    model.append_rows([
+        {"name": "a", "n": 9}, {"name": "b"}, {"name": "c", "n": 10},
+    ])
+    proxy.sort(1)
+    order = [proxy.data(proxy.index(row, 0)) for row in range(3)]
+    assert order == ["a", "c", "b"]
+
+
+def column(proxy, col=0):
+    return [proxy.data(proxy.index(row, col)) for row in range(proxy.rowCount())]
+
+
+def test_sorted_view_merges_appended_rows(models):
+    model, proxy = models
+    model.append_rows([{"name": "a", "n": 30}, {"name": "b", "n": 10}])
+    proxy.sort(1, Qt.DescendingOrder)
+    proxy.set_filter_expression("n < 100")
+    model.append_rows([
+        {"name": "c", "n": 20}, {"name": "d", "n": 500}, {"name": "e", "n": 40},
+    ])
+    assert column(proxy) == ["e", "a", "c", "b"]
+    source = proxy.mapToSource(proxy.index(0, 0))
+    assert source.row() == 4
+    assert proxy.mapFromSource(source).row() == 0
+    assert not proxy.mapFromSource(model.index(3, 0)).isValid()
+
+    proxy.sort(-1)
+    assert column(proxy) == ["a", "b", "c", "e"]
+
+
+def test_sort_keeps_persistent_indexes(models):
+    model, proxy = models
+    model.append_rows([{"name": "a", "n": 2}, {"name": "b", "n": 1}])
+    selected = proxy.index(0, 0)
+    persistent = QPersistentModelIndex(selected)
+    proxy.sort(1)
+    assert persistent.row() == 1
+    assert persistent.data() == "a"
+
+
+def test_large_model_sorts_and_filters_quickly(models):
+    model, proxy = models
+    count = 100_000
+    model.append_rows(
+        {"name": f"host{i:06d}", "n": (i * 7919) % count} for i in range(count)
+    )
+
+    started = time.perf_counter()
+    proxy.sort(1)
+    proxy.set_filter_expression("n < 50000")
+    model.append_rows([{"name": "late", "n": -1}])
+    proxy.sort(0, Qt.DescendingOrder)
+    elapsed = time.perf_counter() - started
+
+    assert proxy.rowCount() == count // 2 + 1
+    assert column(proxy)[0] == "late"
+    assert elapsed < 5
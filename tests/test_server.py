@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from netviewer import resilience
+from netviewer.resilience import InvalidInput, LookupBusy, LookupTimeout
+from netviewer.server import APIServer, LookupService, ResultCache
+
+
+def test_cache_expires_and_evicts():
+    cache = ResultCache(max_size=2)
+    cache.put("a", 1, ttl=60)
+    cache.put("b", 2, ttl=0)
+    time.sleep(0.01)
+    assert cache.get("b") is None
+    cache.put("c", 3, ttl=60)
+    cache.put("d", 4, ttl=60)
+    assert cache.get("a") is None
+    assert (cache.get("c"), cache.get("d")) == (3, 4)
+
+
+@pytest.fixture
+def service():
+    service = LookupService(cache_ttl=60, error_ttl=60, workers=4)
+    yield service
+    service.close()
+
+
+def test_concurrent_lookups_are_coalesced(service):
+    calls = []
+    release = threading.Event()
+
+    def slow(host):
+        calls.append(host)
+        release.wait(5)
+        return {"host": host}
+
+    service.register("slow", slow)
+
+    async def run():
+        tasks = [
+            asyncio.ensure_future(service.lookup("slow", "Example.com"))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        cached = await service.lookup("slow", "example.com")
+        return results, cached
+
+    results, cached = asyncio.run(run())
+    assert calls == ["Example.com"]
+    assert all(result == (True, {"host": "Example.com"}) for result in results)
+    assert cached == results[0]
+    assert service.stats["coalesced"] == 9
+    assert service.stats["cache_hits"] == 1
+
+
+async def request(server, target, method="GET"):
+    """Send one request to an APIServer, returning (status, JSON body)"""
+    listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"{method} {target} HTTP/1.1\r\nConnection: close\r\n\r\n".encode()
+        )
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.fixture
+def server(service):
+    def ssl(host):
+        if host == "slow.example":
+            raise LookupTimeout(host, "connect", "timed out")
+        if host == "bad":
+            raise InvalidInput(host, "parse", "not a host")
+        if host == "buggy.example":
+            raise KeyError("subject")
+        return {"domain": host}
+
+    service.register("ssl", ssl)
+    return APIServer(service)
+
+
+@pytest.mark.parametrize("target, status", [
+    ("/ssl?host=example.com", 200),
+    ("/ssl?host=slow.example", 504),
+    ("/ssl?host=bad", 400),
+    ("/ssl?host=buggy.example", 500),
+    ("/ssl", 400),
+    ("/nowhere", 404),
+    ("/health", 200),
+])
+def test_api_status_codes(server, target, status):
+    assert asyncio.run(request(server, target))[0] == status
+
+
+def test_api_bodies(server):
+    _, body = asyncio.run(request(server, "/ssl?host=example.com"))
+    assert body == {"domain": "example.com"}
+    status, body = asyncio.run(request(server, "/ssl?host=buggy.example"))
+    assert body["error"]["type"] == "internal"
+    assert asyncio.run(request(server, "/ssl?host=x", "POST"))[0] == 405
+
+
+def test_internal_errors_are_not_cached(server):
+    asyncio.run(request(server, "/ssl?host=buggy.example"))
+    asyncio.run(request(server, "/ssl?host=slow.example"))
+    assert len(server.service.cache) == 1
+
+
+def test_busy_failures_are_not_cached(service):
+    def busy(host):
+        raise LookupBusy(host, "certificate", "no worker free")
+
+    service.register("busy", busy)
+    ok, value = asyncio.run(service.lookup("busy", "example.com"))
+    assert not ok and value["type"] == "busy"
+    assert len(service.cache) == 0
+    assert APIServer.ERROR_STATUS["busy"] == 503
+
+
+def test_service_grows_the_deadline_pool():
+    service = LookupService(workers=resilience.MAX_WORKERS + 8)
+    service.close()
+    assert resilience._executor_workers == resilience.MAX_WORKERS + 8
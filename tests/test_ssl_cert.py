@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("diagnostics")
+pytest.importorskip("cryptography")
+
+from netviewer.tools.ssl_cert import (
+    DatasetAnalysisThread,
+    ResultRowsThread,
+    SSLCertWidget,
+)
+
+from test_cert_dataset import der, make_cert
+
+
+def run_thread(qapp, thread):
+    rows = []
+    thread.rows_ready.connect(rows.extend)
+    thread.start()
+    assert thread.wait(10000)
+    qapp.processEvents()
+    return rows
+
+
+def test_dataset_rows_keep_large_serial_numbers(qapp, tmp_path):
+    path = tmp_path / "certs.der"
+    path.write_bytes(der(make_cert(serial=2 ** 158 + 1)))
+    (row,) = run_thread(qapp, DatasetAnalysisThread([str(path)]))
+    assert row["serial_number"] == 2 ** 158 + 1
+
+
+def test_shutdown_stops_a_running_scan(qapp, tmp_path):
+    path = tmp_path / "certs.der"
+    path.write_bytes(der(make_cert()) * 20000)
+    widget = SSLCertWidget()
+    widget.dataset_thread = DatasetAnalysisThread([str(path)], widget)
+    widget.dataset_thread.start()
+    widget.shutdown()
+    assert widget.dataset_thread.isFinished()
+
+
+def test_result_threads_must_implement_iter_rows(qapp):
+    with pytest.raises(TypeError):
+        ResultRowsThread()
+
+
+class FailingThread(ResultRowsThread):
+    def iter_rows(self):
+        yield {"domain": "a.example"}
+        raise RuntimeError("reader crashed")
+
+
+def test_failing_thread_reports_error_and_keeps_rows(qapp):
+    thread = FailingThread()
+    errors = []
+    thread.failed.connect(errors.append)
+    assert run_thread(qapp, thread) == [{"domain": "a.example"}]
+    assert errors == ["reader crashed"]
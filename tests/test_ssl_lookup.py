@@ -0,0 +1,81 @@
+import subprocess
+import sys
+
+from netviewer.resilience import CircuitBreaker, LookupPipeline, RetryPolicy
+from netviewer.tools import ssl_lookup
+from netviewer.tools.ssl_lookup import certificate_row, iter_certificate_rows
+
+
+class FakeMonitor:
+    def __init__(self, results):
+        self.results = results
+
+    def check_certificate(self, domain):
+        result = self.results[domain]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def pipeline():
+    return LookupPipeline(retry=RetryPolicy(attempts=1), breaker=CircuitBreaker())
+
+
+def fake_resolve(host, port):
+    return [(2, 1, 6, "", ("192.0.2.1", port)), (2, 1, 6, "", ("192.0.2.1", port))]
+
+
+def test_certificate_row_flattens_info():
+    row = certificate_row(
+        "example.com", {"issuer": "O=CA", "days_until_expiry": 5},
+        addresses=["192.0.2.1", "2001:db8::1"],
+    )
+    assert row["issuer"] == "O=CA"
+    assert row["days_until_expiry"] == 5
+    assert row["addresses"] == "192.0.2.1, 2001:db8::1"
+    assert row["error"] is None
+
+
+def test_rows_carry_results_and_typed_errors(monkeypatch):
+    monkeypatch.setattr(ssl_lookup, "resolve", fake_resolve)
+    monkeypatch.setattr(ssl_lookup, "probe_port", lambda host, port, timeout: None)
+    monitor = FakeMonitor({
+        "good.example": {"subject": "CN=good.example"},
+        "empty.example": None,
+        "refused.example": ConnectionRefusedError("refused"),
+    })
+    rows = list(iter_certificate_rows(
+        ["good.example", "empty.example", "refused.example"], monitor, pipeline()
+    ))
+    assert rows[0]["subject"] == "CN=good.example"
+    assert rows[0]["addresses"] == "192.0.2.1"
+    assert rows[1]["error_type"] == "failed"
+    assert rows[2]["error_type"] == "connection"
+    assert "refused" in rows[2]["error"]
+
+
+class TimeoutMonitor:
+    def __init__(self):
+        self.timeouts = []
+
+    def check_certificate(self, domain, timeout=None):
+        self.timeouts.append(timeout)
+        return {"subject": f"CN={domain}"}
+
+
+def test_certificate_deadline_is_passed_on(monkeypatch):
+    monkeypatch.setattr(ssl_lookup, "resolve", fake_resolve)
+    monkeypatch.setattr(ssl_lookup, "probe_port", lambda host, port, timeout: None)
+    monitor = TimeoutMonitor()
+    lookups = LookupPipeline(timeouts={"certificate": 4}, breaker=CircuitBreaker())
+    row = ssl_lookup.lookup_row("example.com", monitor, lookups)
+    assert row["subject"] == "CN=example.com"
+    assert monitor.timeouts == [4]
+
+
+def test_importing_does_not_load_qt():
+    code = (
+        "import sys, netviewer.tools.ssl_lookup, netviewer.export;"
+        "assert not [m for m in sys.modules if m.startswith('PySide6')]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd="src")